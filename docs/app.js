@@ -9,6 +9,10 @@ let data = null;
 let allPacks = [];
 let allMCPServers = [];
 let allCommunityMCPServers = [];
+/** packName -> Promise of the full pack entry (sharded builds load details on demand). */
+const packDetailRequests = new Map();
+/** Prebuilt inverted index from search-index.json (null until loaded or when missing). */
+let searchIndex = null;
 const JS_STYLE_TOKENS = {
     errorColor: 'var(--primary)',
     mutedTextColor: 'var(--text-muted)',
@@ -42,15 +46,62 @@ function updateToolbarCounters(packs, mcpServers, communityMCPServers) {
     document.querySelector('#mcp-badge .counter-number').textContent = mcpServers.length + communityMCPServers.length;
 }
 
+/**
+ * Base URL of generated data files (collection pages live under docs/collections/)
+ */
+function siteDataBase() {
+    return window.location.pathname.includes('/collections/') ? '../' : '';
+}
+
+/**
+ * Load site data: the sharded index (data/index.json, written by
+ * build_website.py --sharded) when present, otherwise the monolithic data.json.
+ * Sharded pack entries only carry card fields until loadPackDetails() runs.
+ */
+async function loadSiteData() {
+    const base = siteDataBase();
+    try {
+        const response = await fetch(`${base}data/index.json`);
+        if (response.ok) {
+            return await response.json();
+        }
+    } catch (error) {
+        // Not a sharded build; fall back to data.json
+    }
+    const response = await fetch(`${base}data.json`);
+    return response.json();
+}
+
+/**
+ * Full entry for a pack, fetching its shard once when the index only has the card.
+ * Resolves to null for unknown packs.
+ */
+function loadPackDetails(packName) {
+    const card = allPacks.find(p => p.name === packName);
+    if (!card) return Promise.resolve(null);
+    if (!card.shard) return Promise.resolve(card);
+    if (!packDetailRequests.has(packName)) {
+        const url = `${siteDataBase()}${card.shard.url}?v=${encodeURIComponent(card.shard.hash)}`;
+        const request = fetch(url)
+            .then(response => {
+                if (!response.ok) throw new Error(`HTTP ${response.status} for ${url}`);
+                return response.json();
+            })
+            .catch(error => {
+                packDetailRequests.delete(packName);
+                throw error;
+            });
+        packDetailRequests.set(packName, request);
+    }
+    return packDetailRequests.get(packName);
+}
+
 /**
  * Initialize the application
  */
 async function init() {
     try {
-        // Load data.json (collection pages live under docs/collections/)
-        const dataUrl = window.location.pathname.includes('/collections/') ? '../data.json' : 'data.json';
-        const response = await fetch(dataUrl);
-        data = await response.json();
+        data = await loadSiteData();
 
         // Store original data for search
         allPacks = data.packs;
@@ -75,7 +126,8 @@ async function init() {
         renderMCPServers(allMCPServers);
         renderCommunityMCPServers(allCommunityMCPServers);
 
-        // Setup search
+        // Setup search (index loads in the background; substring search until then)
+        loadSearchIndex();
         document.getElementById('searchInput').addEventListener('input', handleSearch);
 
         // Setup install banner copy button
@@ -634,6 +686,102 @@ function createMCPCard(server) {
     return div;
 }
 
+/**
+ * Load search-index.json (written by build_website.py). Search falls back to
+ * substring matching over loaded data while it is missing.
+ */
+async function loadSearchIndex() {
+    try {
+        const response = await fetch(`${siteDataBase()}search-index.json`);
+        if (response.ok) {
+            searchIndex = await response.json();
+        }
+    } catch (error) {
+        console.warn('Search index unavailable, using substring search:', error);
+    }
+}
+
+/**
+ * Lowercase letter/digit runs of any length, as tokenized by scripts/site_search_index.py
+ */
+function searchTokens(text) {
+    return String(text).toLowerCase().match(/[\p{L}\p{N}]+/gu) || [];
+}
+
+/**
+ * Index of the first token >= prefix in the sorted token list
+ */
+function lowerBoundToken(tokens, prefix) {
+    let lo = 0;
+    let hi = tokens.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (tokens[mid] < prefix) lo = mid + 1;
+        else hi = mid;
+    }
+    return lo;
+}
+
+/**
+ * Packs and MCP servers matching every query term (each term prefix-matched).
+ * Skill hits count for their pack. Returns null when the index cannot answer.
+ */
+function searchIndexMatches(query) {
+    if (!searchIndex) return null;
+    const terms = searchTokens(query);
+    if (terms.length === 0) return null;
+    const { docs, tokens, postings } = searchIndex;
+    let packs = null;
+    let servers = null;
+    for (const term of terms) {
+        const termPacks = new Set();
+        const termServers = new Set();
+        for (let i = lowerBoundToken(tokens, term); i < tokens.length && tokens[i].startsWith(term); i++) {
+            for (const docId of postings[i]) {
+                const [kind, name, pack] = docs[docId];
+                if (kind === 'p') termPacks.add(name);
+                else if (kind === 's') termPacks.add(pack);
+                else if (kind === 'm') termServers.add(`${pack}/${name}`);
+            }
+        }
+        packs = packs ? new Set([...packs].filter(p => termPacks.has(p))) : termPacks;
+        servers = servers ? new Set([...servers].filter(s => termServers.has(s))) : termServers;
+    }
+    return { packs, servers };
+}
+
+/**
+ * Lowercased text a pack is matched against when there is no search index
+ */
+function packSearchText(pack) {
+    // Search in pack name, title, description, skills, agents
+    let catalogSearch = '';
+    if (pack.collection) {
+        const co = pack.collection;
+        const skills = (co.contents && co.contents.skills) || [];
+        const orch = (co.contents && co.contents.orchestration_skills) || [];
+        catalogSearch = [
+            co.name,
+            co.summary,
+            co.description,
+            co.contents && co.contents.description,
+            ...(co.categories || []),
+            ...(co.personas || []),
+            ...skills.map(s => `${s.name} ${s.description || ''} ${s.summary_markdown || ''}`),
+            ...orch.map(s => `${s.name} ${s.description || ''} ${s.summary_markdown || ''}`)
+        ].filter(Boolean).join(' ');
+    }
+    return [
+        pack.name,
+        pack.plugin.name,
+        pack.plugin.title,
+        pack.plugin.description,
+        catalogSearch,
+        ...pack.skills.map(s => s.name + ' ' + s.description),
+        ...pack.agents.map(a => a.name + ' ' + a.description)
+    ].join(' ').toLowerCase();
+}
+
 /**
  * Handle search input
  */
@@ -654,40 +802,17 @@ function handleSearch(event) {
         return;
     }
 
-    // Filter packs
-    const filteredPacks = allPacks.filter(pack => {
-        // Search in pack name, title, description, skills, agents
-        let catalogSearch = '';
-        if (pack.collection) {
-            const co = pack.collection;
-            const skills = (co.contents && co.contents.skills) || [];
-            const orch = (co.contents && co.contents.orchestration_skills) || [];
-            catalogSearch = [
-                co.name,
-                co.summary,
-                co.description,
-                co.contents && co.contents.description,
-                ...(co.categories || []),
-                ...(co.personas || []),
-                ...skills.map(s => `${s.name} ${s.description || ''} ${s.summary_markdown || ''}`),
-                ...orch.map(s => `${s.name} ${s.description || ''} ${s.summary_markdown || ''}`)
-            ].filter(Boolean).join(' ');
-        }
-        const searchText = [
-            pack.name,
-            pack.plugin.name,
-            pack.plugin.title,
-            pack.plugin.description,
-            catalogSearch,
-            ...pack.skills.map(s => s.name + ' ' + s.description),
-            ...pack.agents.map(a => a.name + ' ' + a.description)
-        ].join(' ').toLowerCase();
+    const indexed = searchIndexMatches(query);
 
-        return searchText.includes(query);
-    });
+    // Filter packs
+    const filteredPacks = indexed
+        ? allPacks.filter(pack => indexed.packs.has(pack.name))
+        : allPacks.filter(pack => packSearchText(pack).includes(query));
 
     // Helper function to filter MCP servers
     const filterMCPServers = (servers) => servers.filter(server => {
+        if (indexed) return indexed.servers.has(`${server.pack}/${server.name}`);
+
         // Search in server name, title, owner, pack, command/URL, env vars
         const searchFields = [
             server.name,
@@ -743,8 +868,15 @@ function toggleInstallCallout() {
 /**
  * Show pack details modal (XSS-safe)
  */
-function showPackDetails(packName) {
-    const pack = data.packs.find(p => p.name === packName);
+async function showPackDetails(packName) {
+    let pack;
+    try {
+        pack = await loadPackDetails(packName);
+    } catch (error) {
+        console.error('Failed to load pack details:', error);
+        showError('Failed to load collection details. Please try refreshing the page.');
+        return;
+    }
     if (!pack) return;
 
     const modal = document.getElementById('pack-modal');
@@ -1707,8 +1839,17 @@ function hideCollectionView() {
     }
 }
 
-function showCollectionView(packName) {
-    const pack = allPacks.find(p => p.name === packName);
+async function showCollectionView(packName) {
+    let pack;
+    try {
+        pack = await loadPackDetails(packName);
+    } catch (error) {
+        console.error('Failed to load collection details:', error);
+        showError('Failed to load collection details. Please try refreshing the page.');
+        return;
+    }
+    // Navigation may have moved on while the shard was loading
+    if (hashCollectionName() !== packName) return;
     const page = document.getElementById('collection-page');
     const packs = document.getElementById('packs-section');
     const mcp = document.getElementById('mcp-section');
@@ -1754,12 +1895,19 @@ function showCollectionView(packName) {
     window.scrollTo(0, 0);
 }
 
-function applyHashRoute() {
-    if (!data) return;
+/**
+ * Pack name of a #collection/<name> route, or null
+ */
+function hashCollectionName() {
     const raw = (window.location.hash || '').replace(/^#/, '');
     const m = raw.match(/^collection\/([^/]+)\/?$/);
-    if (m) {
-        const packName = decodeURIComponent(m[1]);
+    return m ? decodeURIComponent(m[1]) : null;
+}
+
+function applyHashRoute() {
+    if (!data) return;
+    const packName = hashCollectionName();
+    if (packName !== null) {
         showCollectionView(packName);
     } else {
         hideCollectionView();
@@ -5,13 +5,17 @@ import argparse
 import json
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 
+import request_scheduler
+
 MITRE_API = "https://cveawg.mitre.org/api/cve/{cve_id}"
 OSV_API = "https://api.osv.dev/v1/vulns/{cve_id}"
 GO_VULN_DB = "https://vuln.go.dev/ID/{go_id}.json"
 TIMEOUT = 15
+MAX_WORKERS = 8
 
 
 def fetch_mitre(cve_id):
@@ -19,7 +23,7 @@ def fetch_mitre(cve_id):
     description = ""
     errors = []
     try:
-        resp = requests.get(MITRE_API.format(cve_id=cve_id), timeout=TIMEOUT)
+        resp = request_scheduler.get(MITRE_API.format(cve_id=cve_id), timeout=TIMEOUT)
         if resp.status_code == 404:
             errors.append(f"MITRE: CVE {cve_id} not found (404)")
             return affected, description, errors
@@ -86,7 +90,7 @@ def fetch_osv(cve_id):
     errors = []
     go_ids = []
     try:
-        resp = requests.get(OSV_API.format(cve_id=cve_id), timeout=TIMEOUT)
+        resp = request_scheduler.get(OSV_API.format(cve_id=cve_id), timeout=TIMEOUT)
         if resp.status_code == 404:
             errors.append(f"OSV: CVE {cve_id} not found (404)")
             return affected, aliases, go_ids, errors
@@ -138,7 +142,7 @@ def fetch_go_vuln(go_id):
     affected = []
     errors = []
     try:
-        resp = requests.get(GO_VULN_DB.format(go_id=go_id), timeout=TIMEOUT)
+        resp = request_scheduler.get(GO_VULN_DB.format(go_id=go_id), timeout=TIMEOUT)
         if resp.status_code != 200:
             errors.append(f"Go vuln DB: HTTP {resp.status_code} for {go_id}")
             return affected, errors
@@ -212,18 +216,22 @@ def main():
     all_affected = []
     all_errors = []
 
-    mitre_affected, description, mitre_errors = fetch_mitre(cve_id)
-    all_affected.extend(mitre_affected)
-    all_errors.extend(mitre_errors)
+    # Sources are independent; request_scheduler keeps each host within its limits.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        mitre_future = pool.submit(fetch_mitre, cve_id)
+        osv_future = pool.submit(fetch_osv, cve_id)
+
+        mitre_affected, description, mitre_errors = mitre_future.result()
+        all_affected.extend(mitre_affected)
+        all_errors.extend(mitre_errors)
 
-    osv_affected, aliases, go_ids, osv_errors = fetch_osv(cve_id)
-    all_affected.extend(osv_affected)
-    all_errors.extend(osv_errors)
+        osv_affected, aliases, go_ids, osv_errors = osv_future.result()
+        all_affected.extend(osv_affected)
+        all_errors.extend(osv_errors)
 
-    for go_id in go_ids:
-        go_affected, go_errors = fetch_go_vuln(go_id)
-        all_affected.extend(go_affected)
-        all_errors.extend(go_errors)
+        for go_affected, go_errors in pool.map(fetch_go_vuln, go_ids):
+            all_affected.extend(go_affected)
+            all_errors.extend(go_errors)
 
     result = {
         "cve_id": cve_id,
@@ -15,6 +15,8 @@ import sys
 
 import requests
 
+import request_scheduler
+
 VEX_API = "https://security.access.redhat.com/data/csaf/v2/vex/{year}/{cve_id_lower}.json"
 TIMEOUT = 15
 
@@ -23,7 +25,7 @@ def fetch_vex(cve_id):
     year = cve_id.split("-")[1]
     url = VEX_API.format(year=year, cve_id_lower=cve_id.lower())
     try:
-        resp = requests.get(url, timeout=TIMEOUT)
+        resp = request_scheduler.get(url, timeout=TIMEOUT)
         if resp.status_code == 404:
             return None, 404, []
         if resp.status_code != 200:
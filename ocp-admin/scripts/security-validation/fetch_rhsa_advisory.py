@@ -8,6 +8,8 @@ import sys
 
 import requests
 
+import request_scheduler
+
 ADVISORY_API = "https://security.access.redhat.com/data/csaf/v2/advisories/{year}/{advisory_id_normalized}.json"
 TIMEOUT = 15
 
@@ -32,7 +34,7 @@ def fetch_advisory(advisory_id):
 
     url = ADVISORY_API.format(year=year, advisory_id_normalized=normalized)
     try:
-        resp = requests.get(url, timeout=TIMEOUT)
+        resp = request_scheduler.get(url, timeout=TIMEOUT)
         if resp.status_code == 404:
             return None, 404, [f"Advisory not found: {advisory_id}"]
         if resp.status_code != 200:
@@ -96,7 +98,8 @@ def extract_fixed_packages(advisory_data):
         pid = fpn.get("product_id", "")
         name = fpn.get("name", "")
         parent = rel.get("relates_to_product_reference", "")
-        product_map[pid] = {"name": name, "parent": parent}
+        component = rel.get("product_reference", "")
+        product_map[pid] = {"name": name, "parent": parent, "component": component}
 
     for vuln in advisory_data.get("vulnerabilities", []):
         status_groups = vuln.get("product_status", {})
@@ -109,12 +112,32 @@ def extract_fixed_packages(advisory_data):
                 packages.append({
                     "product_id": pid,
                     "name": info.get("name", ""),
+                    "component": info.get("component", ""),
+                    "parent_product": info.get("parent", ""),
                     "cve_id": cve_id,
                 })
 
     return packages
 
 
+def extract_product_cpes(advisory_data):
+    """Map product_id -> CPE for every product branch in the product_tree."""
+    cpes = {}
+
+    def walk(branch):
+        product = branch.get("product", {})
+        if product:
+            helper = product.get("product_identification_helper", {})
+            if isinstance(helper, dict) and helper.get("cpe"):
+                cpes[product.get("product_id", "")] = helper["cpe"]
+        for sub in branch.get("branches", []):
+            walk(sub)
+
+    for branch in advisory_data.get("product_tree", {}).get("branches", []):
+        walk(branch)
+    return cpes
+
+
 def main():
     parser = argparse.ArgumentParser(description="Fetch Red Hat Security Advisory and extract CVEs")
     parser.add_argument("advisory_id", help="Advisory ID (e.g., RHSA-2026:3337)")
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""Build and query an on-disk reverse index over Red Hat RHSA CSAF advisories.
+
+fetch_rhsa_advisory.py answers "which CVEs does RHSA-X fix". This script answers
+the reverse — "which RHSAs fix CVE-X (for product Y / package Z)" — from a SQLite
+inverted index (CVE -> advisories, package -> advisories, product CPE -> advisories).
+
+Subcommands:
+  ingest PATH...        Index local CSAF advisory JSON files or directories (bulk archive)
+  fetch RHSA-ID...      Fetch advisories by ID and index them
+  update                Re-fetch advisories listed as changed in the CSAF changes.csv feed
+  lookup                Query by --cve, --package and/or --product (CPE prefix)
+
+Every subcommand prints a JSON object to stdout.
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+import request_scheduler
+from fetch_rhsa_advisory import (
+    extract_advisory_metadata,
+    extract_cves,
+    extract_fixed_packages,
+    extract_product_cpes,
+    fetch_advisory,
+    normalize_advisory_id,
+)
+
+ADVISORIES_BASE = "https://security.access.redhat.com/data/csaf/v2/advisories/"
+CHANGES_CSV_URL = ADVISORIES_BASE + "changes.csv"
+DEFAULT_DB = Path(os.environ.get(
+    "RHSA_INDEX_DB",
+    Path.home() / ".cache" / "agentic-collections" / "rhsa-index.sqlite",
+))
+TIMEOUT = 30
+
+ADVISORY_FILE_RE = re.compile(r"^rhsa-(\d{4})_(\d+)\.json$", re.IGNORECASE)
+EPOCH_RE = re.compile(r"-\d+:")
+NVR_RE = re.compile(r"^(.+?)-[^-]+-[^-]+$")
+ARCH_RE = re.compile(r"\.(x86_64|aarch64|ppc64le|s390x|noarch|src|i686)$")
+# Raised by index_advisory for valid JSON with the wrong shape (e.g. "document" not an object)
+MALFORMED_DOCUMENT_ERRORS = (AttributeError, TypeError)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS advisories (
+    advisory TEXT PRIMARY KEY,
+    title TEXT NOT NULL DEFAULT '',
+    severity TEXT NOT NULL DEFAULT '',
+    initial_release_date TEXT NOT NULL DEFAULT '',
+    current_release_date TEXT NOT NULL DEFAULT '',
+    feed_modified TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS advisory_cves (
+    cve TEXT NOT NULL,
+    advisory TEXT NOT NULL,
+    severity TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (cve, advisory)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS fixes (
+    advisory TEXT NOT NULL,
+    cve TEXT NOT NULL,
+    package TEXT NOT NULL,
+    component TEXT NOT NULL,
+    cpe TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS fixes_cve ON fixes (cve, cpe);
+CREATE INDEX IF NOT EXISTS fixes_package ON fixes (package, cpe);
+CREATE INDEX IF NOT EXISTS fixes_cpe ON fixes (cpe);
+CREATE INDEX IF NOT EXISTS fixes_advisory ON fixes (advisory);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def base_package_name(component):
+    """Reduce a CSAF product_reference to its package name.
+
+    "podman-2:4.9.4-1.el9_4.x86_64" -> "podman"; "openssl-3.0.7-27.el9.src" -> "openssl";
+    "openshift4/ose-cli@sha256:..." -> "openshift4/ose-cli".
+    """
+    if "@" in component:
+        return component.split("@", 1)[0]
+    if EPOCH_RE.search(component):
+        return EPOCH_RE.split(component, 1)[0]
+    name = ARCH_RE.sub("", component)
+    match = NVR_RE.match(name)
+    return match.group(1) if match else name
+
+
+def advisory_id_from_path(path):
+    """"2024/rhsa-2024_1234.json" -> "RHSA-2024:1234" (None for non-RHSA files)."""
+    match = ADVISORY_FILE_RE.match(Path(path).name)
+    if not match:
+        return None
+    return f"RHSA-{match.group(1)}:{match.group(2)}"
+
+
+def open_index(db_path):
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def index_advisory(conn, advisory_data, feed_modified=None):
+    """Replace all index rows for one advisory document. Returns the advisory ID.
+
+    feed_modified is the changes.csv timestamp the document was fetched for; when
+    unknown (ingest, fetch) the document's current_release_date is used. A newer
+    stored watermark is kept, so `update` only re-fetches advisories changed since.
+    """
+    if not isinstance(advisory_data, dict):
+        raise ValueError("advisory document is not a JSON object")
+    metadata = extract_advisory_metadata(advisory_data)
+    advisory = metadata["advisory_id"].upper()
+    if not advisory:
+        raise ValueError("advisory document has no document.tracking.id")
+    if feed_modified is None:
+        feed_modified = metadata["current_release_date"]
+
+    cpes = extract_product_cpes(advisory_data)
+    fix_rows = set()
+    for pkg in extract_fixed_packages(advisory_data):
+        component = pkg.get("component", "")
+        fix_rows.add((
+            advisory,
+            pkg["cve_id"],
+            base_package_name(component),
+            component,
+            cpes.get(pkg.get("parent_product", ""), ""),
+        ))
+
+    with conn:
+        stored = conn.execute(
+            "SELECT feed_modified FROM advisories WHERE advisory = ?", (advisory,)
+        ).fetchone()
+        if stored and stored[0] > feed_modified:
+            feed_modified = stored[0]
+        conn.execute("DELETE FROM advisory_cves WHERE advisory = ?", (advisory,))
+        conn.execute("DELETE FROM fixes WHERE advisory = ?", (advisory,))
+        conn.execute(
+            "INSERT OR REPLACE INTO advisories VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                advisory,
+                metadata["title"],
+                metadata["aggregate_severity"],
+                metadata["initial_release_date"],
+                metadata["current_release_date"],
+                feed_modified,
+            ),
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO advisory_cves VALUES (?, ?, ?)",
+            [(c["cve_id"], advisory, c["severity"]) for c in extract_cves(advisory_data)],
+        )
+        conn.executemany("INSERT INTO fixes VALUES (?, ?, ?, ?, ?)", sorted(fix_rows))
+    return advisory
+
+
+def iter_advisory_files(paths):
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            yield from sorted(p for p in path.rglob("*.json") if advisory_id_from_path(p))
+        else:
+            yield path
+
+
+def cmd_ingest(conn, args):
+    indexed, errors = [], []
+    for path in iter_advisory_files(args.paths):
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            indexed.append(index_advisory(conn, data))
+        except (OSError, ValueError) as e:
+            errors.append(f"{path}: {e}")
+        except MALFORMED_DOCUMENT_ERRORS as e:
+            errors.append(f"{path}: malformed CSAF document: {e}")
+    return {"indexed": len(indexed), "errors": errors}
+
+
+def cmd_fetch(conn, args):
+    indexed, errors = [], []
+    for advisory_id in args.advisory_ids:
+        data, http_status, fetch_errors = fetch_advisory(advisory_id)
+        if data is None:
+            errors.extend(fetch_errors or [f"{advisory_id}: HTTP {http_status}"])
+            continue
+        try:
+            indexed.append(index_advisory(conn, data))
+        except ValueError as e:
+            errors.append(f"{advisory_id}: {e}")
+        except MALFORMED_DOCUMENT_ERRORS as e:
+            errors.append(f"{advisory_id}: malformed CSAF document: {e}")
+    return {"indexed": len(indexed), "errors": errors}
+
+
+def parse_changes_csv(text):
+    """Yield (relative_path, modified) rows from the CSAF changes.csv feed."""
+    for row in csv.reader(io.StringIO(text)):
+        if len(row) >= 2 and row[0].endswith(".json"):
+            yield row[0].strip(), row[1].strip()
+
+
+def load_changes(source):
+    if re.match(r"^https?://", source):
+        resp = request_scheduler.get(source, timeout=TIMEOUT)
+        if resp.status_code != 200:
+            raise ValueError(f"HTTP {resp.status_code} fetching {source}")
+        return resp.text
+    return Path(source).read_text(encoding="utf-8")
+
+
+def cmd_update(conn, args):
+    """Fetch advisories whose changes.csv timestamp is newer than the indexed one."""
+    try:
+        changes = load_changes(args.changes)
+    except (OSError, ValueError, requests.RequestException) as e:
+        return {"updated": [], "skipped": 0, "errors": [f"changes feed: {e}"]}
+
+    known = dict(conn.execute("SELECT advisory, feed_modified FROM advisories"))
+    updated, errors, skipped = [], [], 0
+    for rel_path, modified in parse_changes_csv(changes):
+        advisory_id = advisory_id_from_path(rel_path)
+        if not advisory_id or (args.since and modified < args.since):
+            continue
+        if known.get(advisory_id, "") >= modified:
+            skipped += 1
+            continue
+        if args.limit and len(updated) >= args.limit:
+            break
+        url = ADVISORIES_BASE + rel_path
+        try:
+            resp = request_scheduler.get(url, timeout=TIMEOUT)
+            if resp.status_code != 200:
+                errors.append(f"{advisory_id}: HTTP {resp.status_code}")
+                continue
+            updated.append(index_advisory(conn, resp.json(), feed_modified=modified))
+        except requests.RequestException as e:
+            errors.append(f"{advisory_id}: request failed: {e}")
+        except ValueError as e:
+            errors.append(f"{advisory_id}: {e}")
+        except MALFORMED_DOCUMENT_ERRORS as e:
+            errors.append(f"{advisory_id}: malformed CSAF document: {e}")
+
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO meta VALUES ('last_update', ?)",
+            (time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),),
+        )
+    return {"updated": updated, "skipped": skipped, "errors": errors}
+
+
+def lookup(conn, cve=None, package=None, product=None):
+    """Return advisories matching all given filters, newest first."""
+    clauses, params = [], []
+    if cve:
+        clauses.append("f.cve = ?")
+        params.append(cve.upper())
+    if package:
+        clauses.append("f.package = ?")
+        params.append(package)
+    if product:
+        # CPE prefix match; GLOB keeps the (package|cve, cpe) indexes usable.
+        clauses.append("f.cpe GLOB ?")
+        params.append(product.replace("[", "[[]").replace("*", "[*]").replace("?", "[?]") + "*")
+
+    rows = conn.execute(
+        "SELECT f.advisory, a.title, a.severity, a.current_release_date, f.cve, f.package, f.cpe "
+        "FROM fixes f JOIN advisories a ON a.advisory = f.advisory "
+        f"WHERE {' AND '.join(clauses)} "
+        "ORDER BY a.current_release_date DESC, f.advisory, f.cve, f.package, f.cpe",
+        params,
+    )
+
+    results = {}
+    for advisory, title, severity, released, row_cve, row_pkg, cpe in rows:
+        entry = results.setdefault(advisory, {
+            "advisory_id": advisory,
+            "title": title,
+            "severity": severity,
+            "current_release_date": released,
+            "cves": [],
+            "packages": [],
+            "product_cpes": [],
+        })
+        for key, value in (("cves", row_cve), ("packages", row_pkg), ("product_cpes", cpe)):
+            if value and value not in entry[key]:
+                entry[key].append(value)
+
+    if cve and not results and not package and not product:
+        # Advisories that list the CVE without a fixed product_status entry.
+        for advisory, title, severity, released in conn.execute(
+            "SELECT a.advisory, a.title, a.severity, a.current_release_date "
+            "FROM advisory_cves c JOIN advisories a ON a.advisory = c.advisory "
+            "WHERE c.cve = ? ORDER BY a.current_release_date DESC",
+            (cve.upper(),),
+        ):
+            results[advisory] = {
+                "advisory_id": advisory,
+                "title": title,
+                "severity": severity,
+                "current_release_date": released,
+                "cves": [cve.upper()],
+                "packages": [],
+                "product_cpes": [],
+            }
+    return list(results.values())
+
+
+def cmd_lookup(conn, args):
+    if not (args.cve or args.package or args.product):
+        return {"advisories": [], "errors": ["lookup requires --cve, --package or --product"]}
+    start = time.perf_counter()
+    advisories = lookup(conn, cve=args.cve, package=args.package, product=args.product)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return {
+        "query": {"cve": args.cve, "package": args.package, "product": args.product},
+        "advisories": advisories,
+        "advisory_ids": [a["advisory_id"] for a in advisories],
+        "count": len(advisories),
+        "lookup_ms": round(elapsed_ms, 3),
+        "errors": [],
+    }
+
+
+def cmd_stats(conn, args):
+    counts = {
+        table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        for table in ("advisories", "advisory_cves", "fixes")
+    }
+    meta = dict(conn.execute("SELECT key, value FROM meta"))
+    return {"db": str(args.db), "counts": counts, "last_update": meta.get("last_update", ""), "errors": []}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reverse index of RHSA advisories (CVE/package/CPE -> RHSA)")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB,
+                        help=f"Index database path (default: {DEFAULT_DB}; env RHSA_INDEX_DB)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_ingest = sub.add_parser("ingest", help="Index local CSAF advisory JSON files or directories")
+    p_ingest.add_argument("paths", nargs="+")
+
+    p_fetch = sub.add_parser("fetch", help="Fetch advisories by ID and index them")
+    p_fetch.add_argument("advisory_ids", nargs="+", metavar="RHSA-ID")
+
+    p_update = sub.add_parser("update", help="Index advisories changed according to changes.csv")
+    p_update.add_argument("--changes", default=CHANGES_CSV_URL,
+                          help="changes.csv URL or local path (default: Red Hat CSAF feed)")
+    p_update.add_argument("--since", default="",
+                          help="Ignore feed entries modified before this ISO timestamp")
+    p_update.add_argument("--limit", type=int, default=0,
+                          help="Maximum advisories to fetch in this run (0 = no limit)")
+
+    p_lookup = sub.add_parser("lookup", help="Find advisories fixing a CVE / package / product")
+    p_lookup.add_argument("--cve")
+    p_lookup.add_argument("--package", help="Base package name (e.g., podman)")
+    p_lookup.add_argument("--product", help="Product CPE or CPE prefix (e.g., cpe:/a:redhat:enterprise_linux:9)")
+
+    sub.add_parser("stats", help="Show index row counts")
+    args = parser.parse_args()
+
+    if args.command == "fetch":
+        bad = [a for a in args.advisory_ids if normalize_advisory_id(a)[2]]
+        if bad:
+            json.dump({"errors": [f"Invalid advisory ID format: '{a}'" for a in bad]}, sys.stdout, indent=2)
+            print()
+            sys.exit(1)
+    if args.command == "lookup" and args.cve and not re.match(r"^CVE-\d{4}-\d+$", args.cve, re.IGNORECASE):
+        json.dump({"errors": [f"Invalid CVE ID format: '{args.cve}'"]}, sys.stdout, indent=2)
+        print()
+        sys.exit(1)
+
+    conn = open_index(args.db)
+    handlers = {
+        "ingest": cmd_ingest,
+        "fetch": cmd_fetch,
+        "update": cmd_update,
+        "lookup": cmd_lookup,
+        "stats": cmd_stats,
+    }
+    try:
+        result = handlers[args.command](conn, args)
+    finally:
+        conn.close()
+
+    json.dump(result, sys.stdout, indent=2)
+    print()
+    sys.exit(1 if result.get("errors") and args.command != "update" else 0)
+
+
+if __name__ == "__main__":
+    main()
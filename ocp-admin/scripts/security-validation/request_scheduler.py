@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Rate-limit-aware HTTP GET scheduler shared by the security-validation fetchers.
+
+MITRE, OSV.dev, vuln.go.dev and security.access.redhat.com throttle differently.
+Every outbound request goes through a per-host token bucket, is retried with
+jittered exponential backoff on 429/5xx (honoring Retry-After), and identical
+in-flight URLs are coalesced so concurrent callers share one response.
+
+Usage from a fetcher script (the script directory is on sys.path):
+
+    import request_scheduler
+    resp = request_scheduler.get(url, timeout=TIMEOUT)
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import Future
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+
+# host -> (requests per second, burst size)
+HOST_LIMITS = {
+    "cveawg.mitre.org": (5.0, 5),
+    "api.osv.dev": (20.0, 20),
+    "vuln.go.dev": (20.0, 20),
+    "security.access.redhat.com": (10.0, 10),
+}
+DEFAULT_LIMIT = (5.0, 5)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 4
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 30.0
+RETRY_AFTER_CAP = 120.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket; ``acquire`` blocks until a token is available."""
+
+    def __init__(self, rate, burst, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = clock()
+        self.blocked_until = 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = self._clock()
+                if now < self.blocked_until:
+                    wait = self.blocked_until - now
+                else:
+                    self._refill(now)
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            self._sleep(wait)
+
+    def pause(self, seconds):
+        """Block every caller for this host (server asked us to back off)."""
+        with self._lock:
+            now = self._clock()
+            self.blocked_until = max(self.blocked_until, now + seconds)
+            self.tokens = 0.0
+            self.updated = now
+
+
+def parse_retry_after(value, now=None):
+    """Return Retry-After as seconds (delta-seconds or HTTP-date), or None."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return min(float(value), RETRY_AFTER_CAP)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    now = time.time() if now is None else now
+    return min(max(when.timestamp() - now, 0.0), RETRY_AFTER_CAP)
+
+
+def backoff_delay(attempt):
+    """Full-jitter exponential backoff for the given retry attempt (0-based)."""
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+
+
+class RequestScheduler:
+    """Per-host rate limiting, retries and in-flight coalescing for GET requests."""
+
+    def __init__(self, limits=None, max_retries=MAX_RETRIES, session=None, sleep=time.sleep):
+        self.limits = dict(HOST_LIMITS if limits is None else limits)
+        self.max_retries = max_retries
+        self.session = session or requests.Session()
+        self._sleep = sleep
+        self._buckets = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host):
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self.limits.get(host, DEFAULT_LIMIT)
+                bucket = TokenBucket(rate, burst, sleep=self._sleep)
+                self._buckets[host] = bucket
+            return bucket
+
+    def get(self, url, timeout=15):
+        """GET ``url``; concurrent calls for the same URL share one request.
+
+        Returns the final ``requests.Response`` (which may still be a non-200
+        status once retries are exhausted) or raises ``requests.RequestException``.
+        """
+        with self._lock:
+            future = self._inflight.get(url)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[url] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            resp = self._get_with_retries(url, timeout)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(resp)
+            return resp
+        finally:
+            with self._lock:
+                self._inflight.pop(url, None)
+
+    def _get_with_retries(self, url, timeout):
+        bucket = self.bucket(urlsplit(url).hostname or "")
+        attempt = 0
+        while True:
+            bucket.acquire()
+            try:
+                resp = self.session.get(url, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self.max_retries:
+                    raise
+                self._sleep(backoff_delay(attempt))
+                attempt += 1
+                continue
+
+            if resp.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                return resp
+
+            delay = parse_retry_after(resp.headers.get("Retry-After"))
+            if delay is not None:
+                bucket.pause(delay + random.uniform(0, 0.25 * max(delay, 1.0)))
+            else:
+                self._sleep(backoff_delay(attempt))
+            attempt += 1
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_scheduler():
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = RequestScheduler()
+        return _default
+
+
+def get(url, timeout=15):
+    """GET through the process-wide shared scheduler."""
+    return default_scheduler().get(url, timeout=timeout)
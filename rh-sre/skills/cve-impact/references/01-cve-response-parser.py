@@ -8,6 +8,8 @@ Usage:
   python3 01-cve-response-parser.py < response.json
   python3 01-cve-response-parser.py /path/to/response.json
   python3 01-cve-response-parser.py page1.json page2.json page3.json   # Multiple pages → aggregated report
+  WATCH_DIR=/tmp/pages WATCH_PAGES=5 python3 01-cve-response-parser.py &  # Fold pages as they are written
+  FLEET_DIR=/tmp/fleet python3 01-cve-response-parser.py   # Fleet rollup: one subdirectory (or file) per system
 
 Options (env vars or args):
   FILTER_REMEDIATABLE=1  - Only CVEs with advisory_available=true
@@ -16,10 +18,26 @@ Options (env vars or args):
   OUTPUT=summary|table|json|report
   SYSTEM_NAME=hostname - For report header (when OUTPUT=report)
   PAGES_SCANNED=5 - For report header (when OUTPUT=report, multiple files)
+  TOP_K=20 - Rows kept for table/summary output (report: all matches unless set)
+  WATCH_DIR=dir - Watch mode: fold each page file as it lands in dir (start before fetching)
+  WATCH_PAGES=5 - Watch mode: number of pages to wait for
+  WATCH_PATTERN=* - Watch mode: glob for page files (default: all non-hidden files)
+  WATCH_TIMEOUT=600 - Watch mode: seconds to wait for the last page
+  FLEET_DIR=dir - Fleet mode: per-system response files under dir (subdirectory or file stem = system)
+  FLEET_TOP=20 - Fleet mode: rows in each ranked list
+  FLEET_WORKERS=N - Fleet mode: worker processes (default: CPU count)
+
+Pages are folded one at a time (see CveAggregate): only the dedupe set, counters and
+a bounded top-K heap are kept in memory. OUTPUT=json keeps every filtered CVE and
+sorts the full list.
 """
+import heapq
 import json
+import re
 import sys
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Response structure: {"result": {"data": [...]}, "meta": {"count": N}}
@@ -27,6 +45,9 @@ from pathlib import Path
 # attributes: advisory_available, impact, cvss3_score, cvss2_score, description, synopsis, public_date, business_risk, etc.
 
 IMPACT_ORDER = {"Critical": 0, "High": 1, "Important": 2, "Moderate": 3, "Low": 4, "None": 5}
+CVE_ID_RE = re.compile(r"^CVE-(\d{4})-(\d{1,9})$")
+# Fleet risk score: sum of these weights over a system's (filtered) CVEs.
+IMPACT_WEIGHTS = {"Critical": 10, "High": 7, "Important": 5, "Moderate": 2, "Low": 1}
 
 
 def load_response(src):
@@ -66,8 +87,8 @@ def filter_cves(cves, remediatable_only=None, impact_filter=None):
     return filtered
 
 
-def sort_cves(cves, sort_by="cvss"):
-    """Sort CVEs by cvss (desc), impact, or public_date."""
+def sort_key(sort_by="cvss"):
+    """Return the sort key function for cvss (desc), impact, or public_date."""
     def key_fn(cve):
         if sort_by == "cvss":
             score = get_attr(cve, "cvss3_score") or get_attr(cve, "cvss2_score") or "0"
@@ -77,25 +98,137 @@ def sort_cves(cves, sort_by="cvss"):
         if sort_by == "public_date":
             return get_attr(cve, "public_date", "") or ""
         return 0
-    return sorted(cves, key=key_fn)
+    return key_fn
 
 
-def format_summary(cves, total_in_api, remediatable_only=False, impact_filter=None):
-    """Print summary counts by impact and remediation."""
-    by_impact = {}
-    by_remediation = {"with_remediation": 0, "without": 0}
-    for cve in cves:
+def sort_cves(cves, sort_by="cvss"):
+    """Sort CVEs by cvss (desc), impact, or public_date."""
+    return sorted(cves, key=sort_key(sort_by))
+
+
+def compact_cve_id(cid):
+    """Encode CVE-YYYY-NNNN as one int for the dedupe set (other ids stay strings)."""
+    match = CVE_ID_RE.match(cid)
+    if match:
+        return int(match.group(1)) * 10**9 + int(match.group(2))
+    return cid
+
+
+class _Worst:
+    """Heap entry wrapper that inverts ordering, so heap[0] is the worst kept CVE."""
+
+    __slots__ = ("key", "cve")
+
+    def __init__(self, key, cve):
+        self.key = key
+        self.cve = cve
+
+    def __lt__(self, other):
+        return self.key > other.key
+
+
+class CveAggregate:
+    """Running aggregate over CVE pages: dedupe, filter, counts and top-K.
+
+    Fold pages with add_page(); CVEs are filtered as they stream in and only the
+    best ``top_k`` (by ``sort_by``, ties in first-seen order) are retained.
+    ``top_k=None`` keeps every filtered CVE (needed for OUTPUT=json).
+    ``dedupe=False`` keeps every CVE of the page as-is, including repeats and
+    entries without an id (single-response mode, as before multi-page merging).
+    """
+
+    def __init__(self, remediatable_only=False, impact_filter=None, sort_by="cvss", top_k=20, dedupe=True):
+        self.remediatable_only = remediatable_only
+        self.impact_filter = impact_filter
+        self.sort_by = sort_by
+        self.top_k = top_k
+        self.dedupe = dedupe
+        self.total = 0
+        self.pages = 0
+        self.filtered_count = 0
+        self.by_impact = {}
+        self.by_remediation = {"with_remediation": 0, "without": 0}
+        self._key_fn = sort_key(sort_by)
+        self._seen = set()
+        self._kept = []
+
+    def add_page(self, data):
+        """Fold one Lightspeed response document into the aggregate."""
+        cves, total = extract_cves(data)
+        self.total = max(self.total, total)
+        self.pages += 1
+        for cve in cves:
+            if not self.dedupe:
+                if filter_cves([cve], self.remediatable_only, self.impact_filter):
+                    self._add_filtered(cve)
+                continue
+            cid = cve.get("id")
+            if not cid:
+                continue
+            key = compact_cve_id(cid)
+            if key in self._seen:
+                continue
+            self._seen.add(key)
+            if filter_cves([cve], self.remediatable_only, self.impact_filter):
+                self._add_filtered(cve)
+
+    def _add_filtered(self, cve):
         impact = get_attr(cve, "impact", "None") or "None"
-        by_impact[impact] = by_impact.get(impact, 0) + 1
+        self.by_impact[impact] = self.by_impact.get(impact, 0) + 1
         if get_attr(cve, "advisory_available", False):
-            by_remediation["with_remediation"] += 1
+            self.by_remediation["with_remediation"] += 1
         else:
-            by_remediation["without"] += 1
+            self.by_remediation["without"] += 1
+
+        order = self.filtered_count
+        self.filtered_count += 1
+        if self.top_k is None:
+            self._kept.append(cve)
+            return
+        if self.top_k <= 0:
+            return
+        key = (self._key_fn(cve), order)
+        if len(self._kept) < self.top_k:
+            heapq.heappush(self._kept, _Worst(key, cve))
+        elif key < self._kept[0].key:
+            heapq.heapreplace(self._kept, _Worst(key, cve))
+
+    def top(self):
+        """Retained CVEs in sort order (all filtered CVEs when top_k is None)."""
+        if self.top_k is None:
+            return sort_cves(self._kept, sort_by=self.sort_by)
+        return [entry.cve for entry in sorted(self._kept, key=lambda e: e.key)]
+
+    def summary_counts(self):
+        return {
+            "filtered_count": self.filtered_count,
+            "by_impact": dict(self.by_impact),
+            "by_remediation": dict(self.by_remediation),
+        }
+
+
+def format_summary(cves, total_in_api, remediatable_only=False, impact_filter=None, counts=None):
+    """Print summary counts by impact and remediation.
+
+    ``counts`` (from CveAggregate.summary_counts) replaces counting ``cves`` when
+    the aggregate only retained the top-K rows.
+    """
+    if counts is None:
+        counts = {"filtered_count": len(cves), "by_impact": {}, "by_remediation": {"with_remediation": 0, "without": 0}}
+        for cve in cves:
+            impact = get_attr(cve, "impact", "None") or "None"
+            counts["by_impact"][impact] = counts["by_impact"].get(impact, 0) + 1
+            if get_attr(cve, "advisory_available", False):
+                counts["by_remediation"]["with_remediation"] += 1
+            else:
+                counts["by_remediation"]["without"] += 1
+    by_impact = counts["by_impact"]
+    by_remediation = counts["by_remediation"]
 
     lines = [
         "CVE Response Summary",
         "=" * 60,
-        f"Total in this page/batch: {len(cves)}",
+        f"Total in this page/batch: {counts['filtered_count']}",
         f"Total in API (meta.count): {total_in_api}",
     ]
     if remediatable_only or impact_filter:
@@ -112,8 +245,12 @@ def format_summary(cves, total_in_api, remediatable_only=False, impact_filter=No
     return "\n".join(lines)
 
 
-def format_table(cves, limit=20):
-    """Print CVE table (CVE ID, CVSS, Impact, Remediation)."""
+def format_table(cves, limit=20, total=None):
+    """Print CVE table (CVE ID, CVSS, Impact, Remediation).
+
+    ``total`` is the full match count when ``cves`` is already truncated to top-K.
+    """
+    total = len(cves) if total is None else total
     lines = [
         "CVE ID              | CVSS   | Impact    | Remediation",
         "-" * 60,
@@ -124,13 +261,17 @@ def format_table(cves, limit=20):
         impact = get_attr(cve, "impact", "-") or "-"
         rem = "Yes" if get_attr(cve, "advisory_available", False) else "No"
         lines.append(f"{cve_id:<19} | {str(cvss):<6} | {impact:<9} | {rem}")
-    if len(cves) > limit:
-        lines.append(f"... and {len(cves) - limit} more")
+    if total > limit:
+        lines.append(f"... and {total - limit} more")
     return "\n".join(lines)
 
 
-def format_report(cves, total_in_api, system_name=None, pages_scanned=None):
-    """Print aggregated report format (for multi-page results)."""
+def format_report(cves, total_in_api, system_name=None, pages_scanned=None, match_count=None, top_k=None):
+    """Print aggregated report format (for multi-page results).
+
+    ``match_count`` is the full match count when ``cves`` is truncated to ``top_k`` (TOP_K).
+    """
+    match_count = len(cves) if match_count is None else match_count
     lines = ["=" * 80]
     title = "CVEs WITH AVAILABLE REMEDIATION"
     if system_name:
@@ -146,7 +287,9 @@ def format_report(cves, total_in_api, system_name=None, pages_scanned=None):
             lines.append("")
             lines.append("Note: Try scanning more pages or use FILTER_IMPACT=Critical,Important for severity filter.")
     else:
-        lines.append(f"Found {len(cves)} CVE(s) with available remediation:\n")
+        lines.append(f"Found {match_count} CVE(s) with available remediation:\n")
+        if match_count > len(cves):
+            lines.append(f"Showing top {len(cves)} (TOP_K={top_k if top_k is not None else len(cves)}).\n")
         for i, cve in enumerate(cves, 1):
             cve_id = cve.get("id", "?")
             cvss = get_attr(cve, "cvss3_score") or get_attr(cve, "cvss2_score") or "-"
@@ -163,25 +306,185 @@ def format_report(cves, total_in_api, system_name=None, pages_scanned=None):
     return "\n".join(lines)
 
 
-def load_and_merge_files(paths):
-    """Load multiple JSON files, extract CVEs, merge and dedupe by id."""
-    all_cves = {}
-    max_total = 0
+def load_page(path):
+    """Load one page file; None when missing or not (yet) valid JSON."""
+    if path == "-":
+        return json.load(sys.stdin)
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def stream_merge_files(paths, aggregate):
+    """Fold page files into ``aggregate`` one at a time (only one page in memory)."""
     for p in paths:
-        if not os.path.exists(p):
-            continue
-        with open(p, "r") as f:
-            try:
-                data = json.load(f)
-            except json.JSONDecodeError:
+        data = load_page(p)
+        if data is not None:
+            aggregate.add_page(data)
+    return aggregate
+
+
+def watch_pages(directory, expected_pages, aggregate, pattern="*", timeout=600, poll_interval=0.2):
+    """Fold page files into ``aggregate`` as they appear in ``directory``.
+
+    A file is folded once it parses as complete JSON, so pages still being
+    written are retried on the next poll. Returns the folded paths in arrival
+    order; fewer than ``expected_pages`` means the timeout expired.
+    """
+    folded = []
+    seen = set()
+    deadline = time.monotonic() + timeout
+    while len(folded) < expected_pages:
+        for path in sorted(Path(directory).glob(pattern)):
+            if path in seen or path.name.startswith(".") or not path.is_file():
                 continue
-        cves, total = extract_cves(data)
-        max_total = max(max_total, total)
-        for cve in cves:
-            cid = cve.get("id")
-            if cid and cid not in all_cves:
-                all_cves[cid] = cve
-    return list(all_cves.values()), max_total
+            data = load_page(path)
+            if data is None:
+                continue
+            aggregate.add_page(data)
+            seen.add(path)
+            folded.append(path)
+            if len(folded) >= expected_pages:
+                break
+        if len(folded) >= expected_pages or time.monotonic() >= deadline:
+            break
+        time.sleep(poll_interval)
+    return folded
+
+
+def discover_fleet(root):
+    """Group response files under ``root`` by system.
+
+    Files directly in ``root`` are one system each (file stem); files under a
+    subdirectory belong to the system named by that directory's relative path.
+    Returns sorted [(system_name, [paths...])].
+    """
+    root = Path(root)
+    systems = {}
+    for path in sorted(root.rglob("*")):
+        if not path.is_file() or any(part.startswith(".") for part in path.relative_to(root).parts):
+            continue
+        parent = path.parent.relative_to(root)
+        name = path.stem if parent == Path(".") else parent.as_posix()
+        systems.setdefault(name, []).append(str(path))
+    return sorted(systems.items())
+
+
+def scan_system(job):
+    """Process-pool worker: fold one system's pages and return compact rows only."""
+    name, paths, remediatable_only, impact_filter = job
+    aggregate = CveAggregate(remediatable_only, impact_filter, top_k=None)
+    stream_merge_files(paths, aggregate)
+    rows = []
+    for cve in aggregate.top():
+        score = get_attr(cve, "cvss3_score") or get_attr(cve, "cvss2_score") or 0
+        rows.append((
+            cve["id"],
+            get_attr(cve, "impact", "None") or "None",
+            bool(get_attr(cve, "advisory_available", False)),
+            float(score) if score else 0.0,
+        ))
+    return name, aggregate.pages, rows
+
+
+class FleetRollup:
+    """CVE x system sparse incidence built from per-system compact rows."""
+
+    def __init__(self):
+        self.systems = []
+        self.system_stats = []
+        self.cve_ids = []
+        self.cve_info = []
+        self.incidence = []
+        self._cve_index = {}
+
+    def add_system(self, name, pages, rows):
+        sys_idx = len(self.systems)
+        self.systems.append(name)
+        stats = {"system": name, "pages": pages, "cves": 0, "remediatable": 0, "risk_score": 0, "by_impact": {}}
+        for cid, impact, remediatable, cvss in rows:
+            cve_idx = self._cve_index.get(cid)
+            if cve_idx is None:
+                cve_idx = len(self.cve_ids)
+                self._cve_index[cid] = cve_idx
+                self.cve_ids.append(cid)
+                self.cve_info.append({"impact": impact, "cvss": cvss, "remediatable_systems": 0})
+                self.incidence.append([])
+            self.incidence[cve_idx].append(sys_idx)
+            if remediatable:
+                self.cve_info[cve_idx]["remediatable_systems"] += 1
+                stats["remediatable"] += 1
+            stats["cves"] += 1
+            stats["by_impact"][impact] = stats["by_impact"].get(impact, 0) + 1
+            stats["risk_score"] += IMPACT_WEIGHTS.get(impact, 0)
+        self.system_stats.append(stats)
+
+    def top_cves(self, n):
+        order = heapq.nsmallest(
+            n, range(len(self.cve_ids)),
+            key=lambda i: (-len(self.incidence[i]), IMPACT_ORDER.get(self.cve_info[i]["impact"], 99),
+                           -self.cve_info[i]["cvss"], self.cve_ids[i]),
+        )
+        return [
+            {
+                "id": self.cve_ids[i],
+                "affected_systems": len(self.incidence[i]),
+                "remediatable_systems": self.cve_info[i]["remediatable_systems"],
+                "impact": self.cve_info[i]["impact"],
+                "cvss": self.cve_info[i]["cvss"],
+            }
+            for i in order
+        ]
+
+    def top_systems(self, n, by="risk_score"):
+        if by == "critical":
+            key = lambda s: (-s["by_impact"].get("Critical", 0), -s["risk_score"], s["system"])
+        else:
+            key = lambda s: (-s["risk_score"], -s["by_impact"].get("Critical", 0), s["system"])
+        return heapq.nsmallest(n, self.system_stats, key=key)
+
+
+def rollup_fleet(root, remediatable_only=False, impact_filter=None, workers=None):
+    """Scan every system under ``root`` in a process pool and build a FleetRollup."""
+    jobs = [(name, paths, remediatable_only, impact_filter) for name, paths in discover_fleet(root)]
+    rollup = FleetRollup()
+    if not jobs:
+        return rollup
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map() yields in submission order, keeping system indices deterministic.
+        for name, pages, rows in pool.map(scan_system, jobs, chunksize=max(1, len(jobs) // 64)):
+            rollup.add_system(name, pages, rows)
+    return rollup
+
+
+def format_fleet_report(rollup, top_n=20):
+    """Print ranked fleet summary: systems by critical count / risk, most widespread CVEs."""
+    lines = ["=" * 80, f"FLEET CVE ROLLUP — {len(rollup.systems)} system(s), {len(rollup.cve_ids)} unique CVE(s)", "=" * 80, ""]
+    lines.append(f"Top {top_n} systems by Critical CVEs:")
+    lines.append("System                                   | Critical | Important | CVEs  | Remed. | Risk")
+    lines.append("-" * 90)
+    for s in rollup.top_systems(top_n, by="critical"):
+        lines.append(
+            f"{s['system'][:40]:<40} | {s['by_impact'].get('Critical', 0):<8} | "
+            f"{s['by_impact'].get('Important', 0):<9} | {s['cves']:<5} | {s['remediatable']:<6} | {s['risk_score']}"
+        )
+    lines.append("")
+    lines.append(f"Top {top_n} systems by risk score:")
+    for i, s in enumerate(rollup.top_systems(top_n), 1):
+        lines.append(f"  {i}. {s['system']} — risk {s['risk_score']} ({s['cves']} CVEs, {s['remediatable']} remediatable)")
+    lines.append("")
+    lines.append(f"Top {top_n} CVEs by affected systems:")
+    lines.append("CVE ID              | Systems | Remediatable | Impact    | CVSS")
+    lines.append("-" * 70)
+    for c in rollup.top_cves(top_n):
+        lines.append(
+            f"{c['id']:<19} | {c['affected_systems']:<7} | {c['remediatable_systems']:<12} | {c['impact']:<9} | {c['cvss']}"
+        )
+    lines.append("")
+    lines.append(f"Risk score weights: {', '.join(f'{k}={v}' for k, v in IMPACT_WEIGHTS.items())}")
+    return "\n".join(lines)
 
 
 def main():
@@ -194,31 +497,72 @@ def main():
     impact_str = os.environ.get("FILTER_IMPACT", "")
     impact_filter = [s.strip() for s in impact_str.split(",") if s.strip()] if impact_str else None
     sort_by = os.environ.get("SORT_BY", "cvss")
-    output = os.environ.get("OUTPUT", "report" if len(paths) > 1 else "summary")
+    fleet_dir = os.environ.get("FLEET_DIR", "")
+    if fleet_dir:
+        top_n = int(os.environ.get("FLEET_TOP", "20") or 20)
+        workers = int(os.environ["FLEET_WORKERS"]) if os.environ.get("FLEET_WORKERS") else None
+        rollup = rollup_fleet(fleet_dir, remediatable_only, impact_filter, workers=workers)
+        if os.environ.get("OUTPUT") == "json":
+            print(json.dumps({
+                "systems": len(rollup.systems),
+                "unique_cves": len(rollup.cve_ids),
+                "top_systems_by_critical": rollup.top_systems(top_n, by="critical"),
+                "top_systems_by_risk": rollup.top_systems(top_n),
+                "top_cves": rollup.top_cves(top_n),
+            }, indent=2))
+        else:
+            print(format_fleet_report(rollup, top_n=top_n))
+        return
+
+    watch_dir = os.environ.get("WATCH_DIR", "")
+    output = os.environ.get("OUTPUT", "report" if len(paths) > 1 or watch_dir else "summary")
     system_name = os.environ.get("SYSTEM_NAME", "")
     pages_scanned = os.environ.get("PAGES_SCANNED", str(len(paths)) if len(paths) > 1 else None)
 
-    if len(paths) > 1 and "-" not in paths:
-        cves, total = load_and_merge_files(paths)
+    top_k_env = os.environ.get("TOP_K", "")
+    if output == "json":
+        top_k = None
+    elif top_k_env.isdigit():
+        top_k = int(top_k_env)
+    elif output == "report":
+        top_k = None
     else:
-        src = paths[0] if paths else "-"
-        data = load_response(src)
-        cves, total = extract_cves(data)
-
-    cves = filter_cves(cves, remediatable_only=remediatable_only, impact_filter=impact_filter)
-    cves = sort_cves(cves, sort_by=sort_by)
+        top_k = 20 if output == "table" else 15
+
+    single_response = not watch_dir and not (len(paths) > 1 and "-" not in paths)
+    aggregate = CveAggregate(remediatable_only, impact_filter, sort_by, top_k=top_k, dedupe=not single_response)
+    if watch_dir:
+        expected = int(os.environ.get("WATCH_PAGES", "1") or 1)
+        folded = watch_pages(
+            watch_dir,
+            expected,
+            aggregate,
+            pattern=os.environ.get("WATCH_PATTERN", "*") or "*",
+            timeout=float(os.environ.get("WATCH_TIMEOUT", "600") or 600),
+        )
+        if len(folded) < expected:
+            print(f"Warning: only {len(folded)} of {expected} page(s) arrived in {watch_dir} before timeout",
+                  file=sys.stderr)
+        pages_scanned = os.environ.get("PAGES_SCANNED", str(len(folded)))
+    elif len(paths) > 1 and "-" not in paths:
+        stream_merge_files(paths, aggregate)
+    else:
+        aggregate.add_page(load_response(paths[0] if paths else "-"))
+    cves = aggregate.top()
+    total = aggregate.total
 
     if output == "json":
         print(json.dumps({"data": cves, "total": total, "filtered_count": len(cves)}, indent=2))
     elif output == "table":
-        print(format_table(cves))
+        print(format_table(cves, limit=len(cves), total=aggregate.filtered_count))
     elif output == "report":
-        print(format_report(cves, total, system_name=system_name or None, pages_scanned=pages_scanned))
+        print(format_report(cves, total, system_name=system_name or None, pages_scanned=pages_scanned,
+                            match_count=aggregate.filtered_count, top_k=top_k))
     else:
-        print(format_summary(cves, total, remediatable_only, impact_filter))
+        print(format_summary(cves, total, remediatable_only, impact_filter, counts=aggregate.summary_counts()))
         print("")
         print("Top CVEs (by CVSS):")
-        print(format_table(cves, limit=15))
+        print(format_table(cves, limit=len(cves), total=aggregate.filtered_count))
 
 
 if __name__ == "__main__":
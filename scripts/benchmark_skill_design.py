@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the design-principle checks in validate_skill_design.py.
+
+Reads every SKILL.md of the registry packs once (headings from the markdown
+metadata cache, as validate_skill does), then times (in-memory, no I/O or YAML
+parsing) building the shared outline and running each DP check over it,
+repeated --repeat times. Use it to see what a new check costs per skill:
+
+    uv run python scripts/benchmark_skill_design.py --repeat 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+import pack_registry
+import validate_skill_design as vsd
+from md_metadata_cache import get_metadata
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+Headings = tuple[tuple[int, int, str, bool], ...]
+
+
+def load_bodies(root: Path = REPO_ROOT) -> list[tuple[str, str, Headings, int]]:
+    """(skill name, body, file headings, frontmatter lines) for every SKILL.md in the union pack registry."""
+    pack_dirs = [str(root / d) for d in pack_registry.get_union_pack_dirs()]
+    bodies: list[tuple[str, str, Headings, int]] = []
+    for path in sorted(vsd.find_skill_files(pack_dirs)):
+        content = path.read_text(encoding="utf-8")
+        meta = get_metadata(path)
+        line_offset = content.count("\n", 0, meta.body_offset)
+        bodies.append((path.parent.name, content[meta.body_offset:], meta.outline, line_offset))
+    return bodies
+
+
+def outline_checks() -> dict[str, Callable[[str, vsd.SkillOutline, vsd.ValidationResult], None]]:
+    return {
+        "DP1 document consultation": lambda _, o, r: vsd.check_dp1_document_consultation(o, r),
+        "DP2 parameter order": lambda _, o, r: vsd.check_dp2_parameter_order(o, r),
+        "DP4 dependencies": lambda _, o, r: vsd.check_dp4_dependencies(o, r),
+        "DP5 human-in-the-loop": vsd.check_dp5_human_in_loop,
+        "DP6 mandatory sections": lambda _, o, r: vsd.check_dp6_mandatory_sections(o, r),
+        "DP6 late section order": lambda _, o, r: vsd.check_dp6_late_section_order(o, r),
+        "DP7 credential exposure": lambda _, o, r: vsd.check_dp7_credential_exposure(o, r),
+    }
+
+
+def run(bodies: list[tuple[str, str, Headings, int]], repeat: int) -> dict[str, float]:
+    """Seconds per phase summed over ``repeat`` passes through all bodies."""
+    timings: dict[str, float] = {"build_outline": 0.0}
+    checks = outline_checks()
+    timings.update({label: 0.0 for label in checks})
+    result = vsd.ValidationResult(path=Path("benchmark"))
+    for _ in range(repeat):
+        for name, body, headings, line_offset in bodies:
+            start = time.perf_counter()
+            outline = vsd.build_outline(body, headings, line_offset)
+            timings["build_outline"] += time.perf_counter() - start
+            for label, check in checks.items():
+                start = time.perf_counter()
+                check(name, outline, result)
+                timings[label] += time.perf_counter() - start
+        result.errors.clear()
+        result.warnings.clear()
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time the validate_skill_design checks over all SKILL.md files")
+    parser.add_argument("--repeat", type=int, default=50, help="Passes over all skills (default: 50)")
+    args = parser.parse_args()
+
+    bodies = load_bodies()
+    if not bodies:
+        print("No SKILL.md files found.")
+        return 1
+    total_bytes = sum(len(body.encode("utf-8")) for _, body, _, _ in bodies)
+    print(f"⏱️  {len(bodies)} skills, {total_bytes / 1024:.0f} KiB of markdown, {args.repeat} passes")
+
+    timings = run(bodies, args.repeat)
+    runs = len(bodies) * args.repeat
+    width = max(len(label) for label in timings)
+    for label, seconds in timings.items():
+        print(f"  {label:<{width}}  {seconds / runs * 1e6:8.1f} µs/skill")
+    total = sum(timings.values())
+    print(f"  {'total':<{width}}  {total / runs * 1e6:8.1f} µs/skill ({total / args.repeat * 1000:.2f} ms per pass)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
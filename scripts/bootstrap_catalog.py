@@ -16,7 +16,7 @@ from typing import Any, Dict, List, Tuple
 import yaml
 
 import pack_registry
-from generate_pack_data import parse_yaml_frontmatter
+from md_frontmatter import read_frontmatter
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 
@@ -58,7 +58,7 @@ def _skill_entries(pack_dir: str, root: Path) -> Tuple[List[Dict[str, Any]], Lis
     if not skills_dir.is_dir():
         return regular, orch
     for skill_md in sorted(skills_dir.glob("*/SKILL.md")):
-        fm = parse_yaml_frontmatter(skill_md)
+        fm = read_frontmatter(skill_md)
         dirname = skill_md.parent.name
         # Catalog skill name must match directory name (roster parity / compliance).
         name = dirname
@@ -1,20 +1,44 @@
 #!/usr/bin/env python3
 """
 Build the documentation website by combining pack data and MCP data into data.json.
+
+Incremental by default (see site_build_cache.py); pass --full to rebuild everything.
+--sharded additionally writes docs/data/ (index + per-pack shards, see site_data_shards.py).
 """
 
+import argparse
 import json
+import shutil
 import sys
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Set, Tuple
 
 # Import our data generators
+import pack_registry
 from catalog_site_bundle import bundle_catalog_for_site
 from eval_site_enrichment import apply_eval_enrichment
-from generate_collection_pages import generate_collection_pages
-from generate_pack_data import generate_pack_data
+from generate_collection_pages import RENDERER, generate_collection_pages
+from generate_pack_data import (
+    DOCS_PACK_DIRS,
+    build_federated_pack,
+    format_pack_timings,
+    load_plugin_titles,
+    parse_local_packs,
+    print_pack_parsed,
+)
 from generate_mcp_data import generate_mcp_data
+from site_build_cache import (
+    Manifest,
+    global_input_files,
+    iter_tree_files,
+    pack_input_files,
+    sha256_json,
+    write_if_changed,
+)
+from site_data_shards import remove_shards, write_shards
+from site_search_index import build_search_index
 
 
 def load_icons() -> Dict[str, Dict[str, str]]:
@@ -38,40 +62,140 @@ def load_icons() -> Dict[str, Dict[str, str]]:
         return {'packs': {}, 'mcp_servers': {}}
 
 
-def build_website():
+def finalize_pack(pack: Dict[str, Any], icons: Dict[str, Dict[str, str]], root: Path) -> None:
+    """Attach icon, resolved collection catalog and eval enrichment to one pack entry."""
+    pack_name = pack['name']
+    pack['icon'] = icons['packs'].get(pack_name, '')
+    catalog_dir = pack.get('catalog_dir', pack_name)
+    cat_bundle, cat_warns = bundle_catalog_for_site(catalog_dir, root)
+    for w in cat_warns:
+        print(f"⚠️  {w}")
+    if cat_bundle is not None:
+        pack['collection'] = cat_bundle
+    apply_eval_enrichment([pack], root)
+
+
+def collect_packs(
+    manifest: Manifest,
+    icons: Dict[str, Dict[str, str]],
+    root: Path,
+    jobs: Optional[int] = None,
+    only: Optional[Set[str]] = None,
+) -> Tuple[List[Dict[str, Any]], List[str], List[str], Dict[str, Dict[str, float]], float]:
+    """
+    Build (or reuse from *manifest*) every local and federated pack entry.
+    Local packs that need rebuilding are parsed together via parse_local_packs.
+    When *only* is given (watch mode), packs outside it are taken from the
+    manifest as stored, without re-hashing their input trees.
+
+    Returns:
+        (pack entries, rebuilt pack names, reused pack names, per-pack parse timings,
+        parse wall time in seconds)
+    """
+    plugin_titles = load_plugin_titles()
+    global_hash = manifest.inputs_hash(global_input_files(root), root)
+    packs: List[Dict[str, Any]] = []
+    rebuilt: List[str] = []
+    reused: List[str] = []
+
+    stale: Dict[str, str] = {}
+    for pack_dir in DOCS_PACK_DIRS:
+        if not (root / pack_dir).exists():
+            print(f"Warning: Pack directory {pack_dir} does not exist, skipping")
+            continue
+        if only is not None and pack_dir not in only:
+            pack = manifest.cached_pack(pack_dir)
+            if pack is not None:
+                reused.append(pack_dir)
+                packs.append(pack)
+                continue
+        key = sha256_json([global_hash, manifest.inputs_hash(pack_input_files(pack_dir, root), root)])
+        pack = manifest.load_pack(pack_dir, key)
+        if pack is None:
+            stale[pack_dir] = key
+        else:
+            reused.append(pack_dir)
+            packs.append(pack)
+
+    parsed, timings, parse_wall = parse_local_packs(list(stale), plugin_titles, jobs=jobs)
+    for pack in parsed:
+        print_pack_parsed(pack)
+        finalize_pack(pack, icons, root)
+        manifest.store_pack(pack['name'], stale[pack['name']], pack)
+        rebuilt.append(pack['name'])
+        packs.append(pack)
+
+    workdir: Optional[Path] = None
+    try:
+        for mod in pack_registry.load_federated_modules():
+            name = mod.get("name", "unknown")
+            if only is not None and name not in only:
+                pack = manifest.cached_pack(name)
+                if pack is not None:
+                    reused.append(name)
+                    packs.append(pack)
+                    continue
+            fed_inputs = iter_tree_files(root / "federation" / "modules" / name) + iter_tree_files(root / "eval" / name)
+            # The module entry pins repository + ref, so the remote content is part of the key.
+            key = sha256_json([global_hash, mod, manifest.inputs_hash(fed_inputs, root)])
+            pack = manifest.load_pack(name, key)
+            if pack is None:
+                if workdir is None:
+                    workdir = Path(tempfile.mkdtemp(prefix="federated-build-"))
+                pack = build_federated_pack(mod, plugin_titles, workdir, root)
+                if pack is None:
+                    continue
+                finalize_pack(pack, icons, root)
+                manifest.store_pack(name, key, pack)
+                rebuilt.append(name)
+            else:
+                reused.append(name)
+            packs.append(pack)
+    finally:
+        if workdir is not None:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    return packs, rebuilt, reused, timings, parse_wall
+
+
+def build_website(
+    full: bool = False,
+    jobs: Optional[int] = None,
+    sharded: bool = False,
+    only: Optional[Set[str]] = None,
+) -> int:
     """
     Generate the complete website data file.
+
+    Incremental by default: packs whose input files (pack tree, eval reports,
+    registry/title/icon files and generator scripts) are unchanged since the last
+    build are reused from the manifest, and outputs are only written when their
+    content changes. ``full=True`` ignores the manifest and rebuilds everything.
+    ``jobs`` is passed to parse_local_packs and generate_collection_pages (None = auto, 1 = serial).
+    ``sharded=True`` also writes the lazily loaded docs/data/ index and pack shards;
+    otherwise any docs/data/ left from an earlier sharded build is removed.
+    ``only`` limits input checking to these pack names (see collect_packs; used by
+    watch_website.py, which knows which packs a file change touches).
     """
     print("🔨 Building documentation website...")
     print()
 
+    root = Path(__file__).resolve().parent.parent
+    manifest = Manifest() if full else Manifest.load()
+
     # Load icons
     print("🎨 Loading icons...")
     icons = load_icons()
     print()
 
-    # Generate pack data
+    # Generate pack data (catalog bundle + eval enrichment happen per rebuilt pack)
     print("📦 Parsing agentic collections...")
-    pack_data = generate_pack_data()
-    
-    root = Path(__file__).resolve().parent.parent
-
-    # Merge pack icons and optional resolved collection catalog (for Pages UI)
-    for pack in pack_data:
-        pack_name = pack['name']
-        pack['icon'] = icons['packs'].get(pack_name, '')
-        catalog_dir = pack.get('catalog_dir', pack_name)
-        cat_bundle, cat_warns = bundle_catalog_for_site(catalog_dir, root)
-        for w in cat_warns:
-            print(f"⚠️  {w}")
-        if cat_bundle is not None:
-            pack['collection'] = cat_bundle
+    pack_data, rebuilt, reused, timings, parse_wall = collect_packs(manifest, icons, root, jobs=jobs, only=only)
+    if reused:
+        print(f"↺ Reused {len(reused)} unchanged pack(s): {', '.join(reused)}")
 
     # Keep pack cards deterministic and alphabetically ordered.
     pack_data = sorted(pack_data, key=lambda p: p['name'])
-
-    print("📊 Enriching packs with eval/reports (eval/<pack>/<skill>/report.json)...")
-    apply_eval_enrichment(pack_data, root)
     print()
 
     # Generate MCP server data
@@ -87,8 +211,12 @@ def build_website():
 
     # Generate static collection pages (fork-compatible UX)
     print("📄 Generating static collection pages...")
-    page_count = generate_collection_pages(pack_data, mcp_data)
-    print(f"✅ Generated {page_count} pages in docs/collections/")
+    pages = generate_collection_pages(pack_data, mcp_data, page_keys=manifest.pages, jobs=jobs)
+    print(
+        f"✅ {pages['pages']} pages in docs/collections/: {pages['written']} written, "
+        f"{pages['unchanged']} unchanged, {pages['skipped']} skipped, {pages['removed']} removed"
+    )
+    print(f"   Markdown fragments: {RENDERER.summary()}")
     print()
 
     # Combine into final output
@@ -101,31 +229,86 @@ def build_website():
         },
         'packs': pack_data,
         'mcp_servers': mcp_data,
-        'generated_at': datetime.now(timezone.utc).isoformat()
     }
 
     # Ensure docs directory exists
     docs_dir = Path('docs')
     docs_dir.mkdir(exist_ok=True)
 
-    # Write data.json
+    # Write data.json (generated_at only moves when the content does)
     output_file = docs_dir / 'data.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    content_hash = sha256_json(output)
+    if not full and output_file.is_file() and manifest.outputs.get(str(output_file)) == content_hash:
+        print(f"✅ {output_file} unchanged")
+    else:
+        output['generated_at'] = datetime.now(timezone.utc).isoformat()
+        write_if_changed(output_file, json.dumps(output, indent=2, ensure_ascii=False))
+        manifest.outputs[str(output_file)] = content_hash
+        print(f"✅ Generated {output_file}")
+
+    # Prebuilt search index used by app.js handleSearch
+    search_index = build_search_index(output['packs'], output['mcp_servers'])
+    search_file = docs_dir / 'search-index.json'
+    search_changed = write_if_changed(
+        search_file, json.dumps(search_index, ensure_ascii=False, separators=(',', ':'))
+    )
+    print(
+        f"✅ {'Generated' if search_changed else 'Unchanged'} {search_file} "
+        f"({len(search_index['tokens'])} tokens, {len(search_index['docs'])} documents)"
+    )
+
+    if sharded:
+        shard_stats = write_shards(output, docs_dir)
+        print(
+            f"✅ Generated {docs_dir / 'data'}/ "
+            f"({shard_stats['written']} shard(s) written, {shard_stats['unchanged']} unchanged, "
+            f"{shard_stats['removed']} removed; index {shard_stats['index_bytes'] // 1024} KiB)"
+        )
+    elif remove_shards(docs_dir):
+        print(f"🧹 Removed stale {docs_dir / 'data'}/ (not a sharded build)")
+
+    manifest.prune(p['name'] for p in pack_data)
+    manifest.save()
 
-    print(f"✅ Generated {output_file}")
     print()
     print("📊 Summary:")
-    print(f"   • {len(pack_data)} agentic collections")
+    print(f"   • {len(pack_data)} agentic collections ({len(rebuilt)} rebuilt, {len(reused)} reused)")
     total_skills = sum(len(p['skills']) for p in pack_data)
     total_agents = sum(len(p['agents']) for p in pack_data)
     print(f"   • {total_skills} skills")
     print(f"   • {total_agents} agents")
     print(f"   • {len(mcp_data)} MCP servers")
+    if timings:
+        print()
+        print("⏱️  Pack parse times:")
+        for line in format_pack_timings(timings, parse_wall):
+            print(f"   • {line}")
     print()
 
     return 0
 
 
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build docs/data.json and docs/collections/*.html")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore the incremental build manifest (.cache/site-build/) and rebuild everything",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for pack parsing and page rendering (default: auto, parallel only for large trees; 1 = serial)",
+    )
+    parser.add_argument(
+        "--sharded",
+        action="store_true",
+        help="Also write docs/data/index.json plus per-pack shards (gzip/brotli variants) loaded on demand by app.js",
+    )
+    args = parser.parse_args()
+    return build_website(full=args.full, jobs=args.jobs, sharded=args.sharded)
+
+
 if __name__ == '__main__':
-    sys.exit(build_website())
+    sys.exit(main())
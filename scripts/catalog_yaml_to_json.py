@@ -1,56 +1,101 @@
 #!/usr/bin/env python3
-"""Write deterministic .catalog/collection.json from .catalog/collection.yaml."""
+"""
+Write deterministic .catalog/collection.json from .catalog/collection.yaml.
+
+Only drifted mirrors are rewritten: an up-to-date collection.json is left untouched
+(mtime included), and a rewrite lists the JSON pointers that drifted. --check
+reports drift without writing and exits 1 when any mirror is stale.
+"""
 
 from __future__ import annotations
 
 import argparse
+import json
 import sys
 from pathlib import Path
-
-import yaml
+from typing import List
 
 import collection_validate_lib as cvl
 import pack_registry
+from md_frontmatter import load_yaml
 
 
-def mirror_pack(pack_dir: str, root: Path, dry_run: bool = False) -> None:
+def mirror_pack(pack_dir: str, root: Path, dry_run: bool = False, check: bool = False) -> bool:
+    """
+    Regenerate ``<pack_dir>/.catalog/collection.json`` when it drifted from collection.yaml.
+
+    Returns:
+        True when the mirror was stale (rewritten, or reported with ``check``)
+    """
     ypath = root / pack_dir / ".catalog" / "collection.yaml"
     jpath = root / pack_dir / ".catalog" / "collection.json"
     if not ypath.exists():
         raise FileNotFoundError(f"Missing {ypath}")
-    with open(ypath, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = load_yaml(ypath.read_text(encoding="utf-8"))
     text = cvl.collection_json_dumps(data)
     if dry_run:
         print(text, end="")
-        return
+        return False
+
+    current = jpath.read_text(encoding="utf-8") if jpath.exists() else None
+    if current == text:
+        return False
+    rel = jpath.relative_to(root)
+    if current is None:
+        summary = "new file"
+    else:
+        try:
+            drift = cvl.mirror_drift(data, json.loads(current))
+        except json.JSONDecodeError:
+            summary = "invalid JSON"
+        else:
+            summary = _drift_summary([d.pointer or "/" for d in drift])
+    if check:
+        print(f"Stale {rel} ({summary})")
+        return True
     jpath.parent.mkdir(parents=True, exist_ok=True)
     jpath.write_text(text, encoding="utf-8")
-    print(f"Wrote {jpath.relative_to(root)}")
+    print(f"Wrote {rel} ({summary})")
+    return True
+
+
+def _drift_summary(pointers: List[str], limit: int = 5) -> str:
+    if not pointers:
+        return "formatting only"
+    shown = ", ".join(pointers[:limit])
+    more = f" and {len(pointers) - limit} more" if len(pointers) > limit else ""
+    return f"drifted: {shown}{more}"
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument("--pack", help="Single pack directory name")
     parser.add_argument("--all", action="store_true", help="All union registry packs with collection.yaml")
     parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--check", action="store_true", help="Report stale mirrors without writing (exit 1 if any)")
     args = parser.parse_args()
     root = Path(__file__).resolve().parent.parent
+    stale = 0
     try:
         if args.all:
-            for p in pack_registry.get_union_pack_dirs(root):
-                if (root / p / ".catalog" / "collection.yaml").exists():
-                    mirror_pack(p, root, dry_run=args.dry_run)
-            for p in pack_registry.get_federation_module_dirs(root):
-                mirror_pack(p, root, dry_run=args.dry_run)
+            packs = [
+                p for p in pack_registry.get_union_pack_dirs(root)
+                if (root / p / ".catalog" / "collection.yaml").exists()
+            ]
+            packs += pack_registry.get_federation_module_dirs(root)
         elif args.pack:
-            mirror_pack(args.pack, root, dry_run=args.dry_run)
+            packs = [args.pack]
         else:
             parser.error("Provide --pack NAME or --all")
+        for p in packs:
+            stale += mirror_pack(p, root, dry_run=args.dry_run, check=args.check)
     except Exception as e:
         print(str(e), file=sys.stderr)
         return 1
-    return 0
+    if not args.dry_run:
+        verb = "stale" if args.check else "regenerated"
+        print(f"{stale} of {len(packs)} collection.json mirror(s) {verb}")
+    return 1 if args.check and stale else 0
 
 
 if __name__ == "__main__":
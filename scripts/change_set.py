@@ -0,0 +1,325 @@
+"""
+Git change-set resolution for incremental validation (``--changed``).
+
+Validators normally scan every pack. With ``--changed`` they ask this module
+which paths differ from a base ref and validate only the packs, skills and
+catalog files those paths touch:
+
+- ``git diff --name-status -M`` against the base (renames contribute both the
+  old and the new path, deletions are kept so dangling links are re-checked)
+- a path under a pack directory (registry pack or ``federation/modules/<name>``)
+  marks that pack; ``<pack>/skills/<name>/...`` also marks that skill
+- reverse dependencies: markdown files whose links resolve to a changed path
+  (for example a SKILL.md linking a shared doc through a ``docs/`` symlink)
+  are affected too
+- a change to a shared input (registry, schema, shared validator libraries or
+  the calling validator itself) means everything must be validated
+
+Base ref, in order: ``--base``; ``VALIDATE_INCLUDE_UNCOMMITTED=1`` (working tree
+vs HEAD plus untracked files); GitHub ``pull_request`` events
+(``origin/$GITHUB_BASE_REF...HEAD``); ``push`` events
+(``$GITHUB_EVENT_BEFORE..HEAD``); otherwise the working tree vs HEAD.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+import pack_registry
+from md_metadata_cache import get_metadata
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Paths whose change affects every pack's validation result.
+GLOBAL_VALIDATION_INPUTS = [
+    "catalog/schema.yaml",
+    "docs/plugins.json",
+    "marketplace/rh-agentic-collection.yml",
+    "scripts/change_set.py",
+    "scripts/collection_validate_lib.py",
+    "scripts/md_frontmatter.py",
+    "scripts/md_link_graph.py",
+    "scripts/md_metadata_cache.py",
+    "scripts/pack_registry.py",
+]
+
+NULL_SHA = "0" * 40
+
+
+class ChangeSetError(Exception):
+    """The change set could not be computed (not a git checkout, unknown base ref)."""
+
+
+def _git(args: List[str], root: Path) -> str:
+    try:
+        proc = subprocess.run(
+            ["git", *args], cwd=root, check=True, capture_output=True, text=True, timeout=60,
+        )
+    except FileNotFoundError as exc:
+        raise ChangeSetError("git is not installed") from exc
+    except subprocess.CalledProcessError as exc:
+        raise ChangeSetError(exc.stderr.strip() or str(exc)) from exc
+    except subprocess.TimeoutExpired as exc:
+        raise ChangeSetError("git operation timed out") from exc
+    return proc.stdout
+
+
+def parse_name_status(output: str) -> Set[str]:
+    """Paths from ``git diff --name-status -z``; renames and copies yield old and new path."""
+    paths: Set[str] = set()
+    fields = output.split("\0")
+    i = 0
+    while i < len(fields):
+        status = fields[i]
+        if not status:
+            i += 1
+            continue
+        count = 2 if status[0] in ("R", "C") else 1
+        paths.update(p for p in fields[i + 1:i + 1 + count] if p)
+        i += 1 + count
+    return paths
+
+
+def resolve_diff_range(base: Optional[str] = None) -> Optional[str]:
+    """
+    Diff range for ``git diff`` (see module docstring); None means working tree vs HEAD.
+
+    Raises:
+        ChangeSetError: push event without a usable "before" commit
+    """
+    if base:
+        return f"{base}...HEAD"
+    if os.environ.get("VALIDATE_INCLUDE_UNCOMMITTED"):
+        return None
+    event = os.environ.get("GITHUB_EVENT_NAME", "")
+    if event == "pull_request":
+        return f"origin/{os.environ.get('GITHUB_BASE_REF') or 'main'}...HEAD"
+    if event == "push":
+        before = os.environ.get("GITHUB_EVENT_BEFORE", "")
+        if not before or before == NULL_SHA:
+            raise ChangeSetError("no base commit for push event")
+        return f"{before}..HEAD"
+    return None
+
+
+def changed_paths(base: Optional[str] = None, root: Path = REPO_ROOT) -> Set[str]:
+    """Repo-relative paths added, modified, renamed (both sides) or deleted since the base."""
+    diff_range = resolve_diff_range(base)
+    if diff_range is None:
+        paths = parse_name_status(_git(["diff", "--name-status", "-M", "-z", "HEAD"], root))
+        untracked = _git(["ls-files", "--others", "--exclude-standard", "-z"], root)
+        paths.update(p for p in untracked.split("\0") if p)
+        return paths
+    if diff_range.startswith("origin/"):
+        # CI checkouts may not have the base branch yet (same as ci-validate-changed-skills.sh)
+        branch = diff_range[len("origin/"):].split("...", 1)[0]
+        subprocess.run(["git", "fetch", "origin", branch], cwd=root, capture_output=True, check=False)
+    return parse_name_status(_git(["diff", "--name-status", "-M", "-z", diff_range], root))
+
+
+def _is_external(target: str) -> bool:
+    return target.lower().startswith(("http://", "https://", "mailto:", "#"))
+
+
+@dataclass
+class ChangeSet:
+    """Changed paths mapped to the pack directories and skills they affect."""
+
+    root: Path
+    paths: Set[str]
+    pack_dirs: List[str] = field(default_factory=list)
+    global_changes: Set[str] = field(default_factory=set)
+    packs: Set[str] = field(default_factory=set)
+    skills: Dict[str, Set[str]] = field(default_factory=dict)
+
+    @property
+    def validate_all(self) -> bool:
+        return bool(self.global_changes)
+
+    def _changed_targets(self) -> Set[str]:
+        """Changed paths as absolute paths, plus their real paths when reached through symlinked dirs."""
+        targets: Set[str] = set()
+        for rel in self.paths:
+            path = self.root / rel
+            targets.add(os.path.normpath(path))
+            if not path.is_symlink():
+                targets.add(os.path.realpath(path))
+        return targets
+
+    def link_dependents(self, md_files: Iterable[Path]) -> List[Path]:
+        """
+        Markdown files with a local link that resolves (through symlinks) to a changed path.
+        Targets are tried relative to the file and to its pack root, matching both link validators.
+        """
+        changed = {p for p in self._changed_targets() if p.endswith(".md")}
+        if not changed:
+            return []
+        dependents: List[Path] = []
+        for md in md_files:
+            try:
+                links = get_metadata(md).links
+            except (OSError, UnicodeDecodeError):
+                continue
+            bases = [md.parent]
+            pack = self.pack_of(md)
+            if pack is not None:
+                bases.append(self.root / pack)
+            for _, raw in links:
+                target = raw.strip().split("#", 1)[0].strip()
+                if not target or _is_external(raw.strip()):
+                    continue
+                candidates = [b / target for b in bases]
+                if any(
+                    os.path.normpath(c) in changed or os.path.realpath(c) in changed
+                    for c in candidates
+                ):
+                    dependents.append(md)
+                    break
+        return dependents
+
+    def pack_of(self, path: Path) -> Optional[str]:
+        try:
+            rel = Path(os.path.abspath(path)).relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+        return _match_pack(rel, self.pack_dirs)
+
+    def affects_pack(self, pack_dir: str) -> bool:
+        return self.validate_all or pack_dir in self.packs
+
+    def affects_path(self, path: Path) -> bool:
+        """Whether the pack containing ``path`` (a pack dir or a file in one) is affected."""
+        return self.validate_all or self.pack_of(path) in self.packs
+
+    def filter_packs(self, pack_dirs: Iterable[str]) -> List[str]:
+        return [p for p in pack_dirs if self.affects_pack(p)]
+
+    def filter_skill_files(self, skill_files: Iterable[Path]) -> List[Path]:
+        """SKILL.md files of changed skills, plus those linking to a changed doc; order is kept."""
+        files = list(skill_files)
+        if self.validate_all:
+            return files
+        direct = {
+            f for f in files
+            if f.parent.name in self.skills.get(self.pack_of(f) or "", set())
+        }
+        selected = direct | set(self.link_dependents(f for f in files if f not in direct))
+        return [f for f in files if f in selected]
+
+
+def known_pack_dirs(root: Path = REPO_ROOT) -> List[str]:
+    """Registry packs and federation module dirs, longest first for prefix matching."""
+    dirs = pack_registry.get_union_pack_dirs(root) + pack_registry.get_federation_module_dirs(root)
+    return sorted(set(dirs), key=len, reverse=True)
+
+
+def _match_pack(rel: str, pack_dirs: List[str]) -> Optional[str]:
+    for pack in pack_dirs:
+        if rel == pack or rel.startswith(pack + "/"):
+            return pack
+    return None
+
+
+def build_change_set(
+    paths: Iterable[str],
+    root: Path = REPO_ROOT,
+    extra_global_inputs: Iterable[str] = (),
+) -> ChangeSet:
+    """Map changed repo-relative ``paths`` to packs and skills (see module docstring)."""
+    paths = set(paths)
+    pack_dirs = known_pack_dirs(root)
+    cs = ChangeSet(root=root, paths=paths, pack_dirs=pack_dirs)
+    global_inputs = set(GLOBAL_VALIDATION_INPUTS) | set(extra_global_inputs)
+    for rel in sorted(paths):
+        if rel in global_inputs:
+            cs.global_changes.add(rel)
+            continue
+        pack = _match_pack(rel, pack_dirs)
+        if pack is None:
+            continue
+        cs.packs.add(pack)
+        parts = rel[len(pack) + 1:].split("/")
+        if len(parts) >= 2 and parts[0] == "skills":
+            cs.skills.setdefault(pack, set()).add(parts[1])
+    # Packs that only link to a changed doc (e.g. shared docs reached through a symlink)
+    if not cs.validate_all and any(p.endswith(".md") for p in paths):
+        md_files: List[Path] = []
+        for pack in pack_dirs:
+            if pack not in cs.packs:
+                md_files.extend((root / pack).rglob("*.md"))
+        for md in cs.link_dependents(md_files):
+            pack = cs.pack_of(md)
+            if pack is not None:
+                cs.packs.add(pack)
+                rel_parts = md.relative_to(root / pack).parts
+                if len(rel_parts) >= 2 and rel_parts[0] == "skills":
+                    cs.skills.setdefault(pack, set()).add(rel_parts[1])
+    return cs
+
+
+def resolve_change_set(
+    base: Optional[str] = None,
+    root: Path = REPO_ROOT,
+    validator: Optional[str] = None,
+) -> ChangeSet:
+    """
+    Change set for a validator's ``--changed`` mode.
+
+    Args:
+        base: Base ref (default: from the environment, see module docstring)
+        root: Repository root
+        validator: The calling script (``__file__``); changes to it force a full run
+
+    Raises:
+        ChangeSetError: the diff could not be computed
+    """
+    extra = []
+    if validator:
+        try:
+            extra.append(Path(validator).resolve().relative_to(root).as_posix())
+        except ValueError:
+            pass
+    return build_change_set(changed_paths(base, root), root, extra)
+
+
+def describe(cs: ChangeSet) -> str:
+    """One-line summary for validator output."""
+    if cs.validate_all:
+        return f"{len(cs.paths)} changed path(s) include shared inputs ({', '.join(sorted(cs.global_changes))}); validating everything"
+    packs = ", ".join(sorted(cs.packs)) or "none"
+    return f"{len(cs.paths)} changed path(s); affected packs: {packs}"
+
+
+def add_changed_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--changed",
+        action="store_true",
+        help="Validate only what changed since the base ref (see change_set.py)",
+    )
+    parser.add_argument(
+        "--base",
+        default=None,
+        help="Base ref for --changed (default: from CI environment, else working tree vs HEAD)",
+    )
+
+
+def change_set_from_args(args: argparse.Namespace, validator: str) -> Optional[ChangeSet]:
+    """
+    ChangeSet for a validator run with --changed, or None for a full run (flag absent or
+    the diff could not be computed). Notes go to stderr so JSON output stays clean.
+    """
+    if not getattr(args, "changed", False):
+        return None
+    try:
+        cs = resolve_change_set(args.base, validator=validator)
+    except ChangeSetError as exc:
+        print(f"⚠️  --changed: {exc}; validating everything", file=sys.stderr)
+        return None
+    print(f"🔀 {describe(cs)}", file=sys.stderr)
+    return cs
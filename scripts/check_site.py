@@ -8,6 +8,8 @@ import json
 import sys
 from pathlib import Path
 
+from site_search_index import build_search_index, search_documents
+
 def load_data():
     """Load the generated data.json"""
     data_file = Path('docs/data.json')
@@ -19,6 +21,44 @@ def load_data():
     with open(data_file) as f:
         return json.load(f)
 
+def check_search_index(data):
+    """Verify docs/search-index.json answers name, multi-term and digit-only queries"""
+    print("\n🔎 Checking search index...")
+    index_file = Path('docs/search-index.json')
+    if not index_file.exists():
+        print("   ⚠️  docs/search-index.json not found (site falls back to substring search)")
+        return True
+
+    with open(index_file) as f:
+        index = json.load(f)
+
+    failures = []
+    docs = index['docs']
+    for pack in data['packs']:
+        hits = search_documents(index, pack['name'])
+        if not any(docs[i][0] == 'p' and docs[i][1] == pack['name'] for i in hits):
+            failures.append(f"pack {pack['name']!r} not found by its name")
+    for server in data['mcp_servers']:
+        if not search_documents(index, server['name']):
+            failures.append(f"MCP server {server['name']!r} not found by its name")
+    for token in index['tokens']:
+        if token.isdigit() and not search_documents(index, token):
+            failures.append(f"digit-only term {token!r} matches nothing")
+
+    # Single-character and digit-only terms must survive tokenizing ("rhel 9")
+    sample = build_search_index(
+        [{'name': 'rhel-9-pack', 'plugin': {'description': 'RHEL 9 and 10 on x86'}}], []
+    )
+    for query in ('rhel 9', '9', '10', 'x86', 'rhel 1'):
+        if not search_documents(sample, query):
+            failures.append(f"query {query!r} does not match the sample pack")
+
+    for failure in failures:
+        print(f"   ❌ {failure}")
+    if not failures:
+        print(f"   ✅ {len(index['tokens'])} tokens, {len(docs)} documents, queries resolve")
+    return not failures
+
 def print_summary(data):
     """Print a summary of what should appear on the site"""
     print("\n" + "="*60)
@@ -93,6 +133,7 @@ def print_checklist():
    □ Type in search bar
    □ Results filter dynamically
    □ Search works across: pack names, skills, agents, MCP servers
+   □ Digit terms narrow results (e.g. "rhel 9")
 
 7. Test responsive design:
    □ Resize browser window
@@ -111,6 +152,7 @@ def main():
 
     try:
         data = load_data()
+        search_ok = check_search_index(data)
         print_summary(data)
         print_checklist()
 
@@ -120,6 +162,9 @@ def main():
         print("   - Make changes to scripts and run 'make generate' to update data.json")
         print("   - The browser will need a refresh to see changes")
 
+        if not search_ok:
+            sys.exit(1)
+
     except Exception as e:
         print(f"\n❌ Error: {e}")
         sys.exit(1)
@@ -1,44 +1,27 @@
 #!/usr/bin/env bash
 # Validate only changed skills in CI (PRs and pushes to main).
-# Exits 0 if no skills changed or all changed skills pass validation.
+# Exits 0 if nothing relevant changed or all affected skills pass validation.
+#
+# The change set (base ref, renames/deletions, skills linking a changed doc) is
+# resolved by scripts/change_set.py from GITHUB_EVENT_NAME, GITHUB_BASE_REF and
+# GITHUB_EVENT_BEFORE; see --changed on each validator.
 #
 # Local dev: set VALIDATE_INCLUDE_UNCOMMITTED=1 to include staged and unstaged changes.
 
 set -e
 
-if [ -n "$VALIDATE_INCLUDE_UNCOMMITTED" ]; then
-  # Local dev: include staged + unstaged changes vs HEAD
-  DIFF_CMD="git diff --name-only HEAD"
-elif [ "$GITHUB_EVENT_NAME" = "pull_request" ]; then
-  # Three-dot diff: merge-base(base, HEAD)..HEAD = changes in the PR
-  BASE_REF="${GITHUB_BASE_REF:-main}"
-  git fetch origin "$BASE_REF" 2>/dev/null || true
-  DIFF_CMD="git diff --name-only origin/$BASE_REF...HEAD"
-elif [ "$GITHUB_EVENT_NAME" = "push" ]; then
-  # Push event: diff between before and after
+# A push without a usable "before" SHA (new branch, force push) has nothing to diff
+# against; skip as before rather than letting --changed fall back to a full run.
+if [ -z "$VALIDATE_INCLUDE_UNCOMMITTED" ] && [ "$GITHUB_EVENT_NAME" = "push" ]; then
   BEFORE="${GITHUB_EVENT_BEFORE:-}"
   if [ -z "$BEFORE" ] || [ "$BEFORE" = "0000000000000000000000000000000000000000" ]; then
     echo "No base commit for diff, skipping skill design validation"
     exit 0
   fi
-  DIFF_CMD="git diff --name-only $BEFORE HEAD"
-else
-  # Default: local dev, include uncommitted changes
-  DIFF_CMD="git diff --name-only HEAD"
-fi
-
-CHANGED=$($DIFF_CMD 2>/dev/null | grep -E '^[^/]+/skills/[^/]+/SKILL\.md$' | grep -v '^\.claude/' || true)
-
-if [ -z "$CHANGED" ]; then
-  echo "No skills changed, skipping skill design validation"
-  exit 0
 fi
 
-echo "Validating changed skills:"
-echo "$CHANGED" | sed 's/^/  - /'
+# Every pack with a skills/ directory; --changed narrows this to what the diff touches
+PACKS=$(for d in */skills; do dirname "$d"; done | tr '\n' ' ')
 
-# Run validators on changed skills only
-SKILL_ARGS=$(echo "$CHANGED" | tr '\n' ' ')
-uv run python scripts/validate_skill_design.py $SKILL_ARGS
-uv run python scripts/validate_skill_doc_links.py $SKILL_ARGS
-uv run python scripts/validate_docs_tree_links.py $SKILL_ARGS
+uv run python scripts/validate_skill_design.py --changed $PACKS
+uv run python scripts/validate_links.py --changed $PACKS
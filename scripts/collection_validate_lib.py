@@ -1,20 +1,29 @@
 """
 Shared validation for <pack>/.catalog/collection.yaml (JSON Schema in catalog/schema.yaml, roster, banners,
 #fragment refs on top-level prose fields, JSON mirror).
-Used by validate_collection_schema.py and validate_collection_compliance.py.
+Used by validate_collection_schema.py, validate_collection_compliance.py and validate_catalogs.py.
+
+The schema and compiled validator are loaded once per process, and each collection.yaml is
+read and parsed (C YAML loader when available) once per process, memoized by path, mtime and
+size. validate_catalogs_batch runs every check for all packs in one process with per-check timings.
 """
 
 from __future__ import annotations
 
+import copy
 import json
 import re
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Collection, Dict, List, Optional, Set, Tuple
 
 import yaml
 from jsonschema import Draft202012Validator
 
 import pack_registry
+from json_tree_diff import TreeDiff, diff_trees
+from md_frontmatter import YamlLoader, load_yaml
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 SCHEMA_YAML_PATH = REPO_ROOT / "catalog" / "schema.yaml"
@@ -37,6 +46,9 @@ DEPRECATED_CATALOG_FILE_KEYS = (
     "security_model_file",
 )
 
+# describe_json_mirror_drift reports at most this many drifted fields per pack.
+MAX_DRIFT_REPORTS = 20
+
 # Top-level fields that may be inline markdown or a one-line `#fragment.md` (validation + site bundle).
 CATALOG_FRAGMENT_FIELD_KEYS = (
     "documentation_section",
@@ -47,6 +59,8 @@ CATALOG_FRAGMENT_FIELD_KEYS = (
 
 _SCHEMA_CACHE: Optional[Dict[str, Any]] = None
 _VALIDATOR_CACHE: Optional[Draft202012Validator] = None
+# (resolved path, mtime_ns, size) -> (raw text, parsed YAML)
+_CATALOG_CACHE: Dict[Tuple[str, int, int], Tuple[str, Any]] = {}
 
 
 def normalize_external_file_ref(ref: str) -> str:
@@ -85,8 +99,7 @@ def _load_schema() -> Dict[str, Any]:
     path = SCHEMA_YAML_PATH if SCHEMA_YAML_PATH.exists() else None
     if not path:
         raise FileNotFoundError(f"Missing catalog schema at {SCHEMA_YAML_PATH}")
-    with open(path, "r", encoding="utf-8") as f:
-        _SCHEMA_CACHE = yaml.safe_load(f)
+    _SCHEMA_CACHE = load_yaml(path.read_text(encoding="utf-8"))
     Draft202012Validator.check_schema(_SCHEMA_CACHE)
     _VALIDATOR_CACHE = Draft202012Validator(_SCHEMA_CACHE)
     return _SCHEMA_CACHE
@@ -103,15 +116,32 @@ def collection_json_dumps(data: Any) -> str:
     return json.dumps(data, ensure_ascii=False, sort_keys=True, indent=2) + "\n"
 
 
+def _load_catalog_file(path: Path) -> Tuple[str, Any]:
+    """(text, parsed YAML) of ``path``, read and parsed once per process unless the file changes."""
+    st = path.stat()
+    key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+    cached = _CATALOG_CACHE.get(key)
+    if cached is None:
+        text = path.read_text(encoding="utf-8")
+        cached = _CATALOG_CACHE[key] = (text, load_yaml(text))
+    return cached
+
+
+def clear_catalog_cache() -> None:
+    """Drop memoized collection.yaml reads and position indexes (long-running processes such as a watch loop)."""
+    _CATALOG_CACHE.clear()
+    _POSITION_INDEX_CACHE.clear()
+
+
 def read_yaml_catalog(pack_dir: str, root: Optional[Path] = None) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+    """Parsed collection.yaml of ``pack_dir`` (a copy; mutating it does not affect the cache) or errors."""
     root = root or REPO_ROOT
     p = root / pack_dir / ".catalog" / "collection.yaml"
     if not p.exists():
         return None, [f"{pack_dir}: missing {p.relative_to(root)}"]
     try:
-        with open(p, "r", encoding="utf-8") as f:
-            raw = f.read()
-        data = yaml.safe_load(raw)
+        _, data = _load_catalog_file(p)
+        data = copy.deepcopy(data)
         if not isinstance(data, dict):
             return None, [f"{pack_dir}: collection.yaml must parse to a mapping"]
         return data, []
@@ -124,55 +154,125 @@ def catalog_yaml_path(pack_dir: str, root: Optional[Path] = None) -> Path:
     return root / pack_dir / ".catalog" / "collection.yaml"
 
 
-def _parse_yaml_scalar(value: str) -> str:
-    value = value.strip()
-    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
-        return value[1:-1]
-    return value
+YamlPath = Tuple[Any, ...]
 
 
-def _find_top_level_key_line(yaml_path: Path, key: str) -> Optional[int]:
-    pattern = re.compile(rf"^{re.escape(key)}:\s")
-    for line_no, line in enumerate(yaml_path.read_text(encoding="utf-8").splitlines(), 1):
-        if pattern.match(line):
-            return line_no
-    return None
+@dataclass(frozen=True)
+class YamlPosition:
+    """1-based line and column of a YAML node."""
+
+    line: int
+    column: int
+
+
+class YamlPositionIndex:
+    """
+    Key path -> position for one YAML document, from the parser's node marks.
+
+    A path is a tuple of mapping keys (str) and sequence indexes (int), e.g.
+    ``("contents", "skills", 2, "name")``. Mapping entries point at the key, sequence
+    items at the item; layout (indentless sequences, flow style, quoting) does not matter.
+    """
+
+    def __init__(self, positions: Optional[Dict[YamlPath, YamlPosition]] = None) -> None:
+        self.positions = positions or {}
+
+    def position(self, *path: Any) -> Optional[YamlPosition]:
+        return self.positions.get(tuple(path))
+
+    def line(self, *path: Any) -> Optional[int]:
+        pos = self.positions.get(tuple(path))
+        return pos.line if pos else None
+
+
+def build_yaml_position_index(text: str) -> YamlPositionIndex:
+    """Position index of ``text``; empty when it is not valid YAML."""
+    try:
+        root = yaml.compose(text, Loader=YamlLoader)
+    except yaml.YAMLError:
+        return YamlPositionIndex()
+    positions: Dict[YamlPath, YamlPosition] = {}
+    if root is None:
+        return YamlPositionIndex(positions)
+    positions[()] = YamlPosition(root.start_mark.line + 1, root.start_mark.column + 1)
+    stack: List[Tuple[YamlPath, yaml.Node, frozenset]] = [((), root, frozenset())]
+    while stack:
+        path, node, ancestors = stack.pop()
+        if id(node) in ancestors:
+            continue  # recursive alias
+        ancestors = ancestors | {id(node)}
+        if isinstance(node, yaml.MappingNode):
+            for key_node, value_node in node.value:
+                if not isinstance(key_node, yaml.ScalarNode):
+                    continue
+                child = path + (key_node.value,)
+                positions.setdefault(child, YamlPosition(key_node.start_mark.line + 1, key_node.start_mark.column + 1))
+                stack.append((child, value_node, ancestors))
+        elif isinstance(node, yaml.SequenceNode):
+            for i, item in enumerate(node.value):
+                child = path + (i,)
+                positions[child] = YamlPosition(item.start_mark.line + 1, item.start_mark.column + 1)
+                stack.append((child, item, ancestors))
+    return YamlPositionIndex(positions)
+
+
+_POSITION_INDEX_CACHE: Dict[Tuple[str, int, int], YamlPositionIndex] = {}
+
+
+def catalog_position_index(yaml_path: Path) -> YamlPositionIndex:
+    """Position index of a collection.yaml, built once per process unless the file changes."""
+    st = yaml_path.stat()
+    key = (str(yaml_path.resolve()), st.st_mtime_ns, st.st_size)
+    index = _POSITION_INDEX_CACHE.get(key)
+    if index is None:
+        try:
+            text, _ = _load_catalog_file(yaml_path)
+        except yaml.YAMLError:
+            index = YamlPositionIndex()
+        else:
+            index = build_yaml_position_index(text)
+        _POSITION_INDEX_CACHE[key] = index
+    return index
+
+
+def _catalog_data_or_empty(yaml_path: Path) -> Dict[str, Any]:
+    try:
+        _, data = _load_catalog_file(yaml_path)
+    except (OSError, yaml.YAMLError):
+        return {}
+    return data if isinstance(data, dict) else {}
 
 
 def catalog_skill_name_line_map(yaml_path: Path) -> Dict[str, int]:
     """Map skill name to 1-based line number in contents.skills / orchestration_skills."""
-    lines = yaml_path.read_text(encoding="utf-8").splitlines()
-    section: Optional[str] = None
+    index = catalog_position_index(yaml_path)
+    contents = _catalog_data_or_empty(yaml_path).get("contents")
     result: Dict[str, int] = {}
-    for line_no, line in enumerate(lines, 1):
-        if re.match(r"^  skills:\s*$", line):
-            section = "skills"
-            continue
-        if re.match(r"^  orchestration_skills:\s*$", line):
-            section = "orchestration_skills"
-            continue
-        if section and re.match(r"^  \S", line) and not line.startswith("    "):
-            section = None
-        match = re.match(r"^    - name:\s*(.+?)\s*$", line)
-        if match and section in {"skills", "orchestration_skills"}:
-            result[_parse_yaml_scalar(match.group(1))] = line_no
+    if not isinstance(contents, dict):
+        return result
+    for group in ("skills", "orchestration_skills"):
+        items = contents.get(group)
+        for i, item in enumerate(items if isinstance(items, list) else []):
+            if not isinstance(item, dict) or item.get("name") is None:
+                continue
+            line = index.line("contents", group, i, "name")
+            if line:
+                result[str(item["name"])] = line
     return result
 
 
 def catalog_decision_guide_skill_line_map(yaml_path: Path) -> Dict[str, int]:
     """Map skill_to_use value to 1-based line number in skills_decision_guide."""
-    lines = yaml_path.read_text(encoding="utf-8").splitlines()
-    in_guide = False
+    index = catalog_position_index(yaml_path)
+    contents = _catalog_data_or_empty(yaml_path).get("contents")
     result: Dict[str, int] = {}
-    for line_no, line in enumerate(lines, 1):
-        if re.match(r"^  skills_decision_guide:\s*$", line):
-            in_guide = True
+    guide = contents.get("skills_decision_guide") if isinstance(contents, dict) else None
+    for i, row in enumerate(guide if isinstance(guide, list) else []):
+        if not isinstance(row, dict) or row.get("skill_to_use") is None:
             continue
-        if in_guide and re.match(r"^  \S", line) and not line.startswith("    "):
-            in_guide = False
-        match = re.match(r"^      skill_to_use:\s*(.+?)\s*$", line)
-        if match and in_guide:
-            result[_parse_yaml_scalar(match.group(1))] = line_no
+        line = index.line("contents", "skills_decision_guide", i, "skill_to_use")
+        if line:
+            result[str(row["skill_to_use"])] = line
     return result
 
 
@@ -181,10 +281,29 @@ def _yaml_loc(pack_dir: str, yaml_path: Path, line: Optional[int], root: Path) -
     return f"{rel}:{line}" if line else str(rel)
 
 
+def _short_repr(value: Any, limit: int = 80) -> str:
+    text = repr(value)
+    return text if len(text) <= limit else text[: limit - 3] + "..."
+
+
+def _nearest_line(index: YamlPositionIndex, path: Tuple[Any, ...]) -> Optional[int]:
+    """Line of ``path``, or of its closest ancestor present in the YAML."""
+    for end in range(len(path), 0, -1):
+        line = index.line(*path[:end])
+        if line:
+            return line
+    return None
+
+
+def mirror_drift(yaml_data: Any, json_data: Any) -> List[TreeDiff]:
+    """Structural differences between collection.yaml data (left) and collection.json data (right)."""
+    return diff_trees(yaml_data, json_data)
+
+
 def describe_json_mirror_drift(
     pack_dir: str, yaml_data: Dict[str, Any], root: Optional[Path] = None,
 ) -> List[str]:
-    """Explain how collection.json differs from collection.yaml with field paths and line numbers."""
+    """Explain how collection.json differs from collection.yaml with JSON pointers and YAML line numbers."""
     root = root or REPO_ROOT
     yaml_path = catalog_yaml_path(pack_dir, root)
     json_path = root / pack_dir / ".catalog" / "collection.json"
@@ -194,44 +313,25 @@ def describe_json_mirror_drift(
         return [f"{pack_dir}: .catalog/collection.json is invalid JSON: {exc}"]
 
     errs: List[str] = []
-    skill_lines = catalog_skill_name_line_map(yaml_path)
-    reg_y, orch_y = catalog_skill_names(yaml_data)
-    reg_j, orch_j = catalog_skill_names(json_data)
-
-    for group, ylist, jlist in (
-        ("contents.skills", reg_y, reg_j),
-        ("contents.orchestration_skills", orch_y, orch_j),
-    ):
-        if ylist == jlist:
-            continue
-        max_len = max(len(ylist), len(jlist))
-        for i in range(max_len):
-            yn = ylist[i] if i < len(ylist) else None
-            jn = jlist[i] if i < len(jlist) else None
-            if yn == jn:
-                continue
-            line = skill_lines.get(str(yn or "")) or skill_lines.get(str(jn or ""))
-            loc = _yaml_loc(pack_dir, yaml_path, line, root)
-            errs.append(
-                f"{pack_dir}: {loc} {group}[{i}].name out of sync: "
-                f"collection.yaml={yn!r}, collection.json={jn!r}"
-            )
-
-    for key in ("version", "description", "name", "id", "maturity"):
-        yv = yaml_data.get(key)
-        jv = json_data.get(key)
-        if yv != jv:
-            line = _find_top_level_key_line(yaml_path, key)
-            loc = _yaml_loc(pack_dir, yaml_path, line, root)
-            errs.append(
-                f"{pack_dir}: {loc} {key} out of sync: "
-                f"collection.yaml={yv!r}, collection.json={jv!r}"
-            )
+    drift = mirror_drift(yaml_data, json_data)
+    index = catalog_position_index(yaml_path) if drift and yaml_path.is_file() else YamlPositionIndex()
+    for d in drift[:MAX_DRIFT_REPORTS]:
+        loc = _yaml_loc(pack_dir, yaml_path, _nearest_line(index, d.left_path), root)
+        pointer = d.pointer or "/"
+        if d.kind == "removed":
+            detail = f"missing from collection.json (collection.yaml={_short_repr(d.left)})"
+        elif d.kind == "added":
+            detail = f"only in collection.json (collection.json={_short_repr(d.right)})"
+        else:
+            detail = f"out of sync: collection.yaml={_short_repr(d.left)}, collection.json={_short_repr(d.right)}"
+        errs.append(f"{pack_dir}: {loc} {pointer} {detail}")
+    if len(drift) > MAX_DRIFT_REPORTS:
+        errs.append(f"{pack_dir}: ... and {len(drift) - MAX_DRIFT_REPORTS} more drifted field(s)")
 
     if not errs:
         errs.append(
             f"{pack_dir}: .catalog/collection.json content differs from collection.yaml "
-            "(run diff or regenerate JSON to inspect)"
+            "(same data, different formatting or key order)"
         )
     errs.append(
         f"{pack_dir}: regenerate mirror with: "
@@ -246,9 +346,11 @@ def validate_yaml_banner(pack_dir: str, root: Optional[Path] = None) -> List[str
     if not p.exists():
         return []
     try:
-        text = p.read_text(encoding="utf-8")
+        text, _ = _load_catalog_file(p)
     except OSError as e:
         return [f"{pack_dir}: cannot read collection.yaml: {e}"]
+    except yaml.YAMLError:
+        text = p.read_text(encoding="utf-8")
     head = "\n".join(text.splitlines()[:40])
     missing = [m for m in YAML_BANNER_MARKERS if m not in head]
     if missing:
@@ -427,6 +529,7 @@ def catalog_skill_names(data: Dict[str, Any]) -> Tuple[List[str], List[str]]:
 
 
 def validate_skill_roster(pack_dir: str, data: Dict[str, Any], root: Optional[Path] = None) -> List[str]:
+    root = root or REPO_ROOT
     disk = set(list_disk_skill_names(pack_dir, root))
     reg, orch = catalog_skill_names(data)
     yaml_names = reg + orch
@@ -436,9 +539,13 @@ def validate_skill_roster(pack_dir: str, data: Dict[str, Any], root: Optional[Pa
         errs.append(f"{pack_dir}: duplicate skill name in contents.skills / orchestration_skills")
 
     seen = set(reg) | set(orch)
+    yaml_path = catalog_yaml_path(pack_dir, root)
+    skill_lines = catalog_skill_name_line_map(yaml_path) if yaml_path.is_file() else {}
     for n in reg + orch:
         if n not in disk:
-            errs.append(f"{pack_dir}: YAML lists skill {n!r} with no skills/{n}/SKILL.md on disk")
+            line = skill_lines.get(n)
+            loc = f"{_yaml_loc(pack_dir, yaml_path, line, root)} " if line else ""
+            errs.append(f"{pack_dir}: {loc}YAML lists skill {n!r} with no skills/{n}/SKILL.md on disk")
 
     for d in disk:
         if d not in seen:
@@ -464,6 +571,36 @@ def validate_schema_instance(pack_dir: str, data: Dict[str, Any]) -> List[str]:
     return errs
 
 
+CatalogCheck = Tuple[str, Callable[[], List[str]]]
+
+
+def iteration3_checks(
+    pack_dir: str, data: Dict[str, Any], root: Path, check_banner: bool = True,
+    is_federated: bool = False,
+) -> List[CatalogCheck]:
+    """Named Iteration 3 checks over parsed ``data``, in reporting order."""
+    checks: List[CatalogCheck] = [
+        ("deprecated_keys", lambda: validate_deprecated_catalog_file_keys(pack_dir, data)),
+        ("schema", lambda: validate_schema_instance(pack_dir, data)),
+        ("fragment_refs", lambda: validate_file_refs(pack_dir, data, root)),
+    ]
+    if not is_federated:
+        checks.append(("roster", lambda: validate_skill_roster(pack_dir, data, root)))
+    if check_banner:
+        checks.append(("banner", lambda: validate_yaml_banner(pack_dir, root)))
+    return checks
+
+
+def iteration5_checks(
+    pack_dir: str, data: Dict[str, Any], root: Path, is_federated: bool = False,
+) -> List[CatalogCheck]:
+    """Named checks Iteration 5 adds on top of Iteration 3, in reporting order."""
+    return [
+        ("semantic", lambda: validate_pack_catalog_compliance_extra(pack_dir, data, root, is_federated=is_federated)),
+        ("json_mirror", lambda: validate_json_mirror(pack_dir, data, root)),
+    ]
+
+
 def validate_pack_iteration3(
     pack_dir: str, root: Optional[Path] = None, check_banner: bool = True,
     is_federated: bool = False,
@@ -478,13 +615,8 @@ def validate_pack_iteration3(
     if errs or data is None:
         return errs
     out: List[str] = []
-    out.extend(validate_deprecated_catalog_file_keys(pack_dir, data))
-    out.extend(validate_schema_instance(pack_dir, data))
-    out.extend(validate_file_refs(pack_dir, data, root))
-    if not is_federated:
-        out.extend(validate_skill_roster(pack_dir, data, root))
-    if check_banner:
-        out.extend(validate_yaml_banner(pack_dir, root))
+    for _, check in iteration3_checks(pack_dir, data, root, check_banner, is_federated):
+        out.extend(check())
     return out
 
 
@@ -497,8 +629,8 @@ def validate_pack_iteration5(
     data, e = read_yaml_catalog(pack_dir, root)
     errs.extend(e)
     if data:
-        errs.extend(validate_pack_catalog_compliance_extra(pack_dir, data, root, is_federated=is_federated))
-        errs.extend(validate_json_mirror(pack_dir, data, root))
+        for _, check in iteration5_checks(pack_dir, data, root, is_federated):
+            errs.extend(check())
     return errs
 
 
@@ -591,29 +723,163 @@ def validate_catalog_inline_length(pack_dir: str, data: Dict[str, Any]) -> List[
     return errs
 
 
-def validate_all_iteration3(root: Optional[Path] = None, check_banner: bool = True) -> List[str]:
+def _selected(pack: str, packs: Optional[Collection[str]]) -> bool:
+    return packs is None or pack in packs
+
+
+def validate_all_iteration3(
+    root: Optional[Path] = None,
+    check_banner: bool = True,
+    packs: Optional[Collection[str]] = None,
+) -> List[str]:
+    """Iteration 3 checks for every registry pack and federation module (or only ``packs``)."""
     root = root or REPO_ROOT
     all_errs: List[str] = []
     for pack in pack_registry.get_union_pack_dirs(root):
+        if not _selected(pack, packs):
+            continue
         cat = root / pack / ".catalog" / "collection.yaml"
         if not cat.exists():
             all_errs.append(f"{pack}: missing .catalog/collection.yaml")
             continue
         all_errs.extend(validate_pack_iteration3(pack, root, check_banner=check_banner))
     for fed in pack_registry.get_federation_module_dirs(root):
-        all_errs.extend(validate_pack_iteration3(fed, root, check_banner=check_banner, is_federated=True))
+        if _selected(fed, packs):
+            all_errs.extend(validate_pack_iteration3(fed, root, check_banner=check_banner, is_federated=True))
     return all_errs
 
 
-def validate_all_iteration5(root: Optional[Path] = None) -> List[str]:
+def validate_all_iteration5(root: Optional[Path] = None, packs: Optional[Collection[str]] = None) -> List[str]:
+    """Iteration 5 (full compliance) for every registry pack and federation module (or only ``packs``)."""
     root = root or REPO_ROOT
     all_errs: List[str] = []
     for pack in pack_registry.get_union_pack_dirs(root):
+        if not _selected(pack, packs):
+            continue
         cat = root / pack / ".catalog" / "collection.yaml"
         if not cat.exists():
             all_errs.append(f"{pack}: missing .catalog/collection.yaml")
             continue
         all_errs.extend(validate_pack_iteration5(pack, root))
     for fed in pack_registry.get_federation_module_dirs(root):
-        all_errs.extend(validate_pack_iteration5(fed, root, is_federated=True))
+        if _selected(fed, packs):
+            all_errs.extend(validate_pack_iteration5(fed, root, is_federated=True))
     return all_errs
+
+
+@dataclass
+class CatalogBatchReport:
+    """Outcome of validate_catalogs_batch: errors in pack order and cumulative seconds per check."""
+
+    packs: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=dict)
+    error_counts: Dict[str, int] = field(default_factory=dict)
+
+    def run(self, name: str, check: Callable[[], List[str]]) -> List[str]:
+        """Run one named check, adding its wall time and error count to the totals."""
+        start = time.perf_counter()
+        errs = check()
+        self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+        self.error_counts[name] = self.error_counts.get(name, 0) + len(errs)
+        return errs
+
+
+def _compile_schema() -> List[str]:
+    get_validator()
+    return []
+
+
+def _federation_cross_check(
+    fed_dir: str, module: Dict[str, Any], compliance_errors: List[str], root: Path,
+) -> List[str]:
+    """validate_federation_catalog checks for one module, minus the compliance errors already reported."""
+    from validate_federation_catalog import run_catalog_validation
+
+    report = run_catalog_validation(
+        module_name=module.get("name", ""),
+        repo_url=module.get("repository", ""),
+        ref=module.get("ref", ""),
+        pack_path=module.get("path", "."),
+        module_meta=module,
+        repo_root=root,
+        compliance_errors=compliance_errors,
+    )
+    return [
+        f"{fed_dir}: {c.name}: {detail}"
+        for c in report.checks
+        if not c.passed and c.name != "catalog_compliance"
+        for detail in c.details
+    ]
+
+
+def validate_catalogs_batch(
+    root: Optional[Path] = None,
+    packs: Optional[Collection[str]] = None,
+    federation_cross_check: bool = True,
+) -> CatalogBatchReport:
+    """
+    Iteration 3 + Iteration 5 for every registry pack and federation module (or only ``packs``),
+    then the federated catalog cross-check against each external repo at its pinned ref.
+
+    Replaces running validate_collection_schema.py, validate_collection_compliance.py and
+    validate_federation_catalog_all.py as separate processes: the schema is compiled once and
+    each collection.yaml is parsed once. Errors match validate_all_iteration5 (read errors are
+    reported once) followed by cross-check failures.
+    """
+    root = root or REPO_ROOT
+    report = CatalogBatchReport()
+    report.run("load_schema", _compile_schema)
+
+    targets = [(p, False) for p in pack_registry.get_union_pack_dirs(root) if _selected(p, packs)]
+    targets += [(f, True) for f in pack_registry.get_federation_module_dirs(root) if _selected(f, packs)]
+    report.packs = [p for p, _ in targets]
+
+    parsed: Dict[str, Tuple[Optional[Dict[str, Any]], List[str]]] = {}
+
+    def parse_all() -> List[str]:
+        errs: List[str] = []
+        for pack, is_federated in targets:
+            if not is_federated and not catalog_yaml_path(pack, root).exists():
+                parsed[pack] = (None, [f"{pack}: missing .catalog/collection.yaml"])
+            else:
+                parsed[pack] = read_yaml_catalog(pack, root)
+            errs.extend(parsed[pack][1])
+        return errs
+
+    report.run("parse", parse_all)
+
+    per_pack: Dict[str, List[str]] = {}
+    for pack, is_federated in targets:
+        data, errs = parsed[pack]
+        out = per_pack[pack] = list(errs)
+        if data is None:
+            continue
+        checks = iteration3_checks(pack, data, root, True, is_federated)
+        checks += iteration5_checks(pack, data, root, is_federated)
+        for name, check in checks:
+            out.extend(report.run(name, check))
+
+    if federation_cross_check:
+        modules = {m.get("name", ""): m for m in pack_registry.load_federated_modules()}
+        for pack, is_federated in targets:
+            module = modules.get(pack.rsplit("/", 1)[-1]) if is_federated else None
+            if module is None:
+                continue
+            per_pack[pack].extend(report.run(
+                "federation_cross_check",
+                lambda: _federation_cross_check(pack, module, per_pack[pack], root),
+            ))
+
+    for pack in report.packs:
+        report.errors.extend(per_pack[pack])
+    return report
+
+
+def format_batch_timings(report: CatalogBatchReport) -> List[str]:
+    """One line per check: cumulative milliseconds and error count, slowest first."""
+    width = max((len(name) for name in report.timings), default=0)
+    return [
+        f"{name:<{width}}  {seconds * 1000:8.1f} ms  {report.error_counts.get(name, 0)} error(s)"
+        for name, seconds in sorted(report.timings.items(), key=lambda kv: kv[1], reverse=True)
+    ]
@@ -0,0 +1,144 @@
+"""
+Persistent clone cache for federated module repositories.
+
+Every consumer of federated packs (generate_pack_data.load_federated_packs,
+fetch_federated_skills, validate_federation and the catalog cross-check) needs
+one external repository at one pinned commit. Instead of a full
+``git clone`` into a throwaway directory each time, repositories are kept as
+bare repos under ``.cache/federation-repos/<sha256(url)[:16]>.git`` and:
+
+- only the pinned commit is fetched (``git fetch --depth 1 origin <sha>``), and
+  only when it is not already present; servers that refuse fetching by SHA fall
+  back to one full fetch of branches and tags
+- the checkout is a detached ``git worktree`` at the requested destination with a
+  cone-mode sparse checkout of the module ``path`` (root files such as LICENSE
+  are always included in cone mode)
+
+Callers own the destination directory and may delete it when done; stale
+worktree registrations are pruned on the next checkout. Set
+``FEDERATION_CLONE_CACHE`` to use another cache directory.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import os
+import subprocess
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import pack_registry
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_DIR = REPO_ROOT / ".cache" / "federation-repos"
+
+FETCH_TIMEOUT = 120
+CHECKOUT_TIMEOUT = 30
+
+
+class CloneError(Exception):
+    """A federated repository could not be fetched or checked out at its ref."""
+
+
+def cache_dir() -> Path:
+    override = os.environ.get("FEDERATION_CLONE_CACHE", "").strip()
+    return Path(override) if override else DEFAULT_CACHE_DIR
+
+
+def bare_repo_path(repository: str) -> Path:
+    """Cache location of the bare repository for ``repository`` (keyed by URL)."""
+    key = hashlib.sha256(repository.strip().encode("utf-8")).hexdigest()[:16]
+    return cache_dir() / f"{key}.git"
+
+
+def _git(args: List[str], cwd: Optional[Path] = None, timeout: int = CHECKOUT_TIMEOUT) -> subprocess.CompletedProcess:
+    try:
+        return subprocess.run(
+            ["git", *args], cwd=cwd, check=True, capture_output=True, text=True, timeout=timeout,
+        )
+    except subprocess.CalledProcessError as exc:
+        raise CloneError(exc.stderr.strip() or str(exc)) from exc
+    except subprocess.TimeoutExpired as exc:
+        raise CloneError("git operation timed out") from exc
+
+
+def _has_commit(bare: Path, sha: str) -> bool:
+    result = subprocess.run(
+        ["git", "cat-file", "-e", f"{sha}^{{commit}}"], cwd=bare, capture_output=True, timeout=CHECKOUT_TIMEOUT,
+    )
+    return result.returncode == 0
+
+
+@contextmanager
+def _locked(bare: Path) -> Iterator[None]:
+    """Serialize fetches and worktree changes on one cached repo across processes."""
+    bare.parent.mkdir(parents=True, exist_ok=True)
+    with open(bare.with_suffix(".lock"), "w") as fh:
+        fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+def _ensure_bare(repository: str, bare: Path) -> None:
+    if (bare / "HEAD").is_file():
+        _git(["remote", "set-url", "origin", repository], cwd=bare)
+        return
+    _git(["init", "--quiet", "--bare", str(bare)])
+    _git(["remote", "add", "origin", repository], cwd=bare)
+
+
+def fetch_commit(repository: str, sha: str) -> Path:
+    """
+    Make sure commit ``sha`` of ``repository`` is in the cache; return the bare repo path.
+    Caller must hold the repo lock.
+    """
+    bare = bare_repo_path(repository)
+    _ensure_bare(repository, bare)
+    if _has_commit(bare, sha):
+        return bare
+    try:
+        _git(["fetch", "--quiet", "--depth", "1", "origin", sha], cwd=bare, timeout=FETCH_TIMEOUT)
+    except CloneError as shallow_err:
+        # Some servers only allow fetching advertised refs; fetch those and look again.
+        _git(
+            ["fetch", "--quiet", "--tags", "origin", "+refs/heads/*:refs/remotes/origin/*"],
+            cwd=bare, timeout=FETCH_TIMEOUT,
+        )
+        if not _has_commit(bare, sha):
+            raise CloneError(f"commit {sha} not found in {repository} ({shallow_err})") from shallow_err
+    # Keep the pinned commit reachable so gc never drops it.
+    _git(["update-ref", f"refs/pinned/{sha}", sha], cwd=bare)
+    return bare
+
+
+def checkout_at_ref(repository: str, ref: str, dest: Path, pack_path: str = ".") -> Path:
+    """
+    Check out ``repository`` at pinned ``ref`` into ``dest`` (which must not exist yet).
+
+    Only ``pack_path`` and the repository's root files are materialized when
+    ``pack_path`` is a subdirectory. Returns ``dest``.
+
+    Raises:
+        CloneError: invalid ref, fetch/checkout failure or timeout
+    """
+    err = pack_registry.federation_ref_error(ref)
+    if err:
+        raise CloneError(err)
+    sha = pack_registry.normalize_federation_ref(ref)
+    dest = Path(dest).resolve()
+    bare = bare_repo_path(repository)
+
+    with _locked(bare):
+        fetch_commit(repository, sha)
+        _git(["worktree", "prune"], cwd=bare)
+        _git(["worktree", "add", "--quiet", "--detach", "--no-checkout", str(dest), sha], cwd=bare)
+
+    sparse = pack_path.strip("/") if pack_path else "."
+    if sparse not in ("", "."):
+        _git(["sparse-checkout", "set", "--cone", sparse], cwd=dest)
+    _git(["checkout", "--quiet", "--detach", sha], cwd=dest)
+    return dest
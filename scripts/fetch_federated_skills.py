@@ -27,6 +27,7 @@ from pathlib import Path
 from typing import List, Optional
 
 import pack_registry
+from federation_clone_cache import CloneError, checkout_at_ref
 
 
 @dataclass
@@ -83,26 +84,13 @@ def print_skill_validation_details(sr: SkillResult) -> None:
     print("      (no linter output captured)")
 
 
-def clone_at_ref(repository: str, ref: str, dest: Path) -> Optional[str]:
-    """Clone a repository and checkout a pinned commit SHA. Returns error string or None."""
-    err = pack_registry.federation_ref_error(ref)
-    if err:
-        return err
-    sha = pack_registry.normalize_federation_ref(ref)
+def clone_at_ref(repository: str, ref: str, dest: Path, pack_path: str = ".") -> Optional[str]:
+    """Check out a pinned commit SHA from the shared clone cache. Returns error string or None."""
     try:
-        subprocess.run(
-            ["git", "clone", "--quiet", "--no-checkout", repository, str(dest)],
-            check=True, capture_output=True, text=True, timeout=120,
-        )
-        subprocess.run(
-            ["git", "checkout", "--quiet", sha],
-            check=True, capture_output=True, text=True, cwd=dest, timeout=30,
-        )
+        checkout_at_ref(repository, ref, dest, pack_path)
         return None
-    except subprocess.CalledProcessError as exc:
-        return exc.stderr.strip() or str(exc)
-    except subprocess.TimeoutExpired:
-        return "git operation timed out"
+    except CloneError as exc:
+        return str(exc)
 
 
 def validate_skill(skill_dir: Path, repo_root: Path) -> SkillResult:
@@ -161,7 +149,7 @@ def process_module(
         return result
 
     clone_dest = base_dir / name
-    err = clone_at_ref(repository, ref, clone_dest)
+    err = clone_at_ref(repository, ref, clone_dest, pack_path)
     if err:
         result.error = f"Clone failed: {err}"
         return result
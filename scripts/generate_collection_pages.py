@@ -9,25 +9,118 @@ collection-page UX with fully rendered markdown.
 from __future__ import annotations
 
 import html
+import json
+import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import markdown
 
+from site_build_cache import CACHE_DIR, sha256_bytes, sha256_json, sha256_text, write_if_changed
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
 
+MARKDOWN_EXTENSIONS = ["fenced_code", "tables", "nl2br"]
+RENDER_CACHE_PATH = CACHE_DIR / "markdown-render.json"
+# Cap on persisted entries; those used by the latest build are always kept.
+RENDER_CACHE_MAX_ENTRIES = 20000
+# Pages to render below which a process pool costs more than it saves (unless jobs is given)
+PARALLEL_MIN_PAGES = 8
+
+
+class MarkdownRenderer:
+    """
+    One reused (reset per call) Markdown instance plus an HTML cache keyed by
+    the source text hash. The cache is persisted between builds and invalidated
+    when the markdown package version or extension list changes.
+    """
+
+    def __init__(self) -> None:
+        self._md = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+        self._loaded = False
+        self.signature = sha256_json([markdown.__version__, MARKDOWN_EXTENSIONS])
+        self.cache: Dict[str, str] = {}
+        self.used: set[str] = set()
+        self.new_entries: Dict[str, str] = {}
+        self.rendered = 0
+        self.cached = 0
+        self.render_seconds = 0.0
+
+    def render(self, raw: str) -> str:
+        key = sha256_text(raw)
+        self.used.add(key)
+        out = self.cache.get(key)
+        if out is not None:
+            self.cached += 1
+            return out
+        start = time.perf_counter()
+        out = self._md.reset().convert(raw)
+        self.render_seconds += time.perf_counter() - start
+        self.rendered += 1
+        self.cache[key] = out
+        self.new_entries[key] = out
+        return out
+
+    def reset_stats(self) -> None:
+        self.used.clear()
+        self.new_entries.clear()
+        self.rendered = 0
+        self.cached = 0
+        self.render_seconds = 0.0
+
+    def load(self, path: Path = RENDER_CACHE_PATH) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("signature") == self.signature:
+            self.cache.update(data.get("entries") or {})
+
+    def save(self, path: Path = RENDER_CACHE_PATH) -> None:
+        """Persist entries used by this build first, then older ones up to the cap."""
+        entries = {k: self.cache[k] for k in self.used if k in self.cache}
+        for k, v in self.cache.items():
+            if len(entries) >= RENDER_CACHE_MAX_ENTRIES:
+                break
+            entries.setdefault(k, v)
+        data = {"signature": self.signature, "entries": dict(sorted(entries.items()))}
+        write_if_changed(path, json.dumps(data, ensure_ascii=False))
+
+    def merge(self, used: List[str], new_entries: Dict[str, str], rendered: int, cached: int, seconds: float) -> None:
+        """Fold in the work of a worker-process renderer (see generate_collection_pages)."""
+        self.used.update(used)
+        self.cache.update(new_entries)
+        self.new_entries.update(new_entries)
+        self.rendered += rendered
+        self.cached += cached
+        self.render_seconds += seconds
+
+    def summary(self) -> str:
+        return (
+            f"{self.rendered} rendered, {self.cached} from cache "
+            f"({self.render_seconds * 1000:.0f} ms rendering)"
+        )
+
+
+RENDERER = MarkdownRenderer()
+
 
 def md_to_html(text: Any) -> str:
-    """Render markdown to HTML using the same extensions as the fork."""
+    """Render markdown to HTML using the same extensions as the fork (cached, see MarkdownRenderer)."""
     if text is None:
         return ""
     raw = str(text).strip()
     if not raw:
         return ""
-    md = markdown.Markdown(extensions=["fenced_code", "tables", "nl2br"])
-    return md.convert(raw)
+    return RENDERER.render(raw)
 
 
 def extract_mcp_configuration_section(deploy_text: str) -> tuple[str, str]:
@@ -694,19 +787,71 @@ def render_collection_page(pack: Dict[str, Any], mcp_data: List[Dict[str, Any]])
         <div class="modal-content" id="mcp-details"></div>
     </div>
 
-    <script src="../app.js?v=73"></script>
+    <script src="../app.js?v=75"></script>
 </body>
 </html>
 """
 
 
-def generate_collection_pages(pack_data: List[Dict[str, Any]], mcp_data: List[Dict[str, Any]]) -> int:
-    """Generate docs/collections/*.html and return generated page count."""
+def collection_page_key(pack: Dict[str, Any], mcp_data: List[Dict[str, Any]]) -> str:
+    """
+    Hash of everything a pack's page is rendered from: the pack entry, its MCP
+    servers and this renderer. Pages with evaluations also key on the UTC date,
+    since they embed the relative age of each report.
+    """
+    pack_mcp = [s for s in mcp_data if s.get("pack") == pack.get("name")]
+    has_evals = bool((pack.get("evaluation_summary") or {}).get("evaluated_count"))
+    day = datetime.now(timezone.utc).date().isoformat() if has_evals else ""
+    return sha256_json([pack, pack_mcp, day, sha256_bytes(Path(__file__).read_bytes())])
+
+
+def _render_page_job(
+    pack: Dict[str, Any], mcp_data: List[Dict[str, Any]]
+) -> Tuple[str, List[str], Dict[str, str], int, int, float]:
+    """Process-pool worker: render one page and return it with the renderer's new cache entries."""
+    RENDERER.load()
+    RENDERER.reset_stats()
+    page_html = render_collection_page(pack, mcp_data)
+    return (
+        page_html,
+        sorted(RENDERER.used),
+        dict(RENDERER.new_entries),
+        RENDERER.rendered,
+        RENDERER.cached,
+        RENDERER.render_seconds,
+    )
+
+
+def generate_collection_pages(
+    pack_data: List[Dict[str, Any]],
+    mcp_data: List[Dict[str, Any]],
+    page_keys: Dict[str, str] | None = None,
+    jobs: int | None = None,
+) -> Dict[str, int]:
+    """
+    Generate docs/collections/*.html.
+
+    When *page_keys* (file name -> collection_page_key, e.g. from the site build
+    manifest) is given, pages whose key is unchanged are not re-rendered, and
+    the mapping is updated in place. Markdown fragments are rendered through
+    RENDERER, whose cache is loaded from and saved to RENDER_CACHE_PATH.
+
+    Pages are rendered in a process pool when there are at least PARALLEL_MIN_PAGES
+    of them (or *jobs* is given; 1 = serial), and written atomically only when
+    their bytes change.
+
+    Returns:
+        {'pages': total, 'written': n, 'unchanged': rendered but identical bytes,
+         'skipped': not re-rendered (key unchanged), 'removed': stale pages deleted}
+    """
     out_dir = REPO_ROOT / "docs" / "collections"
     out_dir.mkdir(parents=True, exist_ok=True)
+    RENDERER.load()
+    RENDERER.reset_stats()
+    report = {"pages": 0, "written": 0, "unchanged": 0, "skipped": 0, "removed": 0}
 
     generated_files = set()
-    count = 0
+    pending: List[Tuple[str, Dict[str, Any]]] = []
     for pack in pack_data:
         if not pack.get("collection"):
             continue
@@ -718,14 +863,41 @@ def generate_collection_pages(pack_data: List[Dict[str, Any]], mcp_data: List[Di
         )
         file_name = f"{collection_id}.html"
         generated_files.add(file_name)
-        page_html = render_collection_page(pack, mcp_data)
-        (out_dir / file_name).write_text(page_html, encoding="utf-8")
-        count += 1
+        report["pages"] += 1
+        if page_keys is not None:
+            key = collection_page_key(pack, mcp_data)
+            if page_keys.get(file_name) == key and (out_dir / file_name).is_file():
+                report["skipped"] += 1
+                continue
+            page_keys[file_name] = key
+        pending.append((file_name, pack))
+
+    workers = jobs if jobs is not None else (os.cpu_count() or 1)
+    parallel = workers > 1 and len(pending) > 1 and (jobs is not None or len(pending) >= PARALLEL_MIN_PAGES)
+    if parallel:
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+            futures = [(name, pool.submit(_render_page_job, pack, mcp_data)) for name, pack in pending]
+            rendered_pages = []
+            for name, future in futures:
+                page_html, *renderer_delta = future.result()
+                RENDERER.merge(*renderer_delta)
+                rendered_pages.append((name, page_html))
+    else:
+        rendered_pages = [(name, render_collection_page(pack, mcp_data)) for name, pack in pending]
+
+    for file_name, page_html in rendered_pages:
+        report["written" if write_if_changed(out_dir / file_name, page_html) else "unchanged"] += 1
 
     # Remove stale collection pages
     for page in out_dir.glob("*.html"):
         if page.name not in generated_files:
             page.unlink()
-
-    return count
-
+            report["removed"] += 1
+    if page_keys is not None:
+        for name in list(page_keys):
+            if name not in generated_files:
+                del page_keys[name]
+
+    if RENDERER.rendered or RENDERER.cached:
+        RENDERER.save()
+    return report
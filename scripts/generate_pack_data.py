@@ -5,21 +5,28 @@ Parse agentic packs and extract plugin metadata, skills, and agents.
 
 import json
 import os
-import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
-import yaml
+from typing import Dict, List, Any, Tuple
 
 import pack_registry
+from federation_clone_cache import CloneError, checkout_at_ref
+from md_metadata_cache import get_metadata
 
 # Union registry (marketplace ∪ plugins.json); docs site uses subset helper
 PACK_DIRS = pack_registry.get_union_pack_dirs()
 DOCS_PACK_DIRS = pack_registry.get_docs_pack_dirs()
 
+# parse_local_packs: docs files per work unit, and the markdown file count below
+# which process start-up costs more than it saves (unless jobs is given explicitly)
+DOCS_CHUNK_SIZE = 64
+PARALLEL_MIN_FILES = 200
+
 
 def parse_yaml_frontmatter(file_path: Path) -> Dict[str, Any]:
     """
-    Extract YAML frontmatter from a markdown file.
+    Extract YAML frontmatter from a markdown file (cached, see md_metadata_cache).
 
     Args:
         file_path: Path to the markdown file
@@ -28,20 +35,13 @@ def parse_yaml_frontmatter(file_path: Path) -> Dict[str, Any]:
         Dictionary containing the frontmatter data
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Match YAML frontmatter (---\n...\n---)
-        match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-        if not match:
-            return {}
-
-        frontmatter_text = match.group(1)
-        return yaml.safe_load(frontmatter_text) or {}
-
+        meta = get_metadata(file_path)
     except Exception as e:
         print(f"Warning: Failed to parse frontmatter from {file_path}: {e}")
         return {}
+    if meta.frontmatter_error:
+        print(f"Warning: Failed to parse frontmatter from {file_path}: {meta.frontmatter_error}")
+    return meta.frontmatter_dict()
 
 
 def load_plugin_titles() -> Dict[str, str]:
@@ -240,6 +240,48 @@ def sanitize_for_json(obj: Any) -> Any:
         return obj
 
 
+# Files to exclude from documentation parsing
+DOCS_EXCLUDE_FILES = {'README.md', 'INDEX.md', 'SOURCES.md'}
+
+
+def list_doc_files(pack_dir: str) -> List[Path]:
+    """List docs/**/*.md files of a pack (excluding index files and .ai-index)."""
+    docs_dir = Path(pack_dir) / 'docs'
+    if not docs_dir.exists():
+        return []
+    return sorted(
+        doc_file for doc_file in docs_dir.rglob('*.md')
+        if doc_file.name not in DOCS_EXCLUDE_FILES and '.ai-index' not in doc_file.parts
+    )
+
+
+def parse_doc_file(doc_file: Path, pack_dir: str) -> Dict[str, Any]:
+    """Parse one documentation file into a doc entry."""
+    frontmatter = parse_yaml_frontmatter(doc_file)
+
+    # Extract metadata
+    title = frontmatter.get('title', doc_file.stem.replace('-', ' ').title())
+    category = frontmatter.get('category', doc_file.parent.name)
+    sources = frontmatter.get('sources', [])
+
+    # Ensure sources is a list and sanitize for JSON
+    if not isinstance(sources, list):
+        sources = []
+    sources = sanitize_for_json(sources)
+
+    return {
+        'title': title,
+        'category': category,
+        'sources': sources,
+        'file_path': str(doc_file.relative_to(pack_dir))
+    }
+
+
+def sort_docs(docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # Sort by category first, then by title
+    return sorted(docs, key=lambda d: (d['category'], d['title']))
+
+
 def parse_docs(pack_dir: str) -> List[Dict[str, Any]]:
     """
     Parse documentation files from docs/**/*.md files.
@@ -250,42 +292,7 @@ def parse_docs(pack_dir: str) -> List[Dict[str, Any]]:
     Returns:
         List of doc dictionaries with title, sources, category, file_path
     """
-    docs = []
-    docs_dir = Path(pack_dir) / 'docs'
-
-    if not docs_dir.exists():
-        return docs
-
-    # Files to exclude from documentation parsing
-    EXCLUDE_FILES = {'README.md', 'INDEX.md', 'SOURCES.md'}
-
-    # Find all .md files recursively (excluding .ai-index directory)
-    for doc_file in docs_dir.rglob('*.md'):
-        # Skip excluded files and files in .ai-index directory
-        if doc_file.name in EXCLUDE_FILES or '.ai-index' in doc_file.parts:
-            continue
-
-        frontmatter = parse_yaml_frontmatter(doc_file)
-
-        # Extract metadata
-        title = frontmatter.get('title', doc_file.stem.replace('-', ' ').title())
-        category = frontmatter.get('category', doc_file.parent.name)
-        sources = frontmatter.get('sources', [])
-
-        # Ensure sources is a list and sanitize for JSON
-        if not isinstance(sources, list):
-            sources = []
-        sources = sanitize_for_json(sources)
-
-        docs.append({
-            'title': title,
-            'category': category,
-            'sources': sources,
-            'file_path': str(doc_file.relative_to(pack_dir))
-        })
-
-    # Sort by category first, then by title
-    return sorted(docs, key=lambda d: (d['category'], d['title']))
+    return sort_docs([parse_doc_file(doc_file, pack_dir) for doc_file in list_doc_files(pack_dir)])
 
 
 def detect_repo_license(repo_root: Path, pack_path: str = ".") -> str:
@@ -315,6 +322,81 @@ def detect_repo_license(repo_root: Path, pack_path: str = ".") -> str:
     return "Unknown"
 
 
+def build_federated_pack(
+    mod: Dict[str, Any],
+    titles: Dict[str, str],
+    workdir: Path,
+    repo_root: Path | None = None,
+) -> Dict[str, Any] | None:
+    """
+    Check out one federated module at its pinned ref under *workdir* (federation_clone_cache) and return its pack entry.
+
+    Returns None (after printing why) when the module is not published or cannot be fetched.
+    """
+    repo_root = repo_root or Path(__file__).resolve().parent.parent
+    name = mod.get("name", "unknown")
+    fed_catalog_dir = f"federation/modules/{name}"
+    maturity = pack_registry.load_pack_maturity(fed_catalog_dir, repo_root)
+    if maturity != pack_registry.DOCS_MATURITY_PUBLISH:
+        label = maturity or "missing catalog"
+        print(
+            f"  Skipping federated '{name}' for docs site: maturity {label} "
+            f"(only GREEN is published)"
+        )
+        return None
+
+    repository = mod.get("repository", "")
+    ref = mod.get("ref", "")
+    description = mod.get("description", "")
+    version = mod.get("version", "0.0.0")
+    tags = mod.get("tags", [])
+    pack_path = mod.get("path", ".")
+
+    if not repository:
+        print(f"  Warning: federated module '{name}' missing repository, skipping")
+        return None
+
+    ref_err = pack_registry.federation_ref_error(ref)
+    if ref_err:
+        print(f"  Warning: federated module '{name}' invalid ref: {ref_err}")
+        return None
+
+    clone_dest = workdir / name
+    try:
+        checkout_at_ref(repository, ref, clone_dest, pack_path)
+    except CloneError as exc:
+        print(f"  Warning: failed to clone '{name}': {exc}")
+        return None
+
+    pack_dir = clone_dest / pack_path
+    license_id = detect_repo_license(clone_dest, pack_path)
+    skills = parse_skills(str(pack_dir))
+
+    pack = {
+        "name": name,
+        "path": repository,
+        "catalog_dir": fed_catalog_dir,
+        "source": "federated",
+        "repository": repository,
+        "ref": pack_registry.normalize_federation_ref(ref)[:12],
+        "plugin": {
+            "name": name,
+            "title": titles.get(name, name.replace("-", " ").title()),
+            "version": version,
+            "description": description,
+            "author": {"name": "External"},
+            "license": license_id,
+            "keywords": tags,
+        },
+        "skills": sorted(skills, key=lambda s: s["name"]),
+        "agents": [],
+        "docs": [],
+        "has_readme": (pack_dir / "README.md").exists(),
+    }
+    print(f"  ✓ Federated '{name}': {len(skills)} skill(s) from {repository}")
+    return pack
+
+
 def load_federated_packs(plugin_titles: Dict[str, str] | None = None) -> List[Dict[str, Any]]:
     """
     Fetch federated modules and return them as standalone pack entries.
@@ -323,7 +405,6 @@ def load_federated_packs(plugin_titles: Dict[str, str] | None = None) -> List[Di
     badge it differently from in-tree packs.
     """
     import shutil
-    import subprocess
     import tempfile
 
     titles = plugin_titles if plugin_titles is not None else load_plugin_titles()
@@ -337,84 +418,151 @@ def load_federated_packs(plugin_titles: Dict[str, str] | None = None) -> List[Di
 
     try:
         for mod in modules:
-            name = mod.get("name", "unknown")
-            fed_catalog_dir = f"federation/modules/{name}"
-            maturity = pack_registry.load_pack_maturity(fed_catalog_dir, repo_root)
-            if maturity != pack_registry.DOCS_MATURITY_PUBLISH:
-                label = maturity or "missing catalog"
-                print(
-                    f"  Skipping federated '{name}' for docs site: maturity {label} "
-                    f"(only GREEN is published)"
-                )
-                continue
-
-            repository = mod.get("repository", "")
-            ref = mod.get("ref", "")
-            description = mod.get("description", "")
-            version = mod.get("version", "0.0.0")
-            tags = mod.get("tags", [])
-            pack_path = mod.get("path", ".")
-
-            if not repository:
-                print(f"  Warning: federated module '{name}' missing repository, skipping")
-                continue
-
-            ref_err = pack_registry.federation_ref_error(ref)
-            if ref_err:
-                print(f"  Warning: federated module '{name}' invalid ref: {ref_err}")
-                continue
-
-            clone_dest = tmp / name
-            try:
-                subprocess.run(
-                    ["git", "clone", "--quiet", "--no-checkout", repository, str(clone_dest)],
-                    check=True, capture_output=True, text=True, timeout=120,
-                )
-                subprocess.run(
-                    ["git", "checkout", "--quiet", pack_registry.normalize_federation_ref(ref)],
-                    check=True, capture_output=True, text=True, cwd=clone_dest, timeout=30,
-                )
-            except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as exc:
-                print(f"  Warning: failed to clone '{name}': {exc}")
-                continue
-
-            pack_dir = clone_dest / pack_path
-            license_id = detect_repo_license(clone_dest, pack_path)
-            skills = parse_skills(str(pack_dir))
-
-            pack = {
-                "name": name,
-                "path": repository,
-                "catalog_dir": fed_catalog_dir,
-                "source": "federated",
-                "repository": repository,
-                "ref": pack_registry.normalize_federation_ref(ref)[:12],
-                "plugin": {
-                    "name": name,
-                    "title": titles.get(name, name.replace("-", " ").title()),
-                    "version": version,
-                    "description": description,
-                    "author": {"name": "External"},
-                    "license": license_id,
-                    "keywords": tags,
-                },
-                "skills": sorted(skills, key=lambda s: s["name"]),
-                "agents": [],
-                "docs": [],
-                "has_readme": (pack_dir / "README.md").exists(),
-            }
-            packs.append(pack)
-            print(f"  ✓ Federated '{name}': {len(skills)} skill(s) from {repository}")
+            pack = build_federated_pack(mod, titles, tmp, repo_root)
+            if pack is not None:
+                packs.append(pack)
     finally:
         shutil.rmtree(tmp, ignore_errors=True)
 
     return packs
 
 
-def generate_pack_data() -> List[Dict[str, Any]]:
+def _parse_pack_core(pack_dir: str, plugin_titles: Dict[str, str]) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """Worker: parse plugin metadata, skills and agents (docs are parsed separately)."""
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+    plugin = parse_plugin_json(pack_dir, plugin_titles)
+    overlay_plugin_version_from_marketplace(pack_dir, plugin)
+    timings['plugin'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    skills = parse_skills(pack_dir)
+    timings['skills'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    agents = parse_agents(pack_dir)
+    timings['agents'] = time.perf_counter() - start
+
+    pack = {
+        'name': pack_dir,
+        'path': f'./{pack_dir}',
+        'plugin': plugin,
+        'skills': skills,
+        'agents': agents,
+        'docs': [],
+        'has_readme': (Path(pack_dir) / 'README.md').exists()
+    }
+    return pack, timings
+
+
+def _parse_doc_chunk(pack_dir: str, doc_files: List[Path]) -> Tuple[List[Dict[str, Any]], float]:
+    """Worker: parse a slice of one pack's docs tree."""
+    start = time.perf_counter()
+    docs = [parse_doc_file(doc_file, pack_dir) for doc_file in doc_files]
+    return docs, time.perf_counter() - start
+
+
+def _count_markdown_files(pack_dir: str, doc_files: List[Path]) -> int:
+    pack_path = Path(pack_dir)
+    return (
+        len(doc_files)
+        + len(list((pack_path / 'skills').glob('*/SKILL.md')))
+        + len(list((pack_path / 'agents').glob('*.md')))
+    )
+
+
+def parse_local_packs(
+    pack_dirs: List[str],
+    plugin_titles: Dict[str, str],
+    jobs: int | None = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, float]], float]:
+    """
+    Parse several in-tree packs, in a process pool when the work is large enough.
+
+    Each pack's plugin/skills/agents form one work unit and its docs tree is split
+    into DOCS_CHUNK_SIZE-file units, so one large docs tree is spread over workers
+    too. Results are merged in *pack_dirs* order, so output does not depend on
+    scheduling.
+
+    Args:
+        pack_dirs: Pack directories to parse
+        plugin_titles: Dictionary mapping plugin names to display titles
+        jobs: Worker processes (None = CPU count, 1 = serial)
+
+    Returns:
+        (pack dictionaries, per-pack timings in seconds: plugin/skills/agents/docs,
+        wall time of the whole parse in seconds)
+    """
+    doc_files = {pack_dir: list_doc_files(pack_dir) for pack_dir in pack_dirs}
+    total_files = sum(_count_markdown_files(p, doc_files[p]) for p in pack_dirs)
+    workers = jobs if jobs is not None else (os.cpu_count() or 1)
+    parallel = workers > 1 and len(pack_dirs) > 0 and (jobs is not None or total_files >= PARALLEL_MIN_FILES)
+
+    start = time.perf_counter()
+    if parallel:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            core_futures = {p: pool.submit(_parse_pack_core, p, plugin_titles) for p in pack_dirs}
+            doc_futures = {
+                p: [
+                    pool.submit(_parse_doc_chunk, p, files[i:i + DOCS_CHUNK_SIZE])
+                    for i in range(0, len(files), DOCS_CHUNK_SIZE)
+                ]
+                for p, files in doc_files.items()
+            }
+            core_results = {p: f.result() for p, f in core_futures.items()}
+            doc_results = {p: [f.result() for f in fs] for p, fs in doc_futures.items()}
+    else:
+        core_results = {p: _parse_pack_core(p, plugin_titles) for p in pack_dirs}
+        doc_results = {p: [_parse_doc_chunk(p, doc_files[p])] for p in pack_dirs}
+    wall = time.perf_counter() - start
+
+    packs: List[Dict[str, Any]] = []
+    timings: Dict[str, Dict[str, float]] = {}
+    for pack_dir in pack_dirs:
+        pack, pack_timings = core_results[pack_dir]
+        docs: List[Dict[str, Any]] = []
+        docs_seconds = 0.0
+        for chunk_docs, seconds in doc_results[pack_dir]:
+            docs.extend(chunk_docs)
+            docs_seconds += seconds
+        pack['docs'] = sort_docs(docs)
+        pack_timings['docs'] = docs_seconds
+        packs.append(pack)
+        timings[pack_dir] = pack_timings
+    return packs, timings, wall
+
+
+def format_pack_timings(timings: Dict[str, Dict[str, float]], wall: float) -> List[str]:
+    """Summary lines: per-pack parse time split into plugin/skills/agents/docs, then the wall time."""
+    lines = []
+    for pack_dir, t in timings.items():
+        cpu = t.get('plugin', 0) + t.get('skills', 0) + t.get('agents', 0) + t.get('docs', 0)
+        lines.append(
+            f"{pack_dir}: {cpu * 1000:.0f} ms "
+            f"(plugin {t.get('plugin', 0) * 1000:.0f}, skills {t.get('skills', 0) * 1000:.0f}, "
+            f"agents {t.get('agents', 0) * 1000:.0f}, docs {t.get('docs', 0) * 1000:.0f})"
+        )
+    if timings:
+        lines.append(f"parse wall time: {wall * 1000:.0f} ms")
+    return lines
+
+
+def print_pack_parsed(pack: Dict[str, Any]) -> None:
+    # Use title from plugin data for display
+    plugin_title = pack['plugin'].get('title', pack['name'])
+    print(
+        f"✓ Parsed {plugin_title}: {len(pack['skills'])} skills, "
+        f"{len(pack['agents'])} agents, {len(pack['docs'])} docs"
+    )
+
+
+def generate_pack_data(jobs: int | None = None) -> List[Dict[str, Any]]:
     """
     Generate pack data for all agentic packs.
 
+    Args:
+        jobs: Worker processes for parse_local_packs (None = auto, 1 = serial)
+
     Returns:
         List of pack dictionaries
     """
@@ -423,33 +571,17 @@ def generate_pack_data() -> List[Dict[str, Any]]:
     # Load plugin title mappings from docs/plugins.json
     plugin_titles = load_plugin_titles()
 
+    pack_dirs = []
     for pack_dir in DOCS_PACK_DIRS:
-        pack_path = Path(pack_dir)
-
-        if not pack_path.exists():
+        if not Path(pack_dir).exists():
             print(f"Warning: Pack directory {pack_dir} does not exist, skipping")
             continue
+        pack_dirs.append(pack_dir)
 
-        docs = parse_docs(pack_dir)
-
-        plugin = parse_plugin_json(pack_dir, plugin_titles)
-        overlay_plugin_version_from_marketplace(pack_dir, plugin)
-
-        pack = {
-            'name': pack_dir,
-            'path': f'./{pack_dir}',
-            'plugin': plugin,
-            'skills': parse_skills(pack_dir),
-            'agents': parse_agents(pack_dir),
-            'docs': docs,
-            'has_readme': (pack_path / 'README.md').exists()
-        }
-
+    local_packs, _, _ = parse_local_packs(pack_dirs, plugin_titles, jobs=jobs)
+    for pack in local_packs:
         packs.append(pack)
-
-        # Use title from plugin data for display
-        plugin_title = pack['plugin'].get('title', pack_dir)
-        print(f"✓ Parsed {plugin_title}: {len(pack['skills'])} skills, {len(pack['agents'])} agents, {len(docs)} docs")
+        print_pack_parsed(pack)
 
     federated = load_federated_packs(plugin_titles)
     if federated:
@@ -0,0 +1,126 @@
+"""
+Structural diff of two JSON-like trees (dicts, lists, scalars) with JSON-pointer paths.
+
+Used to explain collection.yaml vs collection.json mirror drift. Every subtree is
+hashed once (type-tagged, so ``1``, ``1.0``, ``True`` and ``"1"`` differ as they do in
+JSON); the diff then only descends into children whose hashes differ, so identical
+sections cost one hash comparison. Lists are aligned on item hashes (difflib), so a
+skill inserted in the middle of ``contents.skills`` is one ``added`` entry rather than
+every later item reported as changed.
+"""
+
+from __future__ import annotations
+
+import difflib
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+TreePath = Tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class TreeDiff:
+    """One difference: ``kind`` is ``"changed"``, ``"added"`` (only right) or ``"removed"`` (only left)."""
+
+    kind: str
+    left_path: TreePath
+    """Location in the left tree (for ``added`` list items: where the item would be inserted)."""
+    right_path: TreePath
+    """Location in the right tree (for ``removed`` list items: where the item is missing)."""
+    left: Any = None
+    right: Any = None
+
+    @property
+    def path(self) -> TreePath:
+        """Path of the node itself: right tree for ``added``, left tree otherwise."""
+        return self.right_path if self.kind == "added" else self.left_path
+
+    @property
+    def pointer(self) -> str:
+        return json_pointer(self.path)
+
+
+def json_pointer(path: TreePath) -> str:
+    """RFC 6901 pointer for a key path (``""`` is the whole document)."""
+    return "".join("/" + str(part).replace("~", "~0").replace("/", "~1") for part in path)
+
+
+class _Hasher:
+    """Subtree hashes for one diff, memoized by object identity (both trees stay alive meanwhile)."""
+
+    def __init__(self) -> None:
+        self._memo: Dict[int, bytes] = {}
+
+    def __call__(self, value: Any) -> bytes:
+        if isinstance(value, (dict, list)):
+            cached = self._memo.get(id(value))
+            if cached is not None:
+                return cached
+        h = hashlib.blake2b(digest_size=16)
+        if isinstance(value, dict):
+            h.update(b"d")
+            for key in sorted(value, key=str):
+                h.update(self._scalar(key))
+                h.update(self(value[key]))
+        elif isinstance(value, list):
+            h.update(b"l")
+            for item in value:
+                h.update(self(item))
+        else:
+            h.update(self._scalar(value))
+        digest = h.digest()
+        if isinstance(value, (dict, list)):
+            self._memo[id(value)] = digest
+        return digest
+
+    @staticmethod
+    def _scalar(value: Any) -> bytes:
+        tag = type(value).__name__
+        try:
+            text = json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError):
+            text = repr(value)
+        return f"{tag}:{len(text)}:{text}".encode("utf-8")
+
+
+def diff_trees(left: Any, right: Any) -> List[TreeDiff]:
+    """Differences between ``left`` and ``right`` in document order (dict keys sorted)."""
+    hasher = _Hasher()
+    out: List[TreeDiff] = []
+    _diff((), (), left, right, hasher, out)
+    return out
+
+
+def _diff(
+    lpath: TreePath, rpath: TreePath, left: Any, right: Any, hasher: _Hasher, out: List[TreeDiff],
+) -> None:
+    if hasher(left) == hasher(right):
+        return
+    if isinstance(left, dict) and isinstance(right, dict):
+        for key in sorted(set(left) | set(right), key=str):
+            lkey, rkey = lpath + (key,), rpath + (key,)
+            if key not in right:
+                out.append(TreeDiff("removed", lkey, rkey, left=left[key]))
+            elif key not in left:
+                out.append(TreeDiff("added", lkey, rkey, right=right[key]))
+            else:
+                _diff(lkey, rkey, left[key], right[key], hasher, out)
+        return
+    if isinstance(left, list) and isinstance(right, list):
+        matcher = difflib.SequenceMatcher(
+            a=[hasher(x) for x in left], b=[hasher(x) for x in right], autojunk=False,
+        )
+        for op, i1, i2, j1, j2 in matcher.get_opcodes():
+            if op == "equal":
+                continue
+            paired = min(i2 - i1, j2 - j1) if op == "replace" else 0
+            for k in range(paired):
+                _diff(lpath + (i1 + k,), rpath + (j1 + k,), left[i1 + k], right[j1 + k], hasher, out)
+            for i in range(i1 + paired, i2):
+                out.append(TreeDiff("removed", lpath + (i,), rpath + (j2,), left=left[i]))
+            for j in range(j1 + paired, j2):
+                out.append(TreeDiff("added", lpath + (i2,), rpath + (j,), right=right[j]))
+        return
+    out.append(TreeDiff("changed", lpath, rpath, left=left, right=right))
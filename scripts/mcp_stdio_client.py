@@ -0,0 +1,312 @@
+"""
+Asyncio JSON-RPC client for MCP servers speaking the stdio transport.
+
+One reader task consumes the server's stdout and resolves the pending request
+with the matching ``id`` (notifications and unmatched lines are kept on
+``notifications`` / ignored), so several requests can be in flight and nothing
+polls. A second task drains stderr so a chatty server never blocks on a full
+pipe; its tail is kept for error messages.
+
+Readiness is the ``initialize`` response itself: it is sent as soon as the
+process starts, and the wait ends early if the process exits first (no fixed
+start-up sleeps). ``notifications/initialized`` and the first ``tools/list`` page
+go out in one write; later pages follow each ``nextCursor``.
+
+Blocking callers (thread pools, plain scripts) use list_server_tools::
+
+    from mcp_stdio_client import list_server_tools
+    info, tools = list_server_tools("podman", ["run", "--rm", "-i", image])
+
+Async callers use the client directly::
+
+    async with McpStdioClient("podman", args) as client:
+        await client.initialize()
+        tools = await client.list_tools()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+from typing import Any
+
+PROTOCOL_VERSION = "2024-11-05"
+CLIENT_INFO = {"name": "mcp-tool-validator", "version": "1.0.0"}
+
+START_TIMEOUT = 15
+REQUEST_TIMEOUT = 30
+CLOSE_TIMEOUT = 5
+# tools/list pages with full input schemas easily exceed asyncio's 64 KiB line default
+MAX_LINE_BYTES = 16 * 1024 * 1024
+STDERR_TAIL_BYTES = 4096
+
+
+class McpClientError(Exception):
+    """Base class for MCP client failures."""
+
+
+class ServerExited(McpClientError):
+    """The server process exited before answering."""
+
+    def __init__(self, returncode: int | None, stderr: str) -> None:
+        self.returncode = returncode
+        self.stderr = stderr
+        super().__init__(f"server exited (code {returncode}): {stderr.strip()[:300]}")
+
+
+class RequestTimeout(McpClientError):
+    """No response within the timeout."""
+
+
+class JsonRpcError(McpClientError):
+    """The server answered with a JSON-RPC ``error`` object."""
+
+    def __init__(self, error: Any) -> None:
+        self.error = error
+        super().__init__(str(error))
+
+
+class PartialToolList(McpClientError):
+    """A later tools/list page failed; ``tools`` holds the pages received so far."""
+
+    def __init__(self, tools: list[dict], page: int, cause: McpClientError) -> None:
+        self.tools = tools
+        self.page = page
+        self.cause = cause
+        super().__init__(f"tools/list page {page}: {cause}")
+
+
+class McpStdioClient:
+    """JSON-RPC over a child process's stdin/stdout (one JSON message per line)."""
+
+    def __init__(self, command: str, args: list[str], env: dict[str, str] | None = None) -> None:
+        self.command = command
+        self.args = args
+        self.env = env
+        self.server_info: dict[str, Any] = {}
+        self.notifications: list[dict] = []
+        self._proc: asyncio.subprocess.Process | None = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._next_id = 1
+        self._tasks: list[asyncio.Task] = []
+        self._stderr_tail = b""
+        self._exited: asyncio.Future | None = None
+
+    async def __aenter__(self) -> McpStdioClient:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    @property
+    def stderr_tail(self) -> str:
+        return self._stderr_tail.decode("utf-8", errors="replace")
+
+    @property
+    def returncode(self) -> int | None:
+        return self._proc.returncode if self._proc else None
+
+    async def start(self) -> None:
+        env = {**os.environ, **self.env} if self.env is not None else None
+        self._proc = await asyncio.create_subprocess_exec(
+            self.command, *self.args,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+            limit=MAX_LINE_BYTES,
+        )
+        self._exited = asyncio.get_running_loop().create_future()
+        self._tasks = [
+            asyncio.create_task(self._read_stdout()),
+            asyncio.create_task(self._drain_stderr()),
+        ]
+
+    async def _read_stdout(self) -> None:
+        assert self._proc is not None and self._proc.stdout is not None
+        while True:
+            try:
+                line = await self._proc.stdout.readline()
+            except ValueError:
+                continue  # line over MAX_LINE_BYTES: dropped, its request times out
+            if not line:
+                break
+            try:
+                msg = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue  # log noise on stdout
+            if not isinstance(msg, dict):
+                continue
+            future = self._pending.pop(msg.get("id"), None) if "id" in msg else None
+            if future is not None:
+                if not future.done():
+                    future.set_result(msg)
+            elif "method" in msg:
+                self.notifications.append(msg)
+        # stdout closed: the server is going away. Not in a finally block, so close()
+        # cancelling this task never waits here for the process.
+        await self._proc.wait()
+        # Let the stderr drain finish so the exit error carries the server's last words
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(asyncio.shield(self._tasks[1]), timeout=1)
+        exited = ServerExited(self._proc.returncode, self.stderr_tail)
+        if self._exited is not None and not self._exited.done():
+            self._exited.set_result(exited)
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(exited)
+        self._pending.clear()
+
+    async def _drain_stderr(self) -> None:
+        assert self._proc is not None and self._proc.stderr is not None
+        while True:
+            chunk = await self._proc.stderr.read(65536)
+            if not chunk:
+                return
+            self._stderr_tail = (self._stderr_tail + chunk)[-STDERR_TAIL_BYTES:]
+
+    async def _write(self, *messages: dict) -> None:
+        assert self._proc is not None and self._proc.stdin is not None
+        if self._exited is not None and self._exited.done():
+            raise self._exited.result()
+        data = "".join(json.dumps(m) + "\n" for m in messages).encode("utf-8")
+        try:
+            self._proc.stdin.write(data)
+            await self._proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as exc:
+            await asyncio.wait({self._exited}, timeout=1)
+            if self._exited.done():
+                raise self._exited.result() from exc
+            raise ServerExited(self.returncode, self.stderr_tail) from exc
+
+    def _new_request(self, method: str, params: dict | None) -> tuple[dict, asyncio.Future]:
+        request_id = self._next_id
+        self._next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        return {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}}, future
+
+    async def _await_response(self, request_id: int, future: asyncio.Future, timeout: float) -> Any:
+        try:
+            msg = await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            self._pending.pop(request_id, None)
+            raise RequestTimeout(f"no response to request {request_id} within {timeout}s") from None
+        if "error" in msg:
+            raise JsonRpcError(msg["error"])
+        return msg.get("result", {})
+
+    async def request(
+        self, method: str, params: dict | None = None, timeout: float = REQUEST_TIMEOUT,
+        before: tuple[dict, ...] = (),
+    ) -> Any:
+        """Send a request (after the ``before`` messages, in the same write) and return its result."""
+        msg, future = self._new_request(method, params)
+        try:
+            await self._write(*before, msg)
+        except McpClientError:
+            self._pending.pop(msg["id"], None)
+            if future.done():
+                future.exception()  # already failed by the reader; mark it retrieved
+            else:
+                future.cancel()
+            raise
+        return await self._await_response(msg["id"], future, timeout)
+
+    async def notify(self, method: str, params: dict | None = None) -> None:
+        await self._write(_notification(method, params))
+
+    async def initialize(self, timeout: float = START_TIMEOUT) -> dict:
+        """``initialize`` handshake; returns the result (``serverInfo`` is kept on the client)."""
+        result = await self.request(
+            "initialize",
+            {"protocolVersion": PROTOCOL_VERSION, "capabilities": {}, "clientInfo": CLIENT_INFO},
+            timeout=timeout,
+        )
+        self.server_info = (result or {}).get("serverInfo", {}) or {}
+        return result
+
+    async def list_tools(self, timeout: float = REQUEST_TIMEOUT) -> list[dict]:
+        """
+        Every page of ``tools/list``. ``notifications/initialized`` is sent together with the
+        first page. Raises PartialToolList when a later page fails.
+        """
+        tools: list[dict] = []
+        cursor: str | None = None
+        page = 0
+        while True:
+            page += 1
+            params = {"cursor": cursor} if cursor else {}
+            before = (_notification("notifications/initialized"),) if page == 1 else ()
+            try:
+                result = await self.request("tools/list", params, timeout=timeout, before=before)
+            except McpClientError as exc:
+                if tools:
+                    raise PartialToolList(tools, page, exc) from exc
+                raise
+            tools.extend(t for t in (result or {}).get("tools", []) if isinstance(t, dict))
+            cursor = (result or {}).get("nextCursor")
+            if not cursor:
+                return tools
+
+    async def close(self) -> None:
+        """
+        Close stdin, then terminate (after CLOSE_TIMEOUT: kill) the server and release its pipes.
+        Bounded even when a grandchild keeps stdout open, which would stall Process.wait().
+        """
+        proc = self._proc
+        if proc is None:
+            return
+        if proc.stdin is not None and not proc.stdin.is_closing():
+            proc.stdin.close()
+        if proc.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                proc.terminate()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(proc.wait(), timeout=CLOSE_TIMEOUT)
+            if proc.returncode is None:
+                with contextlib.suppress(ProcessLookupError):
+                    proc.kill()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        # Process has no public close(); closing the transport now (not at garbage collection,
+        # possibly after asyncio.run() closed the loop) releases the pipes deterministically
+        transport = getattr(proc, "_transport", None)
+        if transport is not None:
+            transport.close()
+
+
+def _notification(method: str, params: dict | None = None) -> dict:
+    msg: dict[str, Any] = {"jsonrpc": "2.0", "method": method}
+    if params is not None:
+        msg["params"] = params
+    return msg
+
+
+async def fetch_server_tools(
+    command: str,
+    args: list[str],
+    start_timeout: float = START_TIMEOUT,
+    request_timeout: float = REQUEST_TIMEOUT,
+    env: dict[str, str] | None = None,
+) -> tuple[dict, list[dict]]:
+    """Start the server, handshake, list all tools, stop it: (serverInfo, tool objects)."""
+    async with McpStdioClient(command, args, env=env) as client:
+        await client.initialize(timeout=start_timeout)
+        tools = await client.list_tools(timeout=request_timeout)
+        return client.server_info, tools
+
+
+def list_server_tools(
+    command: str,
+    args: list[str],
+    start_timeout: float = START_TIMEOUT,
+    request_timeout: float = REQUEST_TIMEOUT,
+    env: dict[str, str] | None = None,
+) -> tuple[dict, list[dict]]:
+    """Blocking fetch_server_tools (own event loop; safe to call from worker threads)."""
+    return asyncio.run(fetch_server_tools(command, args, start_timeout, request_timeout, env))
@@ -0,0 +1,134 @@
+"""
+Persistent tool-list cache for validate_mcp_tools.py.
+
+Listing an MCP server's tools means pulling its image and starting a container.
+For a given image digest and launch arguments the answer does not change, so
+successful ``tools/list`` results are kept in ``.cache/mcp-tools.json`` keyed by:
+
+- the resolved image digest: taken from the reference itself when pinned
+  (``image@sha256:...``, no podman call at all), otherwise read with
+  ``podman image inspect`` after the pull
+- an args signature: sha256 of the command and its unexpanded arguments, so
+  changing mcps.json (entrypoint, env, flags) invalidates the entry
+
+Entries expire after a TTL (``--cache-ttl``); ``--refresh`` ignores stored entries
+and overwrites them. Set ``MCP_TOOLS_CACHE`` to use another cache file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_FILE = REPO_ROOT / ".cache" / "mcp-tools.json"
+DEFAULT_TTL_HOURS = 24 * 7
+CACHE_VERSION = 1
+
+INSPECT_TIMEOUT = 15
+
+_PINNED_DIGEST_RE = re.compile(r"@(sha256:[0-9a-f]{64})$")
+
+
+def cache_path() -> Path:
+    override = os.environ.get("MCP_TOOLS_CACHE", "").strip()
+    return Path(override) if override else DEFAULT_CACHE_FILE
+
+
+def pinned_digest(image: str) -> str | None:
+    """Digest of an ``image@sha256:...`` reference, or None for tag references."""
+    match = _PINNED_DIGEST_RE.search(image)
+    return match.group(1) if match else None
+
+
+def local_image_digest(command: str, image: str) -> str | None:
+    """Digest of the locally pulled ``image`` (``podman``/``docker image inspect``), or None."""
+    try:
+        result = subprocess.run(
+            [command, "image", "inspect", "--format", "{{.Digest}}", image],
+            capture_output=True, text=True, timeout=INSPECT_TIMEOUT,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    digest = result.stdout.strip().splitlines()[0] if result.returncode == 0 and result.stdout.strip() else ""
+    return digest if digest.startswith("sha256:") else None
+
+
+def args_signature(command: str, args: list[str]) -> str:
+    payload = json.dumps([command, *args], separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def cache_key(digest: str, command: str, args: list[str]) -> str:
+    return f"{digest}|{args_signature(command, args)}"
+
+
+class ToolListCache:
+    """(image digest, args signature) -> tool names; thread-safe, saved explicitly with save()."""
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+        refresh: bool = False,
+    ) -> None:
+        self.path = path or cache_path()
+        self.ttl_seconds = ttl_hours * 3600
+        self.refresh = refresh
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = self._load()
+        self._dirty = False
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def get(self, key: str) -> tuple[list[str], float] | None:
+        """(tools, age in seconds) for a fresh entry; None on miss, expiry or --refresh."""
+        if self.refresh:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+        if not entry or not isinstance(entry.get("tools"), list):
+            return None
+        age = time.time() - float(entry.get("cached_at", 0))
+        if age < 0 or age > self.ttl_seconds:
+            return None
+        return [str(t) for t in entry["tools"]], age
+
+    def put(self, key: str, tools: list[str], image: str) -> None:
+        with self._lock:
+            self._entries[key] = {"tools": sorted(tools), "image": image, "cached_at": time.time()}
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache (atomically) if anything changed, dropping entries past the default TTL."""
+        with self._lock:
+            if not self._dirty:
+                return
+            now = time.time()
+            keep_seconds = max(self.ttl_seconds, DEFAULT_TTL_HOURS * 3600)
+            entries = {
+                k: v for k, v in self._entries.items()
+                if now - float(v.get("cached_at", 0)) <= keep_seconds
+            }
+            self._dirty = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(
+            json.dumps({"version": CACHE_VERSION, "entries": entries}, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.path)
@@ -0,0 +1,139 @@
+"""
+Shared YAML frontmatter reader for SKILL.md, agent and docs markdown files.
+
+Reads only up to the closing ``---`` fence (bounded line reads, never the whole
+body), parses with the C-accelerated YAML loader when PyYAML was built with
+libyaml, and memoizes by (path, mtime, size) for the lifetime of the process,
+so build and validate scripts that touch the same file several times parse it once.
+"""
+
+from __future__ import annotations
+
+import copy
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+FENCE = "---"
+# Frontmatter larger than this is treated as missing (runaway / unterminated fence).
+MAX_FRONTMATTER_LINES = 1000
+MAX_LINE_CHARS = 64 * 1024
+
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+
+
+@dataclass(frozen=True)
+class FrontmatterBlock:
+    """Raw frontmatter lines of one file (without the fences or newlines)."""
+
+    lines: Tuple[str, ...]
+    found: bool
+    first_line: int = 2
+    """1-based line number of ``lines[0]`` in the file."""
+    body_line: int = 1
+    """1-based line number where the markdown body starts."""
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+
+_BLOCK_CACHE: Dict[Tuple[str, int, int], FrontmatterBlock] = {}
+_DATA_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
+def load_yaml(text: str) -> Any:
+    """``yaml.safe_load`` equivalent using the C loader when available."""
+    return yaml.load(text, Loader=YamlLoader)
+
+
+def _cache_key(path: Path) -> Tuple[str, int, int]:
+    st = path.stat()
+    return str(path.resolve()), st.st_mtime_ns, st.st_size
+
+
+def _read_block(path: Path) -> FrontmatterBlock:
+    with open(path, "r", encoding="utf-8") as f:
+        first = f.readline(MAX_LINE_CHARS)
+        if first.lstrip("\ufeff").rstrip() != FENCE or not first.endswith("\n"):
+            return FrontmatterBlock(lines=(), found=False)
+        lines = []
+        for _ in range(MAX_FRONTMATTER_LINES):
+            line = f.readline(MAX_LINE_CHARS)
+            if not line:
+                break
+            if line.rstrip() == FENCE and line.endswith("\n"):
+                return FrontmatterBlock(
+                    lines=tuple(lines),
+                    found=True,
+                    first_line=2,
+                    body_line=len(lines) + 3,
+                )
+            lines.append(line.rstrip("\r\n"))
+    return FrontmatterBlock(lines=(), found=False)
+
+
+def read_frontmatter_block(path: Path) -> FrontmatterBlock:
+    """Return the raw frontmatter lines of *path* (memoized by path, mtime and size)."""
+    path = Path(path)
+    key = _cache_key(path)
+    block = _BLOCK_CACHE.get(key)
+    if block is None:
+        block = _read_block(path)
+        _BLOCK_CACHE[key] = block
+    return block
+
+
+def read_frontmatter(path: Path) -> Dict[str, Any]:
+    """
+    Parse the YAML frontmatter of *path*; ``{}`` when there is none.
+
+    Raises OSError / UnicodeDecodeError when the file cannot be read and
+    yaml.YAMLError when the frontmatter is not valid YAML. Callers get a
+    copy, so mutating the result does not affect the cache.
+    """
+    path = Path(path)
+    key = _cache_key(path)
+    data = _DATA_CACHE.get(key)
+    if data is None:
+        block = read_frontmatter_block(path)
+        data = (load_yaml(block.text) or {}) if block.found else {}
+        if not isinstance(data, dict):
+            data = {}
+        _DATA_CACHE[key] = data
+    return copy.deepcopy(data)
+
+
+def locate_frontmatter(content: str) -> Tuple[Optional[str], int]:
+    """Return (frontmatter YAML text, body offset) of markdown in memory; ``(None, 0)`` if absent."""
+    match = _FRONTMATTER_RE.match(content)
+    if not match:
+        return None, 0
+    return match.group(1), match.end()
+
+
+def split_frontmatter(content: str) -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    Split markdown already in memory into (frontmatter, body).
+
+    Returns ``(None, content)`` when there is no frontmatter or it is not valid YAML.
+    """
+    yaml_text, body_offset = locate_frontmatter(content)
+    if yaml_text is None:
+        return None, content
+    try:
+        frontmatter = load_yaml(yaml_text)
+    except yaml.YAMLError:
+        return None, content
+    return frontmatter, content[body_offset:]
+
+
+def clear_cache() -> None:
+    """Drop memoized results (long-running processes such as a watch loop)."""
+    _BLOCK_CACHE.clear()
+    _DATA_CACHE.clear()
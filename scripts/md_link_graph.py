@@ -0,0 +1,252 @@
+"""
+Markdown link graph shared by the link validators.
+
+validate_skill_doc_links.py and validate_docs_tree_links.py both walk markdown
+links and resolve their targets on disk. Skills link the same shared docs (pack
+``docs/`` reached through per-skill ``docs/`` symlinks) over and over, so a
+LinkGraph:
+
+- reads each file's links once (md_metadata_cache, with a decode fallback)
+- memoizes target resolution per lexical path: real path, missing target,
+  symlink loop, symlink chain and dangling symlink are computed once
+- walks links from a set of roots, which powers the graph-only checks used by
+  validate_links.py: docs under ``skills/<name>/docs/`` and files under
+  ``skills/<name>/references/`` that the skill's SKILL.md never reaches
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from md_metadata_cache import extract_links, get_metadata
+
+# Never reported as unreachable skill files (caches, editor/OS droppings)
+SKIP_PARTS = {"__pycache__"}
+# Index files under a skill's docs/ (any depth): browsed directly rather than linked
+# from SKILL.md, so they are walk roots and never reported as orphans themselves
+DOCS_INDEX_NAMES = {"README.md", "SOURCES.md"}
+
+
+def node_key(path: Path) -> str:
+    """Normalized absolute lexical path (symlinks are not followed)."""
+    return os.path.normpath(os.path.abspath(path))
+
+
+def is_external(target: str) -> bool:
+    """URLs, mail links and same-page anchors (nothing to resolve on disk)."""
+    lower = target.lower()
+    return (
+        lower.startswith("http://")
+        or lower.startswith("https://")
+        or lower.startswith("mailto:")
+        or lower.startswith("#")
+    )
+
+
+@dataclass(frozen=True)
+class Resolution:
+    """On-disk outcome of one lexical link path."""
+
+    resolved: Optional[Path]
+    """Real path, or None when the target is missing or loops."""
+    error: Optional[str]
+    """``"missing"`` or ``"loop"`` when ``resolved`` is None."""
+    is_symlink: bool
+    symlink_chain: bool
+    """The path is a symlink whose immediate target is itself a symlink."""
+    dangling: bool
+    """The path is a symlink that does not resolve."""
+    is_file: bool
+
+
+@dataclass(frozen=True)
+class Link:
+    """One local link: where it is written and the lexical path it names."""
+
+    source: Path
+    line: int
+    raw: str
+    path: Path
+    key: str
+    """Normalized absolute form of ``path`` (graph node id)."""
+
+
+class LinkGraph:
+    """Per-run link and resolution memo; pass one instance to every validator in a run."""
+
+    def __init__(self) -> None:
+        self._links: Dict[str, Tuple[Tuple[int, str], ...]] = {}
+        self._real_dirs: Dict[str, str] = {}
+        self._local_links: Dict[Tuple[Path, Optional[Path]], List[Link]] = {}
+        self._resolutions: Dict[str, Resolution] = {}
+        self._edges: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+        self.stats = {"files": 0, "resolutions": 0, "resolution_hits": 0}
+
+    def real_key(self, key: str) -> str:
+        """
+        Real path of node ``key``, resolving each directory once per run (skills reach
+        shared docs through a ``docs/`` symlink, so many keys share a real directory).
+        """
+        parent, name = os.path.split(key)
+        real_parent = self._real_dirs.get(parent)
+        if real_parent is None:
+            real_parent = self._real_dirs[parent] = os.path.realpath(parent)
+        real = os.path.join(real_parent, name)
+        return os.path.realpath(real) if os.path.islink(real) else real
+
+    def links(self, md: Path) -> Tuple[Tuple[int, str], ...]:
+        """(line, raw target) pairs of ``md`` (read once per real file per run)."""
+        real = self.real_key(node_key(md))
+        cached = self._links.get(real)
+        if cached is not None:
+            return cached
+        try:
+            links = get_metadata(md).links
+        except UnicodeDecodeError:
+            # Not cacheable (invalid UTF-8); scan what decodes
+            links = tuple(extract_links(md.read_text(encoding="utf-8", errors="ignore")))
+        except (OSError, RuntimeError):
+            # Dangling or looping symlink: reported where it is linked, nothing to scan
+            links = ()
+        self._links[real] = links
+        self.stats["files"] += 1
+        return links
+
+    def resolve(self, path: Path, key: Optional[str] = None) -> Resolution:
+        """Resolve ``path`` like ``Path.resolve(strict=True)`` plus symlink checks (memoized)."""
+        key = key or node_key(path)
+        cached = self._resolutions.get(key)
+        if cached is not None:
+            self.stats["resolution_hits"] += 1
+            return cached
+        self.stats["resolutions"] += 1
+
+        resolved: Optional[Path] = None
+        error: Optional[str] = None
+        try:
+            resolved = path.resolve(strict=True)
+        except FileNotFoundError:
+            error = "missing"
+        except RuntimeError:
+            error = "loop"
+        except OSError as exc:
+            if exc.errno != errno.ELOOP:
+                raise
+            error = "loop"
+
+        is_symlink = path.is_symlink()
+        chain = False
+        if is_symlink:
+            raw_link = os.readlink(path)
+            immediate = path.parent / raw_link if not os.path.isabs(raw_link) else Path(raw_link)
+            chain = immediate.is_symlink()
+        result = Resolution(
+            resolved=resolved,
+            error=error,
+            is_symlink=is_symlink,
+            symlink_chain=chain,
+            dangling=is_symlink and not path.exists(),
+            is_file=resolved is not None and resolved.is_file(),
+        )
+        self._resolutions[key] = result
+        return result
+
+    def local_links(self, md: Path, base: Optional[Path] = None) -> List[Link]:
+        """Non-external links of ``md`` with their lexical target path (relative to ``base``)."""
+        cached = self._local_links.get((md, base))
+        if cached is not None:
+            return cached
+        base_dir = base if base is not None else md.parent
+        out: List[Link] = []
+        for line_no, target in self.links(md):
+            raw = target.strip()
+            if is_external(raw):
+                continue
+            rel = raw.split("#", 1)[0].strip()
+            if rel:
+                path = base_dir / rel
+                out.append(Link(source=md, line=line_no, raw=raw, path=path, key=node_key(path)))
+        self._local_links[(md, base)] = out
+        return out
+
+    def edges(self, key: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        (every local link target, markdown targets that are files) of node ``key``,
+        as node keys. String-only and memoized: shared docs are walked once per run.
+        """
+        cached = self._edges.get(key)
+        if cached is not None:
+            return cached
+        base_dir = os.path.dirname(key)
+        targets: List[str] = []
+        markdown: List[str] = []
+        for _, target in self.links(Path(key)):
+            raw = target.strip()
+            if is_external(raw):
+                continue
+            rel = raw.split("#", 1)[0].strip()
+            if not rel:
+                continue
+            child = os.path.normpath(os.path.join(base_dir, rel))
+            targets.append(child)
+            if child.endswith(".md") and os.path.isfile(child):
+                markdown.append(child)
+        result = (tuple(targets), tuple(markdown))
+        self._edges[key] = result
+        return result
+
+    def reachable(self, roots: Iterable[Path]) -> Set[str]:
+        """
+        Node keys (see node_key) reachable from ``roots`` by following local links;
+        markdown targets are scanned in turn, other files are leaves.
+        """
+        seen: Set[str] = set()
+        scanned: Set[str] = set()
+        queue: List[str] = []
+        for root in roots:
+            key = node_key(root)
+            seen.add(key)
+            if key not in scanned:
+                scanned.add(key)
+                queue.append(key)
+        while queue:
+            targets, markdown = self.edges(queue.pop())
+            seen.update(targets)
+            for child in markdown:
+                if child not in scanned:
+                    scanned.add(child)
+                    queue.append(child)
+        return seen
+
+
+def _skipped(rel: Path) -> bool:
+    return any(part in SKIP_PARTS or part.startswith(".") for part in rel.parts)
+
+
+def unreachable_skill_files(skill_md: Path, graph: LinkGraph) -> Dict[str, List[Path]]:
+    """
+    Files the skill ships but its SKILL.md never reaches (directly or via other docs):
+    ``{"docs": [...markdown under docs/], "references": [...any file under references/]}``.
+    README.md / SOURCES.md under docs/ (DOCS_INDEX_NAMES) are walked as extra roots.
+    """
+    skill_dir = skill_md.parent
+    docs = sorted((skill_dir / "docs").glob("**/*.md"))
+    index_docs = [d for d in docs if d.name in DOCS_INDEX_NAMES]
+    reached = graph.reachable([skill_md, *index_docs])
+    out: Dict[str, List[Path]] = {"docs": [], "references": []}
+    candidates = {
+        "docs": [d for d in docs if d.name not in DOCS_INDEX_NAMES],
+        "references": sorted(
+            p for p in (skill_dir / "references").glob("**/*")
+            if p.is_file() and not _skipped(p.relative_to(skill_dir))
+        ),
+    }
+    for kind, files in candidates.items():
+        for f in files:
+            if node_key(f) not in reached:
+                out[kind].append(f)
+    return out
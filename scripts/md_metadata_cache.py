@@ -0,0 +1,353 @@
+"""
+Persistent metadata cache for markdown files (SKILL.md, agents, skill docs, pack READMEs).
+
+``make validate``, ``make validate-skill-design`` and ``make generate`` all read the
+same few hundred markdown files. Each file's parsed frontmatter, heading outline
+and extracted links are stored in SQLite (``.cache/md-metadata.sqlite``) keyed by
+path, mtime, size and content hash:
+
+- unchanged (mtime, size): served from the cache without opening the file
+- touched but same bytes: re-hashed, stat refreshed, parse reused
+- changed: parsed again and stored
+
+Frontmatter is stored as JSON, never pickle, so a tampered or restored cache
+file cannot run code. YAML values JSON cannot hold (dates, timestamps, binary,
+sets, mappings with non-string keys) use a small tagged encoding.
+
+Set ``MD_METADATA_CACHE`` to another database path, or to ``off`` to keep the
+cache in memory only (per process).
+"""
+
+from __future__ import annotations
+
+import base64
+import copy
+import datetime
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from md_frontmatter import load_yaml, locate_frontmatter
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DB_PATH = REPO_ROOT / ".cache" / "md-metadata.sqlite"
+# Bump when the stored fields, their encoding or how they are extracted change.
+SCHEMA_VERSION = 2
+
+# Key marking a tagged value in stored frontmatter JSON (see encode_yaml_value)
+YAML_TAG_KEY = "__yaml__"
+
+MD_LINK_RE = re.compile(r"\[[^\]]+\]\(([^)]+)\)")
+HEADING_RE = re.compile(r"^(#{1,6})[ \t]+(.*?)[ \t]*$")
+FENCE_PREFIXES = ("```", "~~~")
+
+
+@dataclass(frozen=True)
+class MarkdownMeta:
+    """Parsed metadata of one markdown file. Line numbers are 1-based file lines."""
+
+    sha256: str
+    frontmatter: Any
+    """Parsed YAML frontmatter (any YAML value), or None when absent or invalid."""
+    frontmatter_error: Optional[str]
+    """YAML error message when a frontmatter block exists but does not parse."""
+    body_offset: int
+    """Character offset of the body in the file text (0 without valid frontmatter)."""
+    outline: Tuple[Tuple[int, int, str, bool], ...]
+    """ATX headings as (line, level, text, inside_code_fence)."""
+    links: Tuple[Tuple[int, str], ...]
+    """Markdown link targets ``[label](target)`` as (line, raw target)."""
+
+    def frontmatter_dict(self) -> Dict[str, Any]:
+        """Frontmatter as a fresh dict (``{}`` when absent, invalid or not a mapping)."""
+        return copy.deepcopy(self.frontmatter) if isinstance(self.frontmatter, dict) else {}
+
+
+def decode_text(data: bytes) -> str:
+    """Decode like ``Path.read_text(encoding="utf-8")`` (strict, universal newlines)."""
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def extract_links(text: str) -> List[Tuple[int, str]]:
+    links: List[Tuple[int, str]] = []
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        for m in MD_LINK_RE.finditer(line):
+            links.append((line_no, m.group(1)))
+    return links
+
+
+def extract_outline(text: str) -> List[Tuple[int, int, str, bool]]:
+    outline: List[Tuple[int, int, str, bool]] = []
+    in_fence = False
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        if line.lstrip().startswith(FENCE_PREFIXES):
+            in_fence = not in_fence
+            continue
+        m = HEADING_RE.match(line)
+        if m:
+            outline.append((line_no, len(m.group(1)), m.group(2), in_fence))
+    return outline
+
+
+def encode_yaml_value(value: Any) -> Any:
+    """
+    Safe-loaded YAML value -> JSON-compatible value. ``date``/``datetime``, ``bytes``,
+    ``set`` and mappings with non-string keys (or a key equal to YAML_TAG_KEY) become
+    ``{YAML_TAG_KEY: tag, ...}`` objects. Raises TypeError for anything else.
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, list):
+        return [encode_yaml_value(v) for v in value]
+    if isinstance(value, dict):
+        if all(isinstance(k, str) for k in value) and YAML_TAG_KEY not in value:
+            return {k: encode_yaml_value(v) for k, v in value.items()}
+        return {
+            YAML_TAG_KEY: "map",
+            "items": [[encode_yaml_value(k), encode_yaml_value(v)] for k, v in value.items()],
+        }
+    if isinstance(value, datetime.datetime):
+        return {YAML_TAG_KEY: "datetime", "value": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {YAML_TAG_KEY: "date", "value": value.isoformat()}
+    if isinstance(value, bytes):
+        return {YAML_TAG_KEY: "binary", "value": base64.b64encode(value).decode("ascii")}
+    if isinstance(value, (set, frozenset)):
+        return {YAML_TAG_KEY: "set", "items": [encode_yaml_value(v) for v in value]}
+    raise TypeError(f"cannot cache frontmatter value of type {type(value).__name__}")
+
+
+def decode_yaml_value(value: Any) -> Any:
+    """Inverse of encode_yaml_value. Raises ValueError on an unknown or malformed tag."""
+    if isinstance(value, list):
+        return [decode_yaml_value(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    tag = value.get(YAML_TAG_KEY)
+    if tag is None:
+        return {k: decode_yaml_value(v) for k, v in value.items()}
+    try:
+        if tag == "map":
+            return {decode_yaml_value(k): decode_yaml_value(v) for k, v in value["items"]}
+        if tag == "datetime":
+            return datetime.datetime.fromisoformat(value["value"])
+        if tag == "date":
+            return datetime.date.fromisoformat(value["value"])
+        if tag == "binary":
+            return base64.b64decode(value["value"])
+        if tag == "set":
+            return {decode_yaml_value(v) for v in value["items"]}
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"malformed {tag!r} value in metadata cache") from e
+    raise ValueError(f"unknown frontmatter tag {tag!r} in metadata cache")
+
+
+def parse_markdown(text: str, sha256: str = "") -> MarkdownMeta:
+    """Extract frontmatter, outline and links from markdown text (no caching)."""
+    frontmatter: Any = None
+    error: Optional[str] = None
+    yaml_text, body_offset = locate_frontmatter(text)
+    if yaml_text is not None:
+        try:
+            frontmatter = load_yaml(yaml_text)
+        except yaml.YAMLError as e:
+            error = str(e)
+            body_offset = 0
+    return MarkdownMeta(
+        sha256=sha256,
+        frontmatter=frontmatter,
+        frontmatter_error=error,
+        body_offset=body_offset,
+        outline=tuple(extract_outline(text)),
+        links=tuple(extract_links(text)),
+    )
+
+
+def _db_path() -> Optional[Path]:
+    value = os.environ.get("MD_METADATA_CACHE", "").strip()
+    if value.lower() in ("off", "0", "false", "no"):
+        return None
+    return Path(value).expanduser() if value else DEFAULT_DB_PATH
+
+
+class MetadataCache:
+    """SQLite-backed store; one connection per process (safe under fork-based pools)."""
+
+    def __init__(self, db_path: Optional[Path]):
+        self.db_path = db_path
+        self._memo: Dict[Tuple[str, int, int], MarkdownMeta] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid = -1
+        self._lock = threading.Lock()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self.db_path is None:
+            return None
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row is None or row[0] != str(SCHEMA_VERSION):
+                conn.execute("DROP TABLE IF EXISTS files")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                    (str(SCHEMA_VERSION),),
+                )
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    frontmatter TEXT,
+                    frontmatter_error TEXT,
+                    body_offset INTEGER NOT NULL,
+                    outline TEXT NOT NULL,
+                    links TEXT NOT NULL
+                )"""
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            print(f"Warning: markdown metadata cache disabled ({self.db_path}: {e})")
+            self.db_path = None
+            return None
+        self._conn = conn
+        self._pid = os.getpid()
+        return conn
+
+    def _load_row(self, path: str) -> Optional[tuple]:
+        conn = self._connect()
+        if conn is None:
+            return None
+        try:
+            return conn.execute(
+                "SELECT mtime_ns, size, sha256, frontmatter, frontmatter_error, "
+                "body_offset, outline, links FROM files WHERE path = ?",
+                (path,),
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+
+    @staticmethod
+    def _meta_from_row(row: tuple) -> Optional[MarkdownMeta]:
+        """Decoded row, or None when it does not decode (treated as a cache miss)."""
+        _, _, sha, fm_json, fm_error, body_offset, outline, links = row
+        try:
+            return MarkdownMeta(
+                sha256=sha,
+                frontmatter=decode_yaml_value(json.loads(fm_json)) if fm_json is not None else None,
+                frontmatter_error=fm_error,
+                body_offset=body_offset,
+                outline=tuple(tuple(h) for h in json.loads(outline)),
+                links=tuple(tuple(link) for link in json.loads(links)),
+            )
+        except (TypeError, ValueError):
+            return None
+
+    def _store(self, path: str, mtime_ns: int, size: int, meta: MarkdownMeta) -> None:
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            fm_json = (
+                json.dumps(encode_yaml_value(meta.frontmatter), ensure_ascii=False)
+                if meta.frontmatter is not None else None
+            )
+        except (TypeError, ValueError):
+            return  # not representable in JSON: kept in the per-process memo only
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO files (path, mtime_ns, size, sha256, frontmatter, "
+                "frontmatter_error, body_offset, outline, links) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    path,
+                    mtime_ns,
+                    size,
+                    meta.sha256,
+                    fm_json,
+                    meta.frontmatter_error,
+                    meta.body_offset,
+                    json.dumps(meta.outline, ensure_ascii=False),
+                    json.dumps(meta.links, ensure_ascii=False),
+                ),
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def _touch(self, path: str, mtime_ns: int, size: int) -> None:
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "UPDATE files SET mtime_ns = ?, size = ? WHERE path = ?", (mtime_ns, size, path)
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def get(self, path: Path) -> MarkdownMeta:
+        """
+        Metadata for ``path`` (memoized per process, persisted across processes).
+
+        Raises OSError / UnicodeDecodeError when the file cannot be read.
+        """
+        resolved = Path(path).resolve()
+        st = resolved.stat()
+        key = (str(resolved), st.st_mtime_ns, st.st_size)
+        with self._lock:
+            meta = self._memo.get(key)
+            if meta is not None:
+                return meta
+
+            row = self._load_row(key[0])
+            cached = self._meta_from_row(row) if row is not None else None
+            if cached is not None and row[0] == st.st_mtime_ns and row[1] == st.st_size:
+                self._memo[key] = cached
+                return cached
+
+            data = resolved.read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+            if cached is not None and cached.sha256 == digest:
+                meta = cached
+                self._touch(key[0], st.st_mtime_ns, st.st_size)
+            else:
+                meta = parse_markdown(decode_text(data), digest)
+                self._store(key[0], st.st_mtime_ns, st.st_size, meta)
+            self._memo[key] = meta
+            return meta
+
+    def clear_memo(self) -> None:
+        with self._lock:
+            self._memo.clear()
+
+
+_default: Optional[MetadataCache] = None
+_default_lock = threading.Lock()
+
+
+def default_cache() -> MetadataCache:
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = MetadataCache(_db_path())
+        return _default
+
+
+def get_metadata(path: Path) -> MarkdownMeta:
+    """Metadata of ``path`` through the process-wide shared cache."""
+    return default_cache().get(path)
@@ -8,7 +8,7 @@ import sys
 from pathlib import Path
 
 import pack_registry
-from generate_pack_data import parse_yaml_frontmatter
+from md_frontmatter import read_frontmatter
 
 
 def main() -> int:
@@ -35,7 +35,7 @@ def main() -> int:
         print("(no skills directory)")
         return 0
     for skill_md in sorted(skills_dir.glob("*/SKILL.md")):
-        fm = parse_yaml_frontmatter(skill_md)
+        fm = read_frontmatter(skill_md)
         name = fm.get("name", skill_md.parent.name)
         desc = fm.get("description", "")
         if isinstance(desc, str):
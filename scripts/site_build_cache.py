@@ -0,0 +1,189 @@
+"""
+Content-hash manifest for incremental docs site builds (build_website.py).
+
+The manifest (``.cache/site-build/manifest.json``) records, per pack, the hash of
+its input files and the pack entry produced from them, plus the hashes of the
+written outputs. A rebuild recomputes only packs whose inputs changed and skips
+writing files whose bytes are unchanged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = REPO_ROOT / ".cache" / "site-build"
+MANIFEST_PATH = CACHE_DIR / "manifest.json"
+MANIFEST_VERSION = 1
+
+# Files every pack entry depends on (registry, titles, icons and the generators).
+GLOBAL_INPUTS = [
+    "docs/icons.json",
+    "docs/plugins.json",
+    "marketplace/rh-agentic-collection.yml",
+    "scripts/build_website.py",
+    "scripts/catalog_site_bundle.py",
+    "scripts/collection_validate_lib.py",
+    "scripts/eval_site_enrichment.py",
+    "scripts/generate_pack_data.py",
+    "scripts/md_frontmatter.py",
+    "scripts/md_metadata_cache.py",
+    "scripts/pack_registry.py",
+    "scripts/site_build_cache.py",
+]
+
+SKIP_DIR_NAMES = {"__pycache__", ".git", ".ai-index"}
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_text(text: str) -> str:
+    return sha256_bytes(text.encode("utf-8"))
+
+
+def sha256_json(data: Any) -> str:
+    """Stable hash of a JSON-serializable value."""
+    return sha256_text(json.dumps(data, sort_keys=True, ensure_ascii=False, default=str))
+
+
+class Manifest:
+    """Input-hash → artifact manifest persisted between builds."""
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        data = data if isinstance(data, dict) and data.get("version") == MANIFEST_VERSION else {}
+        self.file_stats: Dict[str, List[Any]] = data.get("file_stats", {})
+        self.packs: Dict[str, Dict[str, Any]] = data.get("packs", {})
+        self.outputs: Dict[str, str] = data.get("outputs", {})
+        self.pages: Dict[str, str] = data.get("pages", {})
+
+    @classmethod
+    def load(cls, path: Path = MANIFEST_PATH) -> "Manifest":
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return cls(json.load(f))
+        except (OSError, ValueError):
+            return cls()
+
+    def save(self, path: Path = MANIFEST_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": MANIFEST_VERSION,
+            "file_stats": self.file_stats,
+            "packs": self.packs,
+            "outputs": self.outputs,
+            "pages": self.pages,
+        }
+        write_if_changed(path, json.dumps(data, indent=1, sort_keys=True, ensure_ascii=False))
+
+    def file_hash(self, path: Path, root: Path = REPO_ROOT) -> Optional[str]:
+        """
+        Content hash of ``path``; reuses the stored hash while (mtime_ns, size) is unchanged.
+        Returns None for missing files.
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        key = path.relative_to(root).as_posix() if path.is_relative_to(root) else str(path)
+        cached = self.file_stats.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        digest = sha256_bytes(path.read_bytes())
+        self.file_stats[key] = [st.st_mtime_ns, st.st_size, digest]
+        return digest
+
+    def inputs_hash(self, paths: Iterable[Path], root: Path = REPO_ROOT) -> str:
+        """Combined hash of a set of input files (path names included)."""
+        h = hashlib.sha256()
+        for path in sorted(set(paths)):
+            rel = path.relative_to(root).as_posix() if path.is_relative_to(root) else str(path)
+            h.update(rel.encode("utf-8"))
+            h.update(b"\0")
+            h.update((self.file_hash(path, root) or "missing").encode("ascii"))
+            h.update(b"\n")
+        return h.hexdigest()
+
+    def load_pack(self, name: str, inputs_hash: str) -> Optional[Dict[str, Any]]:
+        """Return the cached pack entry if it was built from ``inputs_hash``."""
+        entry = self.packs.get(name)
+        if not entry or entry.get("inputs_hash") != inputs_hash:
+            return None
+        return self.cached_pack(name)
+
+    def cached_pack(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return the last stored pack entry without checking its inputs (watch mode)."""
+        if name not in self.packs:
+            return None
+        try:
+            with open(CACHE_DIR / "packs" / f"{name}.json", "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store_pack(self, name: str, inputs_hash: str, pack: Dict[str, Any]) -> None:
+        write_if_changed(
+            CACHE_DIR / "packs" / f"{name}.json",
+            json.dumps(pack, ensure_ascii=False, default=str),
+        )
+        self.packs[name] = {"inputs_hash": inputs_hash}
+
+    def prune(self, live_packs: Iterable[str]) -> None:
+        """Forget packs that are no longer part of the site."""
+        live = set(live_packs)
+        for name in list(self.packs):
+            if name not in live:
+                del self.packs[name]
+                (CACHE_DIR / "packs" / f"{name}.json").unlink(missing_ok=True)
+        self.file_stats = {k: v for k, v in self.file_stats.items() if (REPO_ROOT / k).exists()}
+
+
+def iter_tree_files(directory: Path) -> List[Path]:
+    """All regular files under ``directory`` (skipping caches and VCS dirs)."""
+    if not directory.is_dir():
+        return []
+    out: List[Path] = []
+    for dirpath, dirnames, filenames in os.walk(directory):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIR_NAMES)
+        for name in filenames:
+            out.append(Path(dirpath) / name)
+    return out
+
+
+def pack_input_files(pack_dir: str, root: Path = REPO_ROOT) -> List[Path]:
+    """Files a local pack's site entry is derived from: the pack tree and its eval reports."""
+    return iter_tree_files(root / pack_dir) + iter_tree_files(root / "eval" / pack_dir)
+
+
+def global_input_files(root: Path = REPO_ROOT) -> List[Path]:
+    return [root / rel for rel in GLOBAL_INPUTS]
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """
+    Write ``text`` to ``path`` unless the file already has exactly these bytes.
+    The write goes to a sibling temp file that is renamed over ``path``, so readers
+    (dev server, concurrent builds) never see a partially written file.
+    """
+    data = text.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return True
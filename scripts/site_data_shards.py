@@ -0,0 +1,118 @@
+"""
+Sharded docs site data (build_website.py --sharded).
+
+docs/data.json carries every pack's bundled catalog markdown and eval enrichment,
+but the index view only needs pack cards. In sharded mode the build also writes:
+
+- docs/data/index.json: repository info, MCP servers and one card entry per pack
+  (card fields, shard URL + content hash); search uses docs/search-index.json
+- docs/data/packs/<pack>.json: the full pack entry, fetched by app.js on demand
+
+Each shard also gets precompressed ``.gz`` and (when the ``brotli`` module is
+installed) ``.br`` siblings for hosts that serve precompressed assets.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List
+
+from site_build_cache import sha256_text, write_if_changed
+
+try:
+    import brotli
+except ImportError:  # optional: only .gz variants are written
+    brotli = None
+
+SHARD_DIR_NAME = "data"
+INDEX_NAME = "index.json"
+
+# Catalog (collection.yaml) fields the pack card and search read in the index view.
+CARD_COLLECTION_FIELDS = ("id", "name", "summary", "description", "categories", "personas")
+
+
+def pack_card(pack: Dict[str, Any], shard_url: str, shard_hash: str) -> Dict[str, Any]:
+    """
+    Index entry for one pack: skills/agents reduced to names (cards only count them)
+    and the bundled catalog cut to card fields (site_search_index covers the rest).
+    """
+    card = {k: v for k, v in pack.items() if k != "collection"}
+    for key in ("skills", "agents"):
+        card[key] = [{"name": item.get("name", "")} for item in pack.get(key, [])]
+    co = pack.get("collection")
+    if isinstance(co, dict):
+        summary = {k: co[k] for k in CARD_COLLECTION_FIELDS if k in co}
+        contents = co.get("contents")
+        if isinstance(contents, dict) and "description" in contents:
+            summary["contents"] = {"description": contents["description"]}
+        card["collection"] = summary
+    card["shard"] = {"url": shard_url, "hash": shard_hash}
+    return card
+
+
+def write_compressed_variants(path: Path, data: bytes, force: bool = False) -> None:
+    """Write ``path``.gz (and ``path``.br when brotli is available) next to ``path``."""
+    gz_path = path.with_name(path.name + ".gz")
+    if force or not gz_path.exists():
+        gz_path.write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+    br_path = path.with_name(path.name + ".br")
+    if brotli is not None and (force or not br_path.exists()):
+        br_path.write_bytes(brotli.compress(data))
+
+
+def _write_shard(path: Path, text: str) -> bool:
+    changed = write_if_changed(path, text)
+    write_compressed_variants(path, text.encode("utf-8"), force=changed)
+    return changed
+
+
+def write_shards(output: Dict[str, Any], docs_dir: Path) -> Dict[str, int]:
+    """
+    Write docs/data/index.json and one shard per pack for the assembled site ``output``.
+    Files are only rewritten when their bytes change; shards of removed packs are deleted.
+
+    Returns:
+        Counts: {'written': n, 'unchanged': n, 'removed': n, 'index_bytes': n}
+    """
+    shard_dir = docs_dir / SHARD_DIR_NAME
+    packs_dir = shard_dir / "packs"
+    stats = {"written": 0, "unchanged": 0, "removed": 0, "index_bytes": 0}
+
+    cards: List[Dict[str, Any]] = []
+    live = set()
+    for pack in output["packs"]:
+        text = json.dumps(pack, ensure_ascii=False, separators=(",", ":"))
+        name = f"{pack['name']}.json"
+        live.add(name)
+        stats["written" if _write_shard(packs_dir / name, text) else "unchanged"] += 1
+        cards.append(pack_card(pack, f"{SHARD_DIR_NAME}/packs/{name}", sha256_text(text)[:16]))
+
+    if packs_dir.is_dir():
+        for stale in sorted(packs_dir.glob("*.json")):
+            if stale.name not in live:
+                for p in (stale, stale.with_name(stale.name + ".gz"), stale.with_name(stale.name + ".br")):
+                    p.unlink(missing_ok=True)
+                stats["removed"] += 1
+
+    index = {
+        "repository": output["repository"],
+        "packs": cards,
+        "mcp_servers": output["mcp_servers"],
+    }
+    index["version"] = sha256_text(json.dumps(index, sort_keys=True, ensure_ascii=False))[:16]
+    text = json.dumps(index, ensure_ascii=False, separators=(",", ":"))
+    _write_shard(shard_dir / INDEX_NAME, text)
+    stats["index_bytes"] = len(text.encode("utf-8"))
+    return stats
+
+
+def remove_shards(docs_dir: Path) -> bool:
+    """Delete docs/data/ (non-sharded builds) so app.js does not pick up a stale index."""
+    shard_dir = docs_dir / SHARD_DIR_NAME
+    if not shard_dir.is_dir():
+        return False
+    shutil.rmtree(shard_dir)
+    return True
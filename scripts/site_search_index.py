@@ -0,0 +1,125 @@
+"""
+Prebuilt inverted search index for the docs site (docs/search-index.json).
+
+app.js used to lowercase and concatenate every pack's and MCP server's text on
+each keystroke. build_website.py now emits, once per build:
+
+    {
+      "version": 1,
+      "docs": [["p", "<pack>"], ["s", "<skill>", "<pack>"], ["m", "<server>", "<pack>"], ...],
+      "tokens": ["<token>", ...],      # sorted, for binary-search prefix lookup
+      "postings": [[doc_id, ...], ...] # aligned with tokens
+    }
+
+Documents are packs (name, plugin and catalog text, agents), skills (plugin and
+catalog entries, attributed to their pack) and MCP servers, over the same fields
+handleSearch matched before. Tokens are lowercase runs of letters and digits of
+any length (so "rhel 9" finds the "9"); app.js tokenizes queries the same way
+and prefix-matches every term, as search_documents does here.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+SEARCH_INDEX_VERSION = 1
+TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: Any) -> Set[str]:
+    """Distinct lowercase letter/digit runs of ``text``."""
+    if not text:
+        return set()
+    return set(TOKEN_RE.findall(str(text).lower()))
+
+
+def _tokens_of(values: Iterable[Any]) -> Set[str]:
+    out: Set[str] = set()
+    for value in values:
+        out |= tokenize(value)
+    return out
+
+
+def _pack_documents(pack: Dict[str, Any]) -> List[Tuple[List[str], Set[str]]]:
+    """(doc entry, tokens) for one pack and each of its skills."""
+    name = pack.get("name", "")
+    plugin = pack.get("plugin") or {}
+    pack_text: List[Any] = [name, plugin.get("name"), plugin.get("title"), plugin.get("description")]
+    skill_text: Dict[str, List[Any]] = {}
+
+    co = pack.get("collection")
+    if isinstance(co, dict):
+        contents = co.get("contents") or {}
+        pack_text += [co.get("name"), co.get("summary"), co.get("description"), contents.get("description")]
+        pack_text += list(co.get("categories") or []) + list(co.get("personas") or [])
+        for s in list(contents.get("skills") or []) + list(contents.get("orchestration_skills") or []):
+            skill_text.setdefault(str(s.get("name", "")), []).extend(
+                [s.get("name"), s.get("description"), s.get("summary_markdown")]
+            )
+    for s in pack.get("skills", []):
+        skill_text.setdefault(str(s.get("name", "")), []).extend([s.get("name"), s.get("description")])
+    for a in pack.get("agents", []):
+        pack_text += [a.get("name"), a.get("description")]
+
+    docs: List[Tuple[List[str], Set[str]]] = [(["p", name], _tokens_of(pack_text))]
+    for skill_name in sorted(skill_text):
+        docs.append((["s", skill_name, name], _tokens_of(skill_text[skill_name])))
+    return docs
+
+
+def _server_document(server: Dict[str, Any]) -> Tuple[List[str], Set[str]]:
+    fields: List[Any] = [
+        server.get("name"),
+        server.get("title"),
+        server.get("owner"),
+        server.get("pack"),
+        server.get("type"),
+        *(server.get("env") or []),
+    ]
+    if server.get("type") == "http":
+        fields.append(server.get("url"))
+        fields.extend((server.get("headers") or {}).keys())
+    else:
+        fields.append(server.get("command"))
+    return ["m", server.get("name", ""), server.get("pack", "")], _tokens_of(fields)
+
+
+def build_search_index(packs: List[Dict[str, Any]], mcp_servers: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the inverted index for the assembled site packs and MCP servers."""
+    documents: List[Tuple[List[str], Set[str]]] = []
+    for pack in packs:
+        documents.extend(_pack_documents(pack))
+    for server in mcp_servers:
+        documents.append(_server_document(server))
+
+    inverted: Dict[str, List[int]] = {}
+    for doc_id, (_, tokens) in enumerate(documents):
+        for token in tokens:
+            inverted.setdefault(token, []).append(doc_id)
+
+    tokens = sorted(inverted)
+    return {
+        "version": SEARCH_INDEX_VERSION,
+        "docs": [entry for entry, _ in documents],
+        "tokens": tokens,
+        "postings": [inverted[t] for t in tokens],
+    }
+
+
+def search_documents(index: Dict[str, Any], query: str) -> Set[int]:
+    """Doc ids matching every term of ``query`` by prefix, as searchIndexMatches in app.js."""
+    terms = sorted(tokenize(query))
+    if not terms:
+        return set()
+    tokens, postings = index["tokens"], index["postings"]
+    matched: Set[int] | None = None
+    for term in terms:
+        term_docs: Set[int] = set()
+        i = bisect_left(tokens, term)
+        while i < len(tokens) and tokens[i].startswith(term):
+            term_docs.update(postings[i])
+            i += 1
+        matched = term_docs if matched is None else matched & term_docs
+    return matched or set()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Stub MCP stdio server for exercising validate_mcp_tools.py without real servers.
+
+Answers initialize and paginated tools/list (nextCursor). Behaviour is set with
+environment variables:
+
+  STUB_TOOLS=5        number of tools (tool_0 .. tool_N-1)
+  STUB_PAGE_SIZE=2    tools per tools/list page
+  STUB_DELAY=0        seconds to wait before answering initialize (slow start-up)
+  STUB_FAIL_PAGE=N    answer tools/list page N (1-based) with a JSON-RPC error
+  STUB_EXIT=CODE      write to stderr and exit before initialize
+"""
+
+import json
+import os
+import sys
+import time
+
+
+def main() -> int:
+    if os.environ.get("STUB_EXIT"):
+        print("stub server: exiting on request", file=sys.stderr)
+        return int(os.environ["STUB_EXIT"])
+    tools = [f"tool_{i}" for i in range(int(os.environ.get("STUB_TOOLS", "5")))]
+    page_size = int(os.environ.get("STUB_PAGE_SIZE", "2"))
+    fail_page = int(os.environ.get("STUB_FAIL_PAGE", "0") or 0)
+    delay = float(os.environ.get("STUB_DELAY", "0") or 0)
+
+    for line in sys.stdin:
+        msg = json.loads(line)
+        if "id" not in msg:
+            continue  # notification
+        reply = {"jsonrpc": "2.0", "id": msg["id"]}
+        if msg["method"] == "initialize":
+            time.sleep(delay)
+            reply["result"] = {
+                "protocolVersion": "2024-11-05",
+                "serverInfo": {"name": "stub-mcp-server", "version": "1.0.0"},
+                "capabilities": {"tools": {}},
+            }
+        elif msg["method"] == "tools/list":
+            start = int(msg.get("params", {}).get("cursor") or 0)
+            if fail_page and start // page_size + 1 == fail_page:
+                reply["error"] = {"code": -32603, "message": f"stub failure on page {fail_page}"}
+            else:
+                page = tools[start:start + page_size]
+                reply["result"] = {"tools": [{"name": t, "inputSchema": {"type": "object"}} for t in page]}
+                if start + page_size < len(tools):
+                    reply["result"]["nextCursor"] = str(start + page_size)
+        else:
+            reply["error"] = {"code": -32601, "message": f"method not found: {msg['method']}"}
+        print(json.dumps(reply), flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+All .catalog checks in one process: Iteration 3 (schema, roster, #fragment refs, YAML banner),
+Iteration 5 (semantic rules, collection.json mirror drift) and the federated catalog cross-check.
+
+Same errors as validate_collection_compliance.py followed by validate_federation_catalog_all.py,
+but catalog/schema.yaml is compiled once and each collection.yaml parsed once; prints the time
+spent in each check.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import collection_validate_lib as cvl
+from change_set import add_changed_arguments, change_set_from_args
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--no-federation",
+        action="store_true",
+        help="Skip the federated cross-check (no clones of external repositories)",
+    )
+    add_changed_arguments(parser)
+    args = parser.parse_args()
+    changes = change_set_from_args(args, __file__)
+    packs = None if changes is None or changes.validate_all else changes.packs
+
+    root = Path(__file__).resolve().parent.parent
+    start = time.perf_counter()
+    report = cvl.validate_catalogs_batch(root, packs=packs, federation_cross_check=not args.no_federation)
+    elapsed = time.perf_counter() - start
+
+    print(f"⏱️  {len(report.packs)} catalog(s) in {elapsed * 1000:.0f} ms:")
+    for line in cvl.format_batch_timings(report):
+        print(f"  {line}")
+    if report.errors:
+        print("Catalog validation failed:", file=sys.stderr)
+        for e in report.errors:
+            print(f"  • {e}", file=sys.stderr)
+        return 1
+    print("✓ Catalog validation passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
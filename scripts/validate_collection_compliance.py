@@ -1,15 +1,22 @@
 #!/usr/bin/env python3
 """Full collection compliance (Iteration 3 + semantic rules + collection.json mirror drift)."""
 
+import argparse
 import sys
 from pathlib import Path
 
 import collection_validate_lib as cvl
+from change_set import add_changed_arguments, change_set_from_args
 
 
 def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_changed_arguments(parser)
+    changes = change_set_from_args(parser.parse_args(), __file__)
+    packs = None if changes is None or changes.validate_all else changes.packs
+
     root = Path(__file__).resolve().parent.parent
-    errs = cvl.validate_all_iteration5(root)
+    errs = cvl.validate_all_iteration5(root, packs=packs)
     if errs:
         print("Collection compliance failed:", file=sys.stderr)
         for e in errs:
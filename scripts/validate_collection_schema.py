@@ -1,15 +1,22 @@
 #!/usr/bin/env python3
 """Iteration 3: validate .catalog/collection.yaml (presence, schema, roster, #fragment refs, YAML banner)."""
 
+import argparse
 import sys
 from pathlib import Path
 
 import collection_validate_lib as cvl
+from change_set import add_changed_arguments, change_set_from_args
 
 
 def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_changed_arguments(parser)
+    changes = change_set_from_args(parser.parse_args(), __file__)
+    packs = None if changes is None or changes.validate_all else changes.packs
+
     root = Path(__file__).resolve().parent.parent
-    errs = cvl.validate_all_iteration3(root, check_banner=True)
+    errs = cvl.validate_all_iteration3(root, check_banner=True, packs=packs)
     if errs:
         print("Collection schema validation failed:", file=sys.stderr)
         for e in errs:
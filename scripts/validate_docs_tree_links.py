@@ -18,12 +18,13 @@ from __future__ import annotations
 
 import argparse
 import json
-import os
-import re
 import sys
 from pathlib import Path
 from typing import Iterable
 
+from change_set import add_changed_arguments, change_set_from_args
+from md_link_graph import LinkGraph, is_external
+
 DEFAULT_PACKS = [
     "rh-sre",
     "rh-developer",
@@ -33,18 +34,6 @@ DEFAULT_PACKS = [
     "rh-automation",
 ]
 
-MD_LINK_RE = re.compile(r"\[[^\]]+\]\(([^)]+)\)")
-
-
-def is_external(target: str) -> bool:
-    lower = target.lower()
-    return (
-        lower.startswith("http://")
-        or lower.startswith("https://")
-        or lower.startswith("mailto:")
-        or lower.startswith("#")
-    )
-
 
 def resolve_packs(paths: Iterable[str]) -> set[Path]:
     packs: set[Path] = set()
@@ -82,55 +71,46 @@ def scan_targets(pack_root: Path) -> list[Path]:
     return targets
 
 
-def validate_file(path: Path, pack_root: Path) -> list[str]:
+def validate_file(path: Path, pack_root: Path, graph: LinkGraph | None = None) -> list[str]:
+    graph = graph if graph is not None else LinkGraph()
     errs: list[str] = []
-    text = path.read_text(encoding="utf-8", errors="ignore")
     is_skill_docs = "/skills/" in path.as_posix() and "/docs/" in path.as_posix()
     is_pack_meta = (path == (pack_root / "README.md")) or (path.parent == (pack_root / ".catalog"))
-    for line_no, line in enumerate(text.splitlines(), start=1):
-        for m in MD_LINK_RE.finditer(line):
-            raw = m.group(1).strip()
-            if is_external(raw):
-                continue
-            base = raw.split("#", 1)[0].strip()
-            if not base.endswith(".md"):
-                continue
+    for line_no, target in graph.links(path):
+        raw = target.strip()
+        if is_external(raw):
+            continue
+        base = raw.split("#", 1)[0].strip()
+        if not base.endswith(".md"):
+            continue
 
-            # For pack README / catalog fragments, validate only pack-local docs references.
-            if is_pack_meta:
-                if not (base.startswith("docs/") or base.startswith("skills/")):
-                    continue
-                link_path = (pack_root / base)
-            else:
-                link_path = (path.parent / base)
-            try:
-                resolved = link_path.resolve(strict=True)
-            except FileNotFoundError:
-                errs.append(f"{path}:{line_no}: missing linked doc '{raw}'")
-                continue
-            except RuntimeError:
-                errs.append(f"{path}:{line_no}: symlink loop for '{raw}'")
+        # For pack README / catalog fragments, validate only pack-local docs references.
+        if is_pack_meta:
+            if not (base.startswith("docs/") or base.startswith("skills/")):
                 continue
+            link_path = (pack_root / base)
+        else:
+            link_path = (path.parent / base)
+        resolution = graph.resolve(link_path)
+        if resolution.error == "missing":
+            errs.append(f"{path}:{line_no}: missing linked doc '{raw}'")
+            continue
+        if resolution.error == "loop":
+            errs.append(f"{path}:{line_no}: symlink loop for '{raw}'")
+            continue
 
-            if is_skill_docs:
-                try:
-                    resolved.relative_to(pack_root)
-                except ValueError:
-                    errs.append(
-                        f"{path}:{line_no}: link escapes pack root '{raw}' -> '{resolved}'"
-                    )
-
-            if link_path.is_symlink():
-                raw_link = os.readlink(link_path)
-                immediate = (
-                    link_path.parent / raw_link
-                    if not os.path.isabs(raw_link)
-                    else Path(raw_link)
+        if is_skill_docs:
+            try:
+                resolution.resolved.relative_to(pack_root)
+            except ValueError:
+                errs.append(
+                    f"{path}:{line_no}: link escapes pack root '{raw}' -> '{resolution.resolved}'"
                 )
-                if immediate.is_symlink():
-                    errs.append(
-                        f"{path}:{line_no}: symlink chain detected for '{raw}'"
-                    )
+
+        if resolution.symlink_chain:
+            errs.append(
+                f"{path}:{line_no}: symlink chain detected for '{raw}'"
+            )
     return errs
 
 
@@ -145,18 +125,23 @@ def main() -> int:
         help="Pack directories or SKILL.md paths",
     )
     parser.add_argument("--json-out", help="Optional JSON summary output path")
+    add_changed_arguments(parser)
     args = parser.parse_args()
+    changes = change_set_from_args(args, __file__)
 
     packs = resolve_packs(args.paths)
     if not packs:
         packs = {Path(p).resolve() for p in DEFAULT_PACKS if (Path(p) / "skills").exists()}
+    if changes is not None:
+        packs = {p for p in packs if changes.affects_path(p)}
 
     all_errors: list[str] = []
     scanned_files = 0
+    graph = LinkGraph()
     for pack in sorted(packs):
         for f in scan_targets(pack):
             scanned_files += 1
-            all_errors.extend(validate_file(f, pack))
+            all_errors.extend(validate_file(f, pack, graph))
 
     summary = {
         "packs_scanned": len(packs),
@@ -35,6 +35,7 @@ from dataclasses import dataclass, field, asdict
 from pathlib import Path
 
 import pack_registry
+from federation_clone_cache import CloneError, checkout_at_ref
 
 
 LOLA_REQUIRED_FIELDS = ["name", "description", "version", "repository"]
@@ -79,27 +80,13 @@ def check_federation_ref(ref: str | None) -> CheckResult:
     return check
 
 
-def clone_at_ref(repo_url: str, ref: str, dest: Path) -> CheckResult:
+def clone_at_ref(repo_url: str, ref: str, dest: Path, pack_path: str = ".") -> CheckResult:
     check = CheckResult(name="clone")
-    sha = pack_registry.normalize_federation_ref(ref)
     try:
-        subprocess.run(
-            ["git", "clone", "--quiet", "--no-checkout", repo_url, str(dest)],
-            check=True, capture_output=True, text=True, timeout=120,
-        )
-        subprocess.run(
-            ["git", "checkout", "--quiet", sha],
-            check=True, capture_output=True, text=True, cwd=dest, timeout=30,
-        )
-        check.details.append(f"Cloned and checked out {sha}")
+        checkout_at_ref(repo_url, ref, dest, pack_path)
+        check.details.append(f"Cloned and checked out {pack_registry.normalize_federation_ref(ref)}")
         check.passed = True
-    except subprocess.CalledProcessError as exc:
-        check.passed = False
-        check.details.append(exc.stderr.strip() or str(exc))
-    except subprocess.TimeoutExpired:
-        check.passed = False
-        check.details.append("Git operation timed out")
-    except ValueError as exc:
+    except CloneError as exc:
         check.passed = False
         check.details.append(str(exc))
     return check
@@ -188,7 +175,7 @@ def run_tier2(pack_dir: Path) -> CheckResult:
 
     try:
         result = subprocess.run(
-            [sys.executable, str(validator), str(pack_dir)],
+            [sys.executable, str(validator), str(pack_dir), "--format", "json"],
             capture_output=True, text=True, timeout=60,
         )
         if result.returncode == 0:
@@ -196,9 +183,15 @@ def run_tier2(pack_dir: Path) -> CheckResult:
             check.details.append("All skills passed Tier 2")
         else:
             check.passed = False
-            for line in result.stdout.strip().splitlines():
-                if line.strip() and ("❌" in line or "•" in line):
-                    check.details.append(line.strip())
+            try:
+                report = json.loads(result.stdout)
+            except json.JSONDecodeError:
+                report = {}
+            for item in report.get("layout_errors", []):
+                check.details.append(f"{item['path']}: {item['error']}")
+            for skill in report.get("skills", []):
+                for err in skill["errors"]:
+                    check.details.append(f"{skill['path']}: {err}")
             if not check.details:
                 check.details.append("Tier 2 validation failed (see output above)")
     except subprocess.TimeoutExpired:
@@ -346,7 +339,7 @@ def main() -> int:
             return 1
 
         # Step 1: Clone
-        clone_result = clone_at_ref(args.repo_url, args.ref, tmp / "repo")
+        clone_result = clone_at_ref(args.repo_url, args.ref, tmp / "repo", args.pack_path)
         report.checks.append(clone_result)
         if not clone_result.passed:
             if args.json:
@@ -92,10 +92,18 @@ def check_catalog_present(module_name: str, repo_root: Optional[Path] = None) ->
     return check
 
 
-def check_catalog_compliance(module_name: str, repo_root: Optional[Path] = None) -> CheckResult:
+def check_catalog_compliance(
+    module_name: str,
+    repo_root: Optional[Path] = None,
+    compliance_errors: Optional[List[str]] = None,
+) -> CheckResult:
+    """Iteration 5 compliance; pass ``compliance_errors`` when the caller already ran it."""
     check = CheckResult(name="catalog_compliance")
     cat_dir = federation_catalog_dir(module_name)
-    errs = cvl.validate_pack_iteration5(cat_dir, repo_root, is_federated=True)
+    if compliance_errors is None:
+        errs = cvl.validate_pack_iteration5(cat_dir, repo_root, is_federated=True)
+    else:
+        errs = compliance_errors
     if errs:
         check.details.extend(errs[:20])
         if len(errs) > 20:
@@ -234,6 +242,7 @@ def run_catalog_validation(
     repo_root: Optional[Path] = None,
     external_pack_root: Optional[Path] = None,
     cleanup_clone: bool = True,
+    compliance_errors: Optional[List[str]] = None,
 ) -> CatalogReport:
     from validate_federation import check_federation_ref, clone_at_ref
 
@@ -254,7 +263,7 @@ def run_catalog_validation(
     pack_root = external_pack_root
     if pack_root is None:
         tmp = Path(tempfile.mkdtemp(prefix="federation-catalog-"))
-        clone = clone_at_ref(repo_url, ref, tmp / "repo")
+        clone = clone_at_ref(repo_url, ref, tmp / "repo", pack_path)
         report.checks.append(clone)
         if not clone.passed:
             if cleanup_clone and tmp:
@@ -270,7 +279,7 @@ def run_catalog_validation(
             shutil.rmtree(tmp, ignore_errors=True)
         return report
 
-    report.checks.append(check_catalog_compliance(module_name, root))
+    report.checks.append(check_catalog_compliance(module_name, root, compliance_errors))
     report.checks.append(check_external_skill_roster(module_name, pack_root, root))
     report.checks.append(check_plugins_json_title(module_name, root))
     if module_meta:
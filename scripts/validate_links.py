@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Validate all pack markdown links in one pass over a shared link graph.
+
+Runs the checks of validate_skill_doc_links.py (skill-local docs convention) and
+validate_docs_tree_links.py (docs trees, pack README, catalog fragments) with one
+md_link_graph.LinkGraph, so every file is read and every link target resolved
+once. Also reports skill files nothing links to:
+
+- orphan docs: skills/<name>/docs/**/*.md not reachable from the skill's SKILL.md
+  (README.md / SOURCES.md under docs/ count as roots and are never orphans)
+- unreachable references: files under skills/<name>/references/ never linked
+
+Orphans are warnings unless --strict-orphans is given.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import validate_docs_tree_links as tree_links
+import validate_skill_doc_links as skill_links
+from change_set import add_changed_arguments, change_set_from_args
+from md_link_graph import LinkGraph, unreachable_skill_files
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Validate skill docs links, docs tree links and orphan skill files in one pass"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        default=skill_links.DEFAULT_PACKS,
+        help="Pack directories or SKILL.md paths to validate",
+    )
+    parser.add_argument("--json-out", help="Optional JSON summary output path")
+    parser.add_argument(
+        "--strict-orphans",
+        action="store_true",
+        help="Fail on orphan docs and unreachable references (default: warn)",
+    )
+    add_changed_arguments(parser)
+    args = parser.parse_args()
+    changes = change_set_from_args(args, __file__)
+
+    start = time.perf_counter()
+    graph = LinkGraph()
+
+    skill_files = skill_links.iter_skill_files(args.paths)
+    packs = tree_links.resolve_packs(args.paths)
+    if not packs:
+        packs = {Path(p).resolve() for p in tree_links.DEFAULT_PACKS if (Path(p) / "skills").exists()}
+    if changes is not None:
+        skill_files = changes.filter_skill_files(skill_files)
+        packs = {p for p in packs if changes.affects_path(p)}
+
+    print("🔍 Validating pack markdown links...")
+    skill_result = skill_links.ValidationResult(scanned_files=len(skill_files))
+    warnings: list[str] = []
+    for sf in skill_files:
+        skill_links.validate_skill_file(sf, skill_result, graph)
+        unreachable = unreachable_skill_files(sf, graph)
+        for f in unreachable["docs"]:
+            warnings.append(f"{f}: orphan doc (not reachable from {sf})")
+        for f in unreachable["references"]:
+            warnings.append(f"{f}: unreachable reference (not linked from {sf} or its docs)")
+
+    tree_errors: list[str] = []
+    tree_files = 0
+    for pack in sorted(packs):
+        for f in tree_links.scan_targets(pack):
+            tree_files += 1
+            tree_errors.extend(tree_links.validate_file(f, pack, graph))
+
+    errors = skill_result.errors + tree_errors
+    if args.strict_orphans:
+        errors = errors + warnings
+    summary = {
+        "skill_files": len(skill_files),
+        "docs_tree_files": tree_files,
+        "packs_scanned": len(packs),
+        "files_read": graph.stats["files"],
+        "targets_resolved": graph.stats["resolutions"],
+        "resolutions_reused": graph.stats["resolution_hits"],
+        "orphan_warnings": len(warnings),
+        "error_count": len(errors),
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+    if args.json_out:
+        Path(args.json_out).write_text(
+            json.dumps({"summary": summary, "errors": errors, "warnings": warnings}, indent=2),
+            encoding="utf-8",
+        )
+
+    if warnings and not args.strict_orphans:
+        print("⚠️  Files no skill links to:")
+        for warn in warnings:
+            print(f"  • {warn}")
+    if errors:
+        print("❌ Link validation failed:")
+        for err in errors:
+            print(f"  • {err}")
+        print(json.dumps(summary, indent=2))
+        return 1
+
+    print("✅ Pack markdown links validated successfully")
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
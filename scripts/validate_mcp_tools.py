@@ -6,49 +6,47 @@ Starts each container-based MCP server via podman, performs JSON-RPC
 initialize + tools/list, then cross-references against each skill's
 allowed-tools declaration.
 
-Platform: Linux and macOS only (uses select.select for non-blocking I/O).
+JSON-RPC goes through the asyncio stdio client in mcp_stdio_client.py: initialize
+is sent as soon as the container starts (no start-up sleeps) and a server that
+exits early is reported at once with its stderr.
 
 Usage:
     python scripts/validate_mcp_tools.py [pack1] [pack2] ...
     python scripts/validate_mcp_tools.py --summary-only --log-file .validate/mcp-tools.log
+    python scripts/validate_mcp_tools.py --refresh    # ignore cached tool lists
     No args: validates all packs that have mcps.json
+
+Tool lists are cached per image digest and server args (see mcp_tool_cache.py),
+so servers whose image has not changed are not started again.
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import os
-import select
 import subprocess
 import sys
+import threading
 import time
 from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TextIO
 
+import mcp_tool_cache
+from mcp_stdio_client import JsonRpcError, McpClientError, McpStdioClient, PartialToolList, ServerExited
+from md_frontmatter import read_frontmatter_block
+
 JSONRPC_TIMEOUT = 30
 SERVER_START_TIMEOUT = 15
 PODMAN_PULL_TIMEOUT = 120
+# Upper bound on MCP servers probed at once (each is a container plus a pull)
+MAX_PROBE_JOBS = 8
 DEFAULT_LOG_FILE = Path(".validate/mcp-tools.log")
 
-INIT_MSG = {
-    "jsonrpc": "2.0",
-    "id": 1,
-    "method": "initialize",
-    "params": {
-        "protocolVersion": "2024-11-05",
-        "capabilities": {},
-        "clientInfo": {"name": "mcp-tool-validator", "version": "1.0.0"},
-    },
-}
-
-INITIALIZED_NOTIFICATION = {
-    "jsonrpc": "2.0",
-    "method": "notifications/initialized",
-}
-
 
 @dataclass
 class Finding:
@@ -78,6 +76,7 @@ class ValidationResult:
     warnings: list[Finding] = field(default_factory=list)
     skipped_servers: list[str] = field(default_factory=list)
     has_skipped_servers: bool = False
+    server_timings: list[ServerTiming] = field(default_factory=list)
 
     @property
     def success(self) -> bool:
@@ -176,6 +175,20 @@ def print_validation_summary(combined: ValidationResult, reporter: Reporter) ->
     )
     reporter.summary()
 
+    if combined.server_timings:
+        timings = sorted(combined.server_timings, key=lambda t: t.total_seconds, reverse=True)
+        reporter.summary(f" MCP servers probed ({len(timings)}, slowest first):")
+        for t in timings:
+            tools = f"{t.tools} tools" if t.tools is not None else "no tools"
+            packs = ", ".join(dict.fromkeys(t.packs))
+            if t.cached and not t.pull_seconds:
+                detail = "cached tool list"
+            else:
+                detail = f"pull {t.pull_seconds:.1f}s" + (" (shared)" if t.shared_pull else "")
+                detail += ", cached tool list" if t.cached else f", start + tools/list {t.query_seconds:.1f}s"
+            reporter.summary(f"   • {t.server} [{packs}]: {t.total_seconds:.1f}s ({detail}) — {tools}")
+        reporter.summary()
+
     if combined.skipped_servers:
         unique_servers = list(dict.fromkeys(combined.skipped_servers))
         reporter.summary(f" Skipped MCP servers ({len(unique_servers)}):")
@@ -257,52 +270,7 @@ def suggest_tool(name: str, available: set[str], max_distance: int = 3) -> str |
     return best[0] if best else None
 
 
-def read_response(proc: subprocess.Popen, expected_id: int, timeout: int = JSONRPC_TIMEOUT) -> dict | None:
-    """Read JSON-RPC responses from proc.stdout until one matches expected_id."""
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        remaining = deadline - time.time()
-        if remaining <= 0:
-            break
-
-        if proc.poll() is not None:
-            for line in proc.stdout:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    msg = json.loads(line)
-                    if msg.get("id") == expected_id:
-                        return msg
-                except json.JSONDecodeError:
-                    continue
-            return None
-
-        ready, _, _ = select.select([proc.stdout], [], [], min(remaining, 0.5))
-        if not ready:
-            continue
-
-        line = proc.stdout.readline()
-        if not line:
-            continue
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            msg = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if msg.get("id") == expected_id:
-            return msg
-    return None
-
-
-def send_jsonrpc(proc: subprocess.Popen, msg: dict) -> None:
-    proc.stdin.write(json.dumps(msg) + "\n")
-    proc.stdin.flush()
-
-
-def pull_image(image: str, reporter: Reporter) -> bool:
+def pull_image(image: str, reporter: Reporter | ServerLog) -> bool:
     """Pull a container image, returning True on success."""
     reporter.detail(f"    Pulling image: {image[:80]}...")
     try:
@@ -339,107 +307,66 @@ def extract_image_from_args(args: list[str]) -> str | None:
     return None
 
 
-def query_mcp_tools(
-    command: str, args: list[str], kubeconfig: str, reporter: Reporter,
-) -> list[str] | None:
-    """Start an MCP server and query its tools via JSON-RPC."""
-    expanded_args = [a.replace("${KUBECONFIG}", kubeconfig) for a in args]
+async def _query_mcp_tools(
+    command: str, args: list[str], reporter: Reporter | ServerLog,
+) -> tuple[list[str] | None, bool]:
+    async with McpStdioClient(command, args) as client:
+        try:
+            await client.initialize(timeout=SERVER_START_TIMEOUT)
+        except ServerExited as exc:
+            reporter.detail(
+                f"    Server exited before initialize (code {exc.returncode}): {exc.stderr.strip()[:300]}"
+            )
+            return None, False
+        except JsonRpcError as exc:
+            reporter.detail(f"    WARNING: initialize error: {exc.error}")
+            return None, False
+        except McpClientError:
+            reporter.detail("    WARNING: no response to initialize")
+            return None, False
 
-    proc = subprocess.Popen(
-        [command] + expanded_args,
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1,
-    )
+        reporter.detail(f"    Server: {client.server_info.get('name', 'unknown')}")
 
-    try:
-        for _ in range(10):
-            if proc.poll() is not None:
-                stderr = proc.stderr.read()[:300] if proc.stderr else ""
-                reporter.detail(
-                    f"    Server exited immediately (code {proc.returncode}): {stderr.strip()}"
-                )
-                return None
-            time.sleep(0.1)
+        page, partial = 1, []
+        try:
+            tools = await client.list_tools(timeout=JSONRPC_TIMEOUT)
+        except PartialToolList as exc:
+            page, partial, error = exc.page, exc.tools, exc.cause
+        except McpClientError as exc:
+            error = exc
+        else:
+            return [t["name"] for t in tools if "name" in t], True
 
-        send_jsonrpc(proc, INIT_MSG)
-        resp = read_response(proc, expected_id=1, timeout=SERVER_START_TIMEOUT)
-        if resp is None:
-            reporter.detail("    WARNING: no response to initialize")
-            return None
-
-        if "error" in resp:
-            reporter.detail(f"    WARNING: initialize error: {resp['error']}")
-            return None
-
-        server_info = resp.get("result", {}).get("serverInfo", {})
-        reporter.detail(f"    Server: {server_info.get('name', 'unknown')}")
-
-        send_jsonrpc(proc, INITIALIZED_NOTIFICATION)
-
-        all_tools: list[str] = []
-        cursor = None
-        page = 0
-
-        while True:
-            page += 1
-            tools_msg = {
-                "jsonrpc": "2.0",
-                "id": 100 + page,
-                "method": "tools/list",
-                "params": {},
-            }
-            if cursor:
-                tools_msg["params"]["cursor"] = cursor
-
-            send_jsonrpc(proc, tools_msg)
-            resp = read_response(proc, expected_id=100 + page)
-            if resp is None:
-                reporter.detail(f"    WARNING: no response to tools/list (page {page})")
-                return all_tools if all_tools else None
-
-            if "error" in resp:
-                reporter.detail(f"    WARNING: tools/list error: {resp['error']}")
-                return all_tools if all_tools else None
-
-            result = resp.get("result", {})
-            tools = result.get("tools", [])
-            all_tools.extend(t["name"] for t in tools)
-
-            next_cursor = result.get("nextCursor")
-            if next_cursor:
-                cursor = next_cursor
-            else:
-                break
+        if isinstance(error, JsonRpcError):
+            reporter.detail(f"    WARNING: tools/list error: {error.error}")
+        else:
+            reporter.detail(f"    WARNING: no response to tools/list (page {page})")
+        names = [t["name"] for t in partial if "name" in t]
+        return names or None, False
 
-        return all_tools
 
-    finally:
-        proc.stdin.close()
-        try:
-            proc.terminate()
-            proc.wait(timeout=5)
-        except subprocess.TimeoutExpired:
-            proc.kill()
-            proc.wait()
+def query_mcp_tools(
+    command: str, args: list[str], kubeconfig: str, reporter: Reporter | ServerLog,
+) -> tuple[list[str] | None, bool]:
+    """
+    Start an MCP server and query its tools via JSON-RPC (see mcp_stdio_client.py).
+
+    Returns (tool names, complete). When a later tools/list page fails, the names from
+    the pages received are still returned (better than nothing for this run) with
+    ``complete=False``; such lists must not be cached.
+    """
+    expanded_args = [a.replace("${KUBECONFIG}", kubeconfig) for a in args]
+    return asyncio.run(_query_mcp_tools(command, expanded_args, reporter))
 
 
 def parse_frontmatter(skill_path: Path) -> tuple[str, int | None]:
     """Extract allowed-tools value and its line number from SKILL.md frontmatter."""
-    in_fm = False
-    with open(skill_path) as f:
-        for line_num, line in enumerate(f, 1):
-            stripped = line.strip()
-            if stripped == "---":
-                if not in_fm:
-                    in_fm = True
-                    continue
-                break
-            if in_fm and stripped.startswith("allowed-tools:"):
-                value = stripped[len("allowed-tools:"):].strip()
-                return value, line_num
+    block = read_frontmatter_block(skill_path)
+    for offset, line in enumerate(block.lines):
+        stripped = line.strip()
+        if stripped.startswith("allowed-tools:"):
+            value = stripped[len("allowed-tools:"):].strip()
+            return value, block.first_line + offset
     return "", None
 
 
@@ -453,66 +380,188 @@ def find_packs(repo_root: Path) -> list[str]:
     return packs
 
 
-def validate_pack(
-    pack: str, repo_root: Path, kubeconfig: str, reporter: Reporter,
-) -> ValidationResult:
-    """Validate all skills in a single pack against its MCP servers."""
-    result = ValidationResult()
-    pack_dir = repo_root / pack
-    mcps_file = pack_dir / "mcps.json"
+class ServerLog:
+    """Per-server detail lines buffered while probes run concurrently, replayed in pack order."""
 
-    if not mcps_file.exists():
-        reporter.detail(f"  WARNING: {pack}/mcps.json not found, skipping pack")
-        return result
+    def __init__(self) -> None:
+        self.lines: list[str] = []
 
-    try:
-        with open(mcps_file) as f:
-            config = json.load(f)
-    except (json.JSONDecodeError, OSError) as e:
-        reporter.detail(f"  ERROR: failed to parse {pack}/mcps.json: {e}")
-        result.failed += 1
-        return result
+    def detail(self, message: str = "") -> None:
+        self.lines.append(message)
+
+
+class ImagePuller:
+    """Pull each image at most once per run, however many servers (or packs) share it."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pulls: dict[str, Future] = {}
+
+    def pull(self, image: str, log: ServerLog) -> tuple[bool, float, bool]:
+        """(pulled ok, seconds spent waiting for the pull, whether another server started it)."""
+        with self._lock:
+            future = self._pulls.get(image)
+            shared = future is not None
+            if future is None:
+                future = self._pulls[image] = Future()
+        start = time.perf_counter()
+        if not shared:
+            try:
+                future.set_result(pull_image(image, log))
+            except Exception as exc:  # never leave waiting servers blocked
+                future.set_exception(exc)
+        else:
+            log.detail(f"    Image already pulled for another server: {image[:80]}")
+        return future.result(), time.perf_counter() - start, shared
 
-    servers = config.get("mcpServers", {})
-    all_available_tools: set[str] = set()
 
-    for server_name, server_config in servers.items():
-        command = server_config.get("command", "")
+@dataclass
+class ServerProbe:
+    """One distinct MCP server launch (command + args); packs declaring the same server share it."""
+
+    name: str
+    command: str
+    args: list[str]
+    users: list[str] = field(default_factory=list)
+    """``pack/server-name`` entries that declare this server."""
+    tools: list[str] | None = None
+    log: ServerLog = field(default_factory=ServerLog)
+    pull_seconds: float = 0.0
+    query_seconds: float = 0.0
+    shared_pull: bool = False
+    cached: bool = False
 
-        if command not in ("podman", "docker"):
-            reason = f"non-container command '{command}'"
-            reporter.detail(f"  SKIP server '{server_name}': {reason}")
-            result.skipped_servers.append(f"{server_name} ({reason})")
-            continue
+    @property
+    def key(self) -> tuple[str, tuple[str, ...]]:
+        return server_key(self.command, self.args)
 
-        args = server_config.get("args", [])
-        reporter.detail(f"  Starting MCP server '{server_name}'...")
 
-        image = extract_image_from_args(args)
-        if image:
-            if not pull_image(image, reporter):
-                reporter.detail("    WARNING: could not pull image, attempting to start anyway")
+@dataclass
+class ServerTiming:
+    server: str
+    packs: list[str]
+    pull_seconds: float
+    query_seconds: float
+    tools: int | None
+    shared_pull: bool = False
+    cached: bool = False
 
-        tools = query_mcp_tools(command, args, kubeconfig, reporter)
+    @property
+    def total_seconds(self) -> float:
+        return self.pull_seconds + self.query_seconds
 
-        if tools is None:
-            reporter.detail("    WARNING: no tools returned (server may require credentials)")
-            result.skipped_servers.append(f"{server_name} (no tools returned)")
-            continue
 
-        reporter.detail(f"    {len(tools)} tools available")
-        for t in sorted(tools):
-            reporter.detail(f"      - {t}")
-        all_available_tools.update(tools)
+def server_key(command: str, args: list[str]) -> tuple[str, tuple[str, ...]]:
+    return command, tuple(args)
+
+
+def _cached_tools(
+    probe: ServerProbe, cache: mcp_tool_cache.ToolListCache | None, key: str | None,
+) -> bool:
+    """Fill ``probe.tools`` from the cache; True on a hit."""
+    if cache is None or key is None:
+        return False
+    hit = cache.get(key)
+    if hit is None:
+        return False
+    probe.tools, age = hit
+    probe.cached = True
+    probe.log.detail(f"    Cached tool list ({key.split('|', 1)[0][:19]}…, {age / 3600:.1f}h old)")
+    return True
+
+
+def probe_server(
+    probe: ServerProbe,
+    kubeconfig: str,
+    puller: ImagePuller,
+    cache: mcp_tool_cache.ToolListCache | None = None,
+) -> ServerProbe:
+    """
+    List the server's tools; fills ``probe`` in place.
+
+    A digest-pinned image with a cached tool list needs neither a pull nor a
+    container. Tag images are pulled (once per run) to learn the current digest,
+    then the cache is consulted before starting the container.
+    """
+    image = extract_image_from_args(probe.args)
+    key: str | None = None
+    if image:
+        digest = mcp_tool_cache.pinned_digest(image)
+        if digest:
+            key = mcp_tool_cache.cache_key(digest, probe.command, probe.args)
+            if _cached_tools(probe, cache, key):
+                return probe
+        ok, probe.pull_seconds, probe.shared_pull = puller.pull(image, probe.log)
+        if not ok:
+            probe.log.detail("    WARNING: could not pull image, attempting to start anyway")
+        if key is None and cache is not None:
+            digest = mcp_tool_cache.local_image_digest(probe.command, image)
+            if digest:
+                key = mcp_tool_cache.cache_key(digest, probe.command, probe.args)
+                if _cached_tools(probe, cache, key):
+                    return probe
+    start = time.perf_counter()
+    probe.tools, complete = query_mcp_tools(probe.command, probe.args, kubeconfig, probe.log)
+    probe.query_seconds = time.perf_counter() - start
+    if cache is not None and key is not None and probe.tools:
+        if complete:
+            cache.put(key, probe.tools, image or "")
+        else:
+            probe.log.detail("    Partial tool list not cached")
+    return probe
+
 
-    result.has_skipped_servers = len(result.skipped_servers) > 0
+def run_probes(
+    probes: list[ServerProbe],
+    kubeconfig: str,
+    jobs: int | None = None,
+    cache: mcp_tool_cache.ToolListCache | None = None,
+) -> None:
+    """Probe all servers in a bounded thread pool (``jobs`` None = one worker per server, max MAX_PROBE_JOBS)."""
+    if not probes:
+        return
+    workers = jobs if jobs is not None else min(len(probes), MAX_PROBE_JOBS)
+    puller = ImagePuller()
+    if workers <= 1:
+        for probe in probes:
+            probe_server(probe, kubeconfig, puller, cache)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for future in [pool.submit(probe_server, p, kubeconfig, puller, cache) for p in probes]:
+                future.result()
+    if cache is not None:
+        cache.save()
+
+
+def load_pack_servers(
+    pack: str, repo_root: Path, reporter: Reporter, result: ValidationResult,
+) -> dict | None:
+    """``mcpServers`` of ``<pack>/mcps.json``, or None when the pack is skipped or the file is invalid."""
+    mcps_file = repo_root / pack / "mcps.json"
+    if not mcps_file.exists():
+        reporter.detail(f"  WARNING: {pack}/mcps.json not found, skipping pack")
+        return None
+    try:
+        with open(mcps_file) as f:
+            config = json.load(f)
+    except (json.JSONDecodeError, OSError) as e:
+        reporter.detail(f"  ERROR: failed to parse {pack}/mcps.json: {e}")
+        result.failed += 1
+        return None
+    return config.get("mcpServers", {})
 
-    if all_available_tools:
-        reporter.detail(f"  Combined tool pool: {len(all_available_tools)} unique tools")
 
-    skills_dir = pack_dir / "skills"
+def check_pack_skills(
+    pack: str,
+    repo_root: Path,
+    all_available_tools: set[str],
+    result: ValidationResult,
+    reporter: Reporter,
+) -> None:
+    """Cross-reference each skill's allowed-tools against the pack's combined tool pool."""
+    skills_dir = repo_root / pack / "skills"
     if not skills_dir.exists():
-        return result
+        return
 
     for skill_dir in sorted(skills_dir.iterdir()):
         skill_file = skill_dir / "SKILL.md"
@@ -572,6 +621,112 @@ def validate_pack(
                 result.findings.append(finding)
                 reporter.detail(f"  FAIL {pack}/{skill_name}: {finding}")
 
+
+def validate_packs(
+    packs: list[str],
+    repo_root: Path,
+    kubeconfig: str,
+    reporter: Reporter,
+    jobs: int | None = None,
+    cache: mcp_tool_cache.ToolListCache | None = None,
+) -> tuple[list[tuple[str, ValidationResult]], list[ServerTiming]]:
+    """
+    Validate several packs, probing every distinct container MCP server concurrently.
+
+    Servers declared identically by several packs are started once, and images are
+    pulled once per run; wall time is bounded by the slowest server rather than the
+    sum. With a ``cache``, unchanged servers (same image digest and args) reuse
+    their stored tool list without starting a container. Detail output is replayed
+    per pack in order after all probes finish.
+
+    Returns:
+        (per-pack results in ``packs`` order, one timing per distinct server probed)
+    """
+    results: dict[str, ValidationResult] = {}
+    pack_servers: dict[str, dict] = {}
+    probes: dict[tuple[str, tuple[str, ...]], ServerProbe] = {}
+    setup_logs: dict[str, ServerLog] = {}
+
+    for pack in packs:
+        result = results[pack] = ValidationResult()
+        log = setup_logs[pack] = ServerLog()
+        servers = load_pack_servers(pack, repo_root, log, result)
+        if servers is None:
+            continue
+        pack_servers[pack] = servers
+        for server_name, server_config in servers.items():
+            command = server_config.get("command", "")
+            if command not in ("podman", "docker"):
+                continue
+            args = server_config.get("args", [])
+            probe = probes.setdefault(
+                server_key(command, args), ServerProbe(name=server_name, command=command, args=args),
+            )
+            probe.users.append(f"{pack}/{server_name}")
+
+    run_probes(list(probes.values()), kubeconfig, jobs, cache)
+
+    out: list[tuple[str, ValidationResult]] = []
+    for pack in packs:
+        result = results[pack]
+        reporter.detail(f"-- {pack} --")
+        for line in setup_logs[pack].lines:
+            reporter.detail(line)
+        servers = pack_servers.get(pack)
+        if servers is not None:
+            all_available_tools: set[str] = set()
+            for server_name, server_config in servers.items():
+                command = server_config.get("command", "")
+                if command not in ("podman", "docker"):
+                    reason = f"non-container command '{command}'"
+                    reporter.detail(f"  SKIP server '{server_name}': {reason}")
+                    result.skipped_servers.append(f"{server_name} ({reason})")
+                    continue
+                probe = probes[server_key(command, server_config.get("args", []))]
+                reporter.detail(f"  Starting MCP server '{server_name}'...")
+                if probe.users[0] == f"{pack}/{server_name}":
+                    for line in probe.log.lines:
+                        reporter.detail(line)
+                else:
+                    reporter.detail(f"    Same server as {probe.users[0]}, reusing its tool list")
+                if probe.tools is None:
+                    reporter.detail("    WARNING: no tools returned (server may require credentials)")
+                    result.skipped_servers.append(f"{server_name} (no tools returned)")
+                    continue
+                reporter.detail(f"    {len(probe.tools)} tools available")
+                for t in sorted(probe.tools):
+                    reporter.detail(f"      - {t}")
+                all_available_tools.update(probe.tools)
+
+            result.has_skipped_servers = len(result.skipped_servers) > 0
+            if all_available_tools:
+                reporter.detail(f"  Combined tool pool: {len(all_available_tools)} unique tools")
+            check_pack_skills(pack, repo_root, all_available_tools, result, reporter)
+        reporter.detail()
+        out.append((pack, result))
+
+    timings = [
+        ServerTiming(
+            server=p.name,
+            packs=[u.split("/", 1)[0] for u in p.users],
+            pull_seconds=p.pull_seconds,
+            query_seconds=p.query_seconds,
+            tools=len(p.tools) if p.tools is not None else None,
+            shared_pull=p.shared_pull,
+            cached=p.cached,
+        )
+        for p in probes.values()
+    ]
+    return out, timings
+
+
+def validate_pack(
+    pack: str, repo_root: Path, kubeconfig: str, reporter: Reporter,
+) -> ValidationResult:
+    """Validate all skills in a single pack against its MCP servers."""
+    results, timings = validate_packs([pack], repo_root, kubeconfig, reporter)
+    result = results[0][1]
+    result.server_timings.extend(timings)
     return result
 
 
@@ -614,6 +769,29 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         action="store_true",
         help="Print only the summary section on stdout (requires --log-file for details)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help=f"MCP servers probed concurrently (default: one per server, at most {MAX_PROBE_JOBS}; 1 = serial)",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached tool lists and query every server (results are still cached)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Neither read nor write the tool-list cache (.cache/mcp-tools.json)",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=mcp_tool_cache.DEFAULT_TTL_HOURS,
+        metavar="HOURS",
+        help=f"Reuse cached tool lists younger than this (default: {mcp_tool_cache.DEFAULT_TTL_HOURS}h)",
+    )
     return parser.parse_args(argv)
 
 
@@ -656,11 +834,15 @@ def main(argv: list[str] | None = None) -> int:
         reporter.detail(f"KUBECONFIG: {kubeconfig}")
         reporter.detail()
 
+        cache = None if args.no_cache else mcp_tool_cache.ToolListCache(
+            ttl_hours=args.cache_ttl, refresh=args.refresh,
+        )
         combined = ValidationResult()
+        results, combined.server_timings = validate_packs(
+            packs, repo_root, kubeconfig, reporter, jobs=args.jobs, cache=cache,
+        )
 
-        for pack in packs:
-            reporter.detail(f"-- {pack} --")
-            result = validate_pack(pack, repo_root, kubeconfig, reporter)
+        for _, result in results:
             combined.total_skills += result.total_skills
             combined.passed += result.passed
             combined.skipped += result.skipped
@@ -669,7 +851,6 @@ def main(argv: list[str] | None = None) -> int:
             combined.findings.extend(result.findings)
             combined.warnings.extend(result.warnings)
             combined.skipped_servers.extend(result.skipped_servers)
-            reporter.detail()
 
         print_validation_summary(combined, reporter)
 
@@ -19,14 +19,20 @@ Cannot validate: runtime behavior (AI actually reading docs), parameter correctn
 from __future__ import annotations
 
 import argparse
+import bisect
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import Iterator
+from typing import Iterable, Iterator
 
-import yaml
+from change_set import add_changed_arguments, change_set_from_args
+from md_frontmatter import split_frontmatter
+from md_metadata_cache import extract_outline, get_metadata
 
 # Design principle constants
 MAX_DESCRIPTION_TOKENS = 500
@@ -62,9 +68,9 @@ LATE_ORDERED_SECTIONS = [
     "Example Usage",
 ]
 LATE_SECTION_PATTERNS = {
-    "Dependencies": r"^Dependencies$",
-    "Human-in-the-Loop": r"Human-in-the-Loop",
-    "Example Usage": r"^Example Usage$",
+    "Dependencies": re.compile(r"^Dependencies$", re.IGNORECASE),
+    "Human-in-the-Loop": re.compile(r"Human-in-the-Loop", re.IGNORECASE),
+    "Example Usage": re.compile(r"^Example Usage$", re.IGNORECASE),
 }
 # Need at least 2 late sections present to validate their order
 MIN_LATE_SECTIONS_FOR_ORDER_CHECK = 2
@@ -83,9 +89,29 @@ CREDENTIAL_EXPOSURE_PATTERN = re.compile(
     re.MULTILINE,
 )
 
+# Workflow step heading (### Step N or #### Option); see iter_workflow_steps (DP2)
+WORKFLOW_STEP_HEADING = re.compile(r"###+ [^\n]+\n")
+
+# "## " section titles, untrimmed, inside fenced code too (DP6)
+SECTION_TITLE_PATTERN = re.compile(r"^## ([^\n#]+)", re.MULTILINE)
+
+# ## Dependencies section body; (?=\n## |\Z) avoids stopping at "### " subsections (DP4)
+DEPENDENCIES_SECTION_PATTERN = re.compile(r"## Dependencies\s*\n(.*?)(?=\n## |\Z)", re.DOTALL)
+
+# Bold "Document Consultation" block and the bold-delimited text that follows it (DP1)
+DOC_CONSULTATION_BLOCK = re.compile(
+    r"\*\*Document Consultation\*\*[^*]*(?:\*\*[^*]*\*\*[^*]*)*",
+    re.DOTALL,
+)
+
 # Anti-pattern context: if echo $VAR appears near these, it may be documenting the wrong way
 ANTI_PATTERN_MARKERS = ["WRONG", "NEVER", "❌", "don't", "do not", "exposes credentials"]
 
+# validate_skills: skill count below which process start-up costs more than it
+# saves (unless jobs is given explicitly), and skills per worker task
+PARALLEL_MIN_SKILLS = 200
+SKILLS_PER_TASK = 8
+
 # Pack layout (Lola format)
 MCP_FILENAME = "mcps.json"
 MCP_DEPRECATED = ".mcp.json"
@@ -144,28 +170,74 @@ def find_skill_files(pack_dirs: list[str]) -> Iterator[Path]:
 
 def extract_frontmatter(content: str) -> tuple[dict | None, str]:
     """Extract YAML frontmatter and body from markdown content."""
-    match = re.match(r"^---\s*\n(.*?)\n---\s*\n", content, re.DOTALL)
-    if not match:
-        return None, content
-    try:
-        frontmatter = yaml.safe_load(match.group(1))
-        body = content[match.end() :]
-        return frontmatter, body
-    except yaml.YAMLError:
-        return None, content
+    return split_frontmatter(content)
+
 
+@dataclass
+class SkillOutline:
+    """
+    A skill body and its ATX headings, taken from the cached markdown metadata
+    (md_metadata_cache) rather than re-scanned for every check.
+    """
 
-def check_dp1_document_consultation(body: str, result: ValidationResult) -> None:
+    body: str
+    headings: list[tuple[int, int, str, bool]]
+    """(body line, level, text, inside_code_fence), as md_metadata_cache.extract_outline."""
+
+    @cached_property
+    def line_starts(self) -> list[int]:
+        """Offset of each body line (only computed when a check needs line numbers)."""
+        starts = [0]
+        pos = self.body.find("\n")
+        while pos >= 0:
+            starts.append(pos + 1)
+            pos = self.body.find("\n", pos + 1)
+        return starts
+
+    @cached_property
+    def section_titles(self) -> list[str]:
+        """
+        Text after ``## `` on each section line, in document order, untrimmed and up to
+        any ``#``, inside fenced code too (SECTION_TITLE_PATTERN; shared by the DP6 checks).
+        """
+        return SECTION_TITLE_PATTERN.findall(self.body)
+
+    def line_of(self, offset: int) -> int:
+        """1-based body line containing ``offset``."""
+        return bisect.bisect_right(self.line_starts, offset)
+
+
+def build_outline(
+    body: str,
+    headings: Iterable[tuple[int, int, str, bool]] | None = None,
+    line_offset: int = 0,
+) -> SkillOutline:
+    """
+    Outline of ``body``. ``headings`` are MarkdownMeta.outline entries for the whole file
+    whose body starts after ``line_offset`` lines (frontmatter); without them the body is
+    scanned with extract_outline.
+    """
+    if headings is None:
+        return SkillOutline(body=body, headings=extract_outline(body))
+    return SkillOutline(
+        body=body,
+        headings=[
+            (line - line_offset, level, text, in_fence)
+            for line, level, text, in_fence in headings
+            if line > line_offset
+        ],
+    )
+
+
+def check_dp1_document_consultation(outline: SkillOutline, result: ValidationResult) -> None:
     """
     DP1: Document Consultation Transparency.
     - If Document Consultation appears, it must have Action: Read and Output to user.
     - Flag 'Transparency Theater' (output-only without Action).
     """
-    doc_consult_blocks = re.findall(
-        r"\*\*Document Consultation\*\*[^*]*(?:\*\*[^*]*\*\*[^*]*)*",
-        body,
-        re.DOTALL,
-    )
+    if "**Document Consultation**" not in outline.body:
+        return
+    doc_consult_blocks = DOC_CONSULTATION_BLOCK.findall(outline.body)
 
     for block in doc_consult_blocks:
         has_action_read = "Read [" in block or "Read [" in block.replace("\n", " ")
@@ -185,20 +257,37 @@ def check_dp1_document_consultation(body: str, result: ValidationResult) -> None
             )
 
 
-def check_dp2_parameter_order(body: str, result: ValidationResult) -> None:
+def iter_workflow_steps(body: str) -> Iterator[str]:
     """
-    DP2: Document consultation must appear BEFORE MCP Tool/Parameters.
-    Check workflow steps that have both.
+    Content of each workflow step: from a ``###+ title`` line to the next ``###+ `` marker
+    anywhere in the text. Same matches as ``(###+ [^\\n]+\\n)(.*?)(?=###+ |\\Z)`` without
+    the regex's per-character lookahead.
     """
-    # Find workflow steps (### Step N or #### Option)
-    step_pattern = re.compile(
-        r"(###+ [^\n]+\n)(.*?)(?=###+ |\Z)",
-        re.DOTALL,
-    )
+    pos = 0
+    while True:
+        heading = WORKFLOW_STEP_HEADING.search(body, pos)
+        if heading is None:
+            return
+        start = heading.end()
+        end = body.find("### ", start)
+        if end < 0:
+            end = len(body)
+        else:
+            # "#### " is a marker from its first '#'
+            while end > start and body[end - 1] == "#":
+                end -= 1
+        yield body[start:end]
+        pos = end
+
 
-    for match in step_pattern.finditer(body):
-        step_content = match.group(2)
-        has_mcp_tool = "MCP Tool" in step_content or "**MCP Tool**" in step_content
+def check_dp2_parameter_order(outline: SkillOutline, result: ValidationResult) -> None:
+    """
+    DP2: Document consultation must appear BEFORE MCP Tool/Parameters.
+    Check workflow steps that have both. A step runs from a ``###``/``####`` marker to
+    the next such marker (``##`` headings and fenced code do not end it).
+    """
+    for step_content in iter_workflow_steps(outline.body):
+        has_mcp_tool = "MCP Tool" in step_content
         has_params = "**Parameters**" in step_content or "Parameters:" in step_content
         has_doc_consult = "Document Consultation" in step_content
 
@@ -211,7 +300,7 @@ def check_dp2_parameter_order(body: str, result: ValidationResult) -> None:
                 result.errors.append(
                     "DP2: Document Consultation must appear BEFORE MCP Tool in workflow step"
                 )
-            if params_pos >= 0 and doc_pos > params_pos and "Parameters" in step_content:
+            if params_pos >= 0 and doc_pos > params_pos:
                 result.errors.append(
                     "DP2: Document Consultation must appear BEFORE Parameters in workflow step"
                 )
@@ -247,21 +336,19 @@ def check_dp3_conciseness(frontmatter: dict | None, result: ValidationResult) ->
         )
 
 
-def check_dp4_dependencies(body: str, result: ValidationResult) -> None:
+def check_dp4_dependencies(outline: SkillOutline, result: ValidationResult) -> None:
     """
     DP4: Dependencies Declaration.
-    Must have ## Dependencies with required subsections.
+    Must have ## Dependencies with required subsections. Any "## Dependencies" text
+    counts (also "### Dependencies" or inside fenced code); the section runs to the
+    next "## " line.
     """
+    body = outline.body
     if "## Dependencies" not in body:
         result.errors.append("DP4: Missing '## Dependencies' section")
         return
 
-    # Use (?=\n## |\Z) to avoid matching "## " inside "### " (subsection headers)
-    deps_section = re.search(
-        r"## Dependencies\s*\n(.*?)(?=\n## |\Z)",
-        body,
-        re.DOTALL,
-    )
+    deps_section = DEPENDENCIES_SECTION_PATTERN.search(body)
     if not deps_section:
         return
 
@@ -274,14 +361,14 @@ def check_dp4_dependencies(body: str, result: ValidationResult) -> None:
 
 
 def check_dp5_human_in_loop(
-    name: str, body: str, result: ValidationResult
+    name: str, outline: SkillOutline, result: ValidationResult
 ) -> None:
     """
     DP5: Human-in-the-Loop Requirements.
     Critical skills (executor, playbook, etc.) must have this section.
     """
     is_critical = any(kw in name.lower() for kw in CRITICAL_SKILL_KEYWORDS)
-    has_section = "Human-in-the-Loop" in body or "Human-in-the-Loop Requirements" in body
+    has_section = "Human-in-the-Loop" in outline.body
 
     if is_critical and not has_section:
         result.warnings.append(
@@ -290,13 +377,14 @@ def check_dp5_human_in_loop(
         )
 
 
-def check_dp6_mandatory_sections(body: str, result: ValidationResult) -> None:
+def check_dp6_mandatory_sections(outline: SkillOutline, result: ValidationResult) -> None:
     """
     DP6: Mandatory Skill Sections.
     Must have When to Use This Skill, Workflow. Prerequisites is optional.
     When present, sections must appear in order: Prerequisites, When to Use, Workflow.
+    Sections are SkillOutline.section_titles; required ones must match exactly.
     """
-    section_headings = re.findall(r"^## ([^\n#]+)", body, re.MULTILINE)
+    section_headings = outline.section_titles
 
     for required in REQUIRED_SECTIONS:
         if required not in section_headings:
@@ -322,19 +410,20 @@ def check_dp6_mandatory_sections(body: str, result: ValidationResult) -> None:
                 break
 
 
-def check_dp6_late_section_order(body: str, result: ValidationResult) -> None:
+def check_dp6_late_section_order(outline: SkillOutline, result: ValidationResult) -> None:
     """
     DP6 (extended): Late section order.
     When present, these sections must appear in order: Dependencies → Human-in-the-Loop → Example Usage.
+    Sections are ``##`` headings as in check_dp6_mandatory_sections.
     """
-    section_headings = re.findall(r"^## ([^\n#]+)", body, re.MULTILINE)
+    section_headings = outline.section_titles
 
     # Build (order_index, position) for each present late section
     indices = []
     for i, heading in enumerate(section_headings):
         heading_stripped = heading.strip()
         for section_key, pattern in LATE_SECTION_PATTERNS.items():
-            if re.search(pattern, heading_stripped, re.IGNORECASE):
+            if pattern.search(heading_stripped):
                 order_idx = LATE_ORDERED_SECTIONS.index(section_key)
                 indices.append((order_idx, i, section_key))
                 break
@@ -354,40 +443,31 @@ def check_dp6_late_section_order(body: str, result: ValidationResult) -> None:
             break
 
 
-def check_dp7_credential_exposure(body: str, result: ValidationResult) -> None:
+def check_dp7_credential_exposure(outline: SkillOutline, result: ValidationResult) -> None:
     """
     DP7: MCP Server Availability Verification - no credential exposure.
     Flag echo $VAR unless it's in an anti-pattern example (WRONG, NEVER, ❌).
     """
-    lines = body.split("\n")
-    in_code_block = False
-    code_block_context = ""
-
-    for i, line in enumerate(lines):
-        if line.strip().startswith("```"):
-            in_code_block = not in_code_block
-            if in_code_block:
-                code_block_context = ""
+    reported: set[int] = set()
+    for match in CREDENTIAL_EXPOSURE_PATTERN.finditer(outline.body):
+        if "\n" in match.group():
             continue
-
-        if in_code_block:
-            code_block_context += line + "\n"
-        else:
-            code_block_context = line
-
-        match = CREDENTIAL_EXPOSURE_PATTERN.search(line)
-        if match:
-            # Check if this is in a "wrong example" context
-            context_before = "\n".join(lines[max(0, i - 10) : i]).lower()
-            is_anti_pattern = any(
-                marker.lower() in context_before for marker in ANTI_PATTERN_MARKERS
+        line = outline.line_of(match.start())
+        if line in reported:
+            continue
+        reported.add(line)
+        # Check if this is in a "wrong example" context (the 10 lines above)
+        context_start = outline.line_starts[max(0, line - 11)]
+        context_before = outline.body[context_start:outline.line_starts[line - 1]].lower()
+        is_anti_pattern = any(
+            marker.lower() in context_before for marker in ANTI_PATTERN_MARKERS
+        )
+        if not is_anti_pattern:
+            result.errors.append(
+                f"DP7: Potential credential exposure at line {line}: "
+                f"'{match.group().strip()}'. "
+                "Never echo env vars; use 'test -n \"$VAR\"' or report presence/absence only."
             )
-            if not is_anti_pattern:
-                result.errors.append(
-                    f"DP7: Potential credential exposure at line {i + 1}: "
-                    f"'{match.group().strip()}'. "
-                    "Never echo env vars; use 'test -n \"$VAR\"' or report presence/absence only."
-                )
 
 
 def check_frontmatter_fields(
@@ -425,27 +505,83 @@ def validate_skill(skill_path: Path) -> ValidationResult:
 
     try:
         content = skill_path.read_text(encoding="utf-8")
+        meta = get_metadata(skill_path)
     except Exception as e:
         result.errors.append(f"Could not read file: {e}")
         return result
 
-    frontmatter, body = extract_frontmatter(content)
+    # Same split as extract_frontmatter(content), with the YAML parse served from the cache
+    frontmatter, body = meta.frontmatter, content[meta.body_offset:]
+
+    outline = build_outline(body, meta.outline, content.count("\n", 0, meta.body_offset))
 
     check_frontmatter_fields(frontmatter, result)
-    check_dp1_document_consultation(body, result)
-    check_dp2_parameter_order(body, result)
+    check_dp1_document_consultation(outline, result)
+    check_dp2_parameter_order(outline, result)
     check_dp3_conciseness(frontmatter, result)
-    check_dp4_dependencies(body, result)
+    check_dp4_dependencies(outline, result)
     check_dp5_human_in_loop(
-        frontmatter.get("name", "") if frontmatter else "", body, result
+        frontmatter.get("name", "") if frontmatter else "", outline, result
     )
-    check_dp6_mandatory_sections(body, result)
-    check_dp6_late_section_order(body, result)
-    check_dp7_credential_exposure(body, result)
+    check_dp6_mandatory_sections(outline, result)
+    check_dp6_late_section_order(outline, result)
+    check_dp7_credential_exposure(outline, result)
 
     return result
 
 
+def validate_skills(skill_files: list[Path], jobs: int | None = None) -> list[ValidationResult]:
+    """
+    Validate skills, in a process pool for large sets; results follow ``skill_files`` order.
+
+    Args:
+        skill_files: SKILL.md paths
+        jobs: Worker processes (None = CPU count, 1 = serial)
+    """
+    workers = jobs if jobs is not None else (os.cpu_count() or 1)
+    parallel = workers > 1 and len(skill_files) > 1 and (
+        jobs is not None or len(skill_files) >= PARALLEL_MIN_SKILLS
+    )
+    if not parallel:
+        return [validate_skill(path) for path in skill_files]
+    with ProcessPoolExecutor(max_workers=min(workers, len(skill_files))) as pool:
+        return list(pool.map(validate_skill, skill_files, chunksize=SKILLS_PER_TASK))
+
+
+def _display_path(path: Path) -> Path:
+    return path.relative_to(Path.cwd()) if path.is_relative_to(Path.cwd()) else path
+
+
+def json_report(
+    results: list[ValidationResult],
+    layout_errors: list[tuple[Path, str]],
+    warnings_as_errors: bool,
+) -> dict:
+    """Machine-readable report for --format json (same pass/fail decision as the text output)."""
+    skills = []
+    for r in results:
+        status = "fail" if r.errors else ("warn" if r.warnings else "pass")
+        skills.append({
+            "path": str(_display_path(r.path)),
+            "status": status,
+            "errors": r.errors,
+            "warnings": r.warnings,
+        })
+    error_count = len(layout_errors) + sum(len(r.errors) for r in results)
+    warning_count = sum(len(r.warnings) for r in results)
+    return {
+        "skills": skills,
+        "layout_errors": [{"path": str(_display_path(p)), "error": e} for p, e in layout_errors],
+        "summary": {
+            "skills": len(results),
+            "failed": sum(1 for r in results if r.errors),
+            "errors": error_count,
+            "warnings": warning_count,
+            "passed": error_count == 0 and not (warnings_as_errors and warning_count),
+        },
+    }
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -462,7 +598,21 @@ def main() -> int:
         action="store_true",
         help="Treat warnings as errors",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help=f"Worker processes (default: auto, parallel only for {PARALLEL_MIN_SKILLS}+ skills; 1 = serial)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format (json: one machine-readable report on stdout)",
+    )
+    add_changed_arguments(parser)
     args = parser.parse_args()
+    changes = change_set_from_args(args, __file__)
 
     # Resolve paths to skill files
     skill_files: list[Path] = []
@@ -493,6 +643,10 @@ def main() -> int:
         if sf.parent.parent.name == "skills":
             pack_dirs.add(sf.parent.parent.parent)
 
+    if changes is not None:
+        skill_files = changes.filter_skill_files(sorted(set(skill_files)))
+        pack_dirs = {p for p in pack_dirs if changes.affects_path(p)}
+
     # DP0: Pack layout (Lola format)
     for pack_dir in sorted(pack_dirs):
         if pack_dir.exists():
@@ -500,6 +654,12 @@ def main() -> int:
             for err in layout_errors:
                 all_errors.append((pack_dir, err))
 
+    if args.format == "json":
+        results = validate_skills(sorted(skill_files), args.jobs)
+        report = json_report(results, all_errors, args.warnings_as_errors)
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return 0 if report["summary"]["passed"] else 1
+
     if not skill_files:
         if all_errors:
             print("❌ Pack layout validation failed:")
@@ -512,9 +672,9 @@ def main() -> int:
     print("🔍 Validating skills against Design Principles...")
     print()
 
-    for skill_path in sorted(skill_files):
-        result = validate_skill(skill_path)
-        rel_path = skill_path.relative_to(Path.cwd()) if skill_path.is_relative_to(Path.cwd()) else skill_path
+    for result in validate_skills(sorted(skill_files), args.jobs):
+        skill_path = result.path
+        rel_path = _display_path(skill_path)
 
         if result.errors:
             print(f"  {rel_path}: ❌")
@@ -537,7 +697,7 @@ def main() -> int:
         print()
         print("Pack layout (Lola format):")
         for path, err in layout_errs:
-            rel = path.relative_to(Path.cwd()) if path.is_relative_to(Path.cwd()) else path
+            rel = _display_path(path)
             print(f"  {rel}: ❌ {err}")
         print()
 
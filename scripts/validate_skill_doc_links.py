@@ -13,13 +13,14 @@ from __future__ import annotations
 
 import argparse
 import json
-import os
-import re
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable
 
+from change_set import add_changed_arguments, change_set_from_args
+from md_link_graph import LinkGraph, is_external
+
 DEFAULT_PACKS = [
     "rh-sre",
     "rh-developer",
@@ -29,8 +30,6 @@ DEFAULT_PACKS = [
     "rh-automation",
 ]
 
-MD_LINK_RE = re.compile(r"\[[^\]]+\]\(([^)]+)\)")
-
 
 @dataclass
 class ValidationResult:
@@ -59,85 +58,69 @@ def iter_skill_files(paths: Iterable[str]) -> list[Path]:
     return dedup
 
 
-def is_external_link(target: str) -> bool:
-    lower = target.lower()
-    return (
-        lower.startswith("http://")
-        or lower.startswith("https://")
-        or lower.startswith("mailto:")
-        or lower.startswith("#")
-    )
-
-
-def validate_skill_file(skill_file: Path, result: ValidationResult) -> None:
+def validate_skill_file(
+    skill_file: Path, result: ValidationResult, graph: LinkGraph | None = None
+) -> None:
+    graph = graph if graph is not None else LinkGraph()
     skill_dir = skill_file.parent
     pack_root = skill_file.parent.parent.parent.resolve()
-    text = skill_file.read_text(encoding="utf-8")
 
-    for line_no, line in enumerate(text.splitlines(), start=1):
-        for m in MD_LINK_RE.finditer(line):
-            result.scanned_links += 1
-            raw_target = m.group(1).strip()
-            if is_external_link(raw_target):
-                continue
+    for line_no, link_target in graph.links(skill_file):
+        result.scanned_links += 1
+        raw_target = link_target.strip()
+        if is_external(raw_target):
+            continue
 
-            target = raw_target.split("#", 1)[0].strip()
-            if ".md" not in target or "docs/" not in target:
-                continue
+        target = raw_target.split("#", 1)[0].strip()
+        if ".md" not in target or "docs/" not in target:
+            continue
 
-            result.checked_docs_links += 1
-            normalized = target.replace("\\", "/")
+        result.checked_docs_links += 1
+        normalized = target.replace("\\", "/")
 
-            # Forbid upward traversal to docs.
-            if normalized.startswith("../") or "/../" in normalized:
-                result.errors.append(
-                    f"{skill_file}:{line_no}: forbidden upward docs path '{raw_target}'"
-                )
+        # Forbid upward traversal to docs.
+        if normalized.startswith("../") or "/../" in normalized:
+            result.errors.append(
+                f"{skill_file}:{line_no}: forbidden upward docs path '{raw_target}'"
+            )
 
-            # Enforce skill-local docs path.
-            if not normalized.startswith("docs/"):
-                result.errors.append(
-                    f"{skill_file}:{line_no}: docs link must be skill-local 'docs/...', got '{raw_target}'"
-                )
-                continue
+        # Enforce skill-local docs path.
+        if not normalized.startswith("docs/"):
+            result.errors.append(
+                f"{skill_file}:{line_no}: docs link must be skill-local 'docs/...', got '{raw_target}'"
+            )
+            continue
 
-            link_path = skill_dir / normalized
-            try:
-                resolved = link_path.resolve(strict=True)
-            except FileNotFoundError:
-                result.errors.append(
-                    f"{skill_file}:{line_no}: missing linked doc '{raw_target}'"
-                )
-                continue
-            except RuntimeError:
-                result.errors.append(
-                    f"{skill_file}:{line_no}: symlink loop for '{raw_target}'"
-                )
-                continue
+        link_path = skill_dir / normalized
+        resolution = graph.resolve(link_path)
+        if resolution.error == "missing":
+            result.errors.append(
+                f"{skill_file}:{line_no}: missing linked doc '{raw_target}'"
+            )
+            continue
+        if resolution.error == "loop":
+            result.errors.append(
+                f"{skill_file}:{line_no}: symlink loop for '{raw_target}'"
+            )
+            continue
+
+        resolved = resolution.resolved
+        try:
+            resolved.relative_to(pack_root)
+        except ValueError:
+            result.errors.append(
+                f"{skill_file}:{line_no}: linked doc escapes pack root '{raw_target}' -> '{resolved}'"
+            )
+
+        if resolution.symlink_chain:
+            result.errors.append(
+                f"{skill_file}:{line_no}: symlink chain detected for '{raw_target}'"
+            )
 
-            try:
-                resolved.relative_to(pack_root)
-            except ValueError:
-                result.errors.append(
-                    f"{skill_file}:{line_no}: linked doc escapes pack root '{raw_target}' -> '{resolved}'"
-                )
-
-            if link_path.is_symlink():
-                raw_link = os.readlink(link_path)
-                immediate = (
-                    link_path.parent / raw_link
-                    if not os.path.isabs(raw_link)
-                    else Path(raw_link)
-                )
-                if immediate.is_symlink():
-                    result.errors.append(
-                        f"{skill_file}:{line_no}: symlink chain detected for '{raw_target}'"
-                    )
-
-            if link_path.is_symlink() and not link_path.exists():
-                result.errors.append(
-                    f"{skill_file}:{line_no}: dangling symlink '{raw_target}'"
-                )
+        if resolution.dangling:
+            result.errors.append(
+                f"{skill_file}:{line_no}: dangling symlink '{raw_target}'"
+            )
 
 
 def main() -> int:
@@ -154,9 +137,13 @@ def main() -> int:
         "--json-out",
         help="Optional path to write machine-readable summary JSON",
     )
+    add_changed_arguments(parser)
     args = parser.parse_args()
+    changes = change_set_from_args(args, __file__)
 
     skill_files = iter_skill_files(args.paths)
+    if changes is not None:
+        skill_files = changes.filter_skill_files(skill_files)
     result = ValidationResult(scanned_files=len(skill_files))
 
     if not skill_files:
@@ -164,8 +151,9 @@ def main() -> int:
         return 0
 
     print("🔍 Validating skill docs links...")
+    graph = LinkGraph()
     for sf in skill_files:
-        validate_skill_file(sf, result)
+        validate_skill_file(sf, result, graph)
 
     summary = {
         "scanned_files": result.scanned_files,
@@ -6,6 +6,7 @@ Skill-level validation (frontmatter, sections, security) is handled by
 validate-skills.sh and run-skill-linter.sh.
 """
 
+import argparse
 import json
 import sys
 from pathlib import Path
@@ -13,6 +14,7 @@ from typing import List
 import re
 
 import pack_registry
+from change_set import add_changed_arguments, change_set_from_args
 
 # Union of Lola marketplace paths and docs/plugins.json keys (existing dirs only)
 PACK_DIRS = pack_registry.get_union_pack_dirs()
@@ -193,12 +195,18 @@ def main():
     """
     Main validation function.
     """
+    parser = argparse.ArgumentParser(description="Validate agentic collection pack structure")
+    add_changed_arguments(parser)
+    args = parser.parse_args()
+    changes = change_set_from_args(args, __file__)
+    pack_dirs = PACK_DIRS if changes is None else changes.filter_packs(PACK_DIRS)
+
     print("🔍 Validating agentic collection structure...")
     print()
 
     all_errors = []
 
-    for pack_dir in PACK_DIRS:
+    for pack_dir in pack_dirs:
         print(f"Validating {pack_dir}...", end=' ')
         errors = validate_pack(pack_dir)
 
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Watch pack sources and rebuild the docs site incrementally (make watch).
+
+Polls file stats under the site pack directories, eval/, federation/modules/ and
+the global build inputs (docs/plugins.json, docs/icons.json, docs/mcp.json, the
+marketplace registry and generator scripts). Each batch of changes is mapped to
+the packs it affects and build_website() runs with only those packs re-checked,
+so an edit to one SKILL.md or .catalog fragment re-renders that pack's entry and
+collection page only. Global inputs trigger a normal incremental build.
+
+Stdlib only (stat polling, no inotify dependency); optionally serves docs/ too:
+
+    uv run python scripts/watch_website.py --serve 8000
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import os
+import sys
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import pack_registry
+from build_website import build_website
+from collection_validate_lib import clear_catalog_cache
+from md_frontmatter import clear_cache as clear_frontmatter_cache
+from generate_pack_data import DOCS_PACK_DIRS
+from site_build_cache import GLOBAL_INPUTS, REPO_ROOT, iter_tree_files
+
+POLL_INTERVAL = 0.3
+# Wait until the tree has been quiet this long before rebuilding (editors save in bursts).
+SETTLE_SECONDS = 0.2
+REBUILD_BUDGET_SECONDS = 1.0
+
+EXTRA_GLOBAL_INPUTS = ["docs/mcp.json"]
+
+Snapshot = Dict[str, Tuple[int, int]]
+
+
+def federated_pack_names() -> List[str]:
+    return [m.get("name", "unknown") for m in pack_registry.load_federated_modules()]
+
+
+def watched_files(root: Path = REPO_ROOT) -> List[Path]:
+    files: List[Path] = []
+    for pack_dir in DOCS_PACK_DIRS:
+        files.extend(iter_tree_files(root / pack_dir))
+    files.extend(iter_tree_files(root / "eval"))
+    files.extend(iter_tree_files(root / "federation" / "modules"))
+    files.extend(root / rel for rel in GLOBAL_INPUTS + EXTRA_GLOBAL_INPUTS)
+    return files
+
+
+def snapshot(files: Iterable[Path], root: Path = REPO_ROOT) -> Snapshot:
+    """rel path -> (mtime_ns, size) for every file that currently exists."""
+    snap: Snapshot = {}
+    for path in files:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        snap[path.relative_to(root).as_posix()] = (st.st_mtime_ns, st.st_size)
+    return snap
+
+
+def changed_paths(old: Snapshot, new: Snapshot) -> Set[str]:
+    """Paths added, removed or modified between two snapshots."""
+    return {p for p in old.keys() | new.keys() if old.get(p) != new.get(p)}
+
+
+def affected_packs(paths: Iterable[str], federated: Iterable[str] = ()) -> Optional[Set[str]]:
+    """
+    Map changed repo-relative paths to pack names.
+
+    Returns None when a global input changed (every pack may be affected); an
+    empty set means only non-pack outputs (MCP data, search index) need refreshing.
+    """
+    local = set(DOCS_PACK_DIRS)
+    federated = set(federated)
+    global_inputs = set(GLOBAL_INPUTS)
+    packs: Set[str] = set()
+    for path in paths:
+        if path in global_inputs:
+            return None
+        parts = path.split("/")
+        if parts[0] in local:
+            packs.add(parts[0])
+        elif parts[0] == "eval" and len(parts) > 1 and (parts[1] in local or parts[1] in federated):
+            packs.add(parts[1])
+        elif parts[:2] == ["federation", "modules"] and len(parts) > 2 and parts[2] in federated:
+            packs.add(parts[2])
+    return packs
+
+
+def serve_docs(port: int, root: Path = REPO_ROOT) -> ThreadingHTTPServer:
+    """Serve docs/ on *port* from a background thread (same as make serve)."""
+    handler = functools.partial(SimpleHTTPRequestHandler, directory=str(root / "docs"))
+    server = ThreadingHTTPServer(("", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"🌐 Serving docs/ on http://localhost:{port}")
+    return server
+
+
+def rebuild(paths: Set[str], sharded: bool, jobs: Optional[int]) -> float:
+    only = affected_packs(paths, federated_pack_names())
+    shown = ", ".join(sorted(paths)[:5]) + (f" (+{len(paths) - 5} more)" if len(paths) > 5 else "")
+    scope = "all packs" if only is None else (", ".join(sorted(only)) or "no packs")
+    print(f"🔁 Changed: {shown} → rebuilding {scope}")
+    # Memoized catalog and frontmatter reads are keyed by mtime; drop superseded entries between rebuilds
+    clear_catalog_cache()
+    clear_frontmatter_cache()
+    start = time.perf_counter()
+    build_website(jobs=jobs, sharded=sharded, only=only)
+    return time.perf_counter() - start
+
+
+def watch(interval: float, sharded: bool, jobs: Optional[int]) -> None:
+    files = watched_files()
+    snap = snapshot(files)
+    print(f"👀 Watching {len(snap)} files (Ctrl+C to stop)")
+    while True:
+        time.sleep(interval)
+        files = watched_files()
+        new_snap = snapshot(files)
+        paths = changed_paths(snap, new_snap)
+        if not paths:
+            continue
+        # Let a burst of saves settle so one edit triggers one rebuild.
+        while True:
+            time.sleep(SETTLE_SECONDS)
+            settled = snapshot(watched_files())
+            more = changed_paths(new_snap, settled)
+            new_snap = settled
+            if not more:
+                break
+            paths |= more
+        snap = new_snap
+        try:
+            elapsed = rebuild(paths, sharded, jobs)
+        except Exception as e:  # keep watching; the next save may fix it
+            print(f"❌ Rebuild failed: {e}")
+            continue
+        note = "" if elapsed <= REBUILD_BUDGET_SECONDS else f" (over the {REBUILD_BUDGET_SECONDS:.0f}s budget)"
+        print(f"⏱️  Rebuilt in {elapsed * 1000:.0f} ms{note}")
+        print()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rebuild docs/ incrementally when pack sources change")
+    parser.add_argument("--serve", type=int, metavar="PORT", help="Also serve docs/ on this port")
+    parser.add_argument("--interval", type=float, default=POLL_INTERVAL, help="Poll interval in seconds")
+    parser.add_argument("--sharded", action="store_true", help="Also write docs/data/ shards (see build_website.py)")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (see build_website.py)")
+    args = parser.parse_args()
+
+    os.chdir(REPO_ROOT)
+    build_website(jobs=args.jobs, sharded=args.sharded)
+    server = serve_docs(args.serve) if args.serve else None
+    try:
+        watch(args.interval, args.sharded, args.jobs)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        if server is not None:
+            server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())